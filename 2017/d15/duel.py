@@ -1,5 +1,7 @@
 #!/usr/bin/env python3
 
+from checkpoint import get_checkpoint
+
 
 def get_input(path):
     with open(path) as infile:
@@ -12,63 +14,51 @@ def get_input(path):
 
 a_mult = 16807
 b_mult = 48271
+divisor = 2147483647
 
 
-def generator_x(mult, divisor, x):
-    def generator(x):
-        while True:
-            x_product = mult * x
-            x = x_product % divisor
-            yield x
-    return generator(x)
-
-
-def generator_a(a):
-    return generator_x(16807, 2147483647, a)
-
-
-def generator_b(b):
-    while True:
-        b_product = b_mult * b
-        b = b_product % 2147483647
-        yield b
-
-
-def generator_x2(gen, divisor):
-    def generator():
-        while True:
-            x = next(gen)
-            if x % divisor == 0:
-                yield x
-    return generator()
+def count_matching_pairs(a, b, num_duels, a_multiple=1, b_multiple=1,
+                         checkpoint=None, every=1000000):
+    # every is in pairs compared
+    count = 0
+    first = 0
 
+    if checkpoint is not None:
+        state = checkpoint.resume()
+        if state is not None:
+            a, b, count, first = state[0]["duel"]
 
-def generator_a2(a):
-    return generator_x2(generator_a(a), 4)
+    for start in range(first, num_duels, every):
+        end = min(start + every, num_duels)
 
+        for n in range(start, end):
+            # Only values which are multiples of a_multiple/b_multiple count
+            a = a * a_mult % divisor
+            while a % a_multiple:
+                a = a * a_mult % divisor
+            b = b * b_mult % divisor
+            while b % b_multiple:
+                b = b * b_mult % divisor
 
-def generator_b2(b):
-    return generator_x2(generator_b(b), 8)
+            if a & 0xffff == b & 0xffff:
+                count += 1
 
+        if checkpoint is not None:
+            checkpoint.update(end, num_duels, lambda: (
+                {"duel": [a, b, count, end]}, {}
+            ))
 
-def count_matching_pairs(gen_a, gen_b, num_duels):
-    count = 0
-
-    for n in range(num_duels):
-        a = next(gen_a)
-        b = next(gen_b)
-        if '{:032b}'.format(a)[-16:] == '{:032b}'.format(b)[-16:]:
-            count += 1
+    if checkpoint is not None:
+        checkpoint.clear()
 
     return count
 
 
 if __name__ == '__main__':
     a, b = get_input("input.txt")
-    gen_a = generator_a(a)
-    gen_b = generator_b(b)
-    print(count_matching_pairs(gen_a, gen_b, 40000000))
-
-    gen_a = generator_a2(a)
-    gen_b = generator_b2(b)
-    print(count_matching_pairs(gen_a, gen_b, 5000000))
+    print(count_matching_pairs(
+        a, b, 40000000, checkpoint=get_checkpoint("d15.part1", [a, b])
+    ))
+    print(count_matching_pairs(
+        a, b, 5000000, 4, 8, checkpoint=get_checkpoint("d15.part2", [a, b])
+    ))
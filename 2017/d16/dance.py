@@ -2,6 +2,8 @@
 
 import string
 
+from cycles import fast_forward
+
 
 def get_input(path):
     with open(path) as infile:
@@ -15,7 +17,6 @@ class Dancer:
             raise Exception
 
         self._programs = list(string.ascii_lowercase[:num_programs])
-        self._starting_programs = list(string.ascii_lowercase[:num_programs])
         self._moves = text.split(",")
 
     def get_swaps(self, move):
@@ -50,14 +51,15 @@ class Dancer:
         for move in self._moves:
             self.move(move)
 
+    def dance_from(self, programs):
+        self._programs = list(programs)
+        self.dance()
+        return tuple(self._programs)
+
     def multi_dance(self, num_times):
-        n = 0
-        while n < num_times:
-            n += 1
-            self.dance()
-            if self._programs == self._starting_programs:
-                mult = int(num_times // n)
-                n *= mult
+        self._programs = list(fast_forward(
+            tuple(self._programs), self.dance_from, num_times
+        ))
 
     @property
     def programs(self):
@@ -1,7 +1,10 @@
 #!/usr/bin/env python3
 
+from array import array
 from collections import defaultdict
 
+from checkpoint import get_checkpoint
+
 
 def get_input(path):
     with open(path) as infile:
@@ -17,7 +20,7 @@ class Blueprint:
 
         self.state = lines[0].split()[-1].strip('.')
 
-        self.steps = int(lines[1].split()[-2])
+        self.steps = self.total_steps = int(lines[1].split()[-2])
         if self.steps < 0:
             raise Exception
 
@@ -39,19 +42,53 @@ class Blueprint:
     def count_ones(self):
         return sum(self.tape.values())
 
-    def run(self):
+    def run(self, checkpoint=None, every=100000):
+        # every is in steps of the machine
+        if checkpoint is not None:
+            state = checkpoint.resume()
+            if state is not None:
+                self.set_machine_state(*state)
+
         while self.steps > 0:
-            rule = self.rules[self.state]
-            self.apply_rule(rule)
-            self.steps -= 1
-            if self.steps % 100000 == 0:
-                print("Remaining:", self.steps, self.count_ones())
-                # if self.steps % 300000 == 0:
-            # if 12034000 < self.steps < 12034040:
-            #     print(self.steps, self.count_ones())
-            #     print(self.debug_print())
-            # if self.count_ones() == 0:
-            #     print(self.steps, 0)
+            steps = min(every, self.steps)
+            for _ in range(steps):
+                rule = self.rules[self.state]
+                self.apply_rule(rule)
+            self.steps -= steps
+
+            if checkpoint is not None:
+                checkpoint.update(self.total_steps - self.steps,
+                                  self.total_steps, self.get_machine_state)
+
+        if checkpoint is not None:
+            checkpoint.clear()
+
+    def get_machine_state(self):
+        # The tape's saved as one byte per slot from the leftmost slot
+        # visited to the rightmost
+        start = min(self.tape, default=self.pos)
+        end = max(self.tape, default=self.pos)
+        tape = array('B', bytes(end - start + 1))
+        for pos, value in self.tape.items():
+            tape[pos - start] = value
+
+        values = {
+            "state": self.state,
+            "pos": self.pos,
+            "steps": self.steps,
+            "start": start,
+        }
+        return values, {"tape": tape}
+
+    def set_machine_state(self, values, arrays):
+        self.state = values["state"]
+        self.pos = values["pos"]
+        self.steps = values["steps"]
+        start = values["start"]
+        self.tape = defaultdict(int, (
+            (start + n, value) for n, value in enumerate(arrays["tape"])
+            if value
+        ))
 
     def apply_rule(self, rule):
         n = self.read()
@@ -100,9 +137,10 @@ class Blueprint:
 
 
 if __name__ == '__main__':
-    blueprint = Blueprint(get_input('input.txt'))
+    lines = get_input('input.txt')
+    blueprint = Blueprint(lines)
     print(blueprint.state)
     print(blueprint.steps)
     print(blueprint.debug_print())
-    blueprint.run()
+    blueprint.run(get_checkpoint('d25', lines))
     print(blueprint.count_ones())
@@ -1,5 +1,8 @@
 #!/usr/bin/env python3
 
+from cycles import find_cycle
+
+
 def import_input(path):
     with open(path, encoding='utf-8') as infile:
         return [int(n) for n in infile.read().split()]
@@ -26,32 +29,20 @@ class Redistributor:
     def find_biggest_bank(self):
         return self._banks.index(max(self._banks))
 
-    def solve(self):
-        count = 0
-
-        records = []
-
-        while self._banks not in records:
-            records.append(self._banks.copy())
+    def step(self, banks):
+        self._banks = list(banks)
+        self.redistribute(self.find_biggest_bank())
+        return tuple(self._banks)
 
-            i = self.find_biggest_bank()
-            self.redistribute(i)
-            count += 1
-
-        return count
+    def solve(self):
+        # Redistributions until a configuration is seen again
+        cycle = find_cycle(tuple(self._banks), self.step)
+        return cycle.start + cycle.length
 
     def solve2(self):
-        count = 0
-        target = self._banks.copy()
-        current = None
-
-        while current != target:
-            i = self.find_biggest_bank()
-            self.redistribute(i)
-            count += 1
-            current = self._banks.copy()
-
-        return count
+        # Redistributions until the configuration comes round again, which
+        # after solve() is the length of the loop it found
+        return find_cycle(tuple(self._banks), self.step).length
 
 r = Redistributor(banks)
 print(r.solve())
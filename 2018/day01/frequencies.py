@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# For delta files far too big to read into a list of ints: the file is read a
+# chunk at a time through a memory map, each chunk becoming an int64 array, so
+# summing them only ever holds one chunk. Part 2 needs the frequency after
+# every delta of the first pass, which is kept as a single int64 array (8
+# bytes each rather than a Python int's 28 plus a list slot) and searched with
+# whole-array operations.
+
+from shared.optional import numpy, require_numpy
+from shared.utils import MappedInput
+
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+def iter_delta_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    # The deltas in the file, as one int64 array per chunk of chunk_size
+    # bytes (or so). numpy parses the signed integers itself, which is much
+    # quicker than int() on each.
+    require_numpy(__name__)
+
+    with MappedInput(path) as mapped:
+        for chunk in mapped.chunks(chunk_size):
+            yield numpy.array(chunk.split(), dtype=numpy.int64)
+
+
+def count_lines(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    # At most, as the last line may or may not end with a line break
+    with MappedInput(path) as mapped:
+        newlines = sum(chunk.count(b"\n")
+                       for chunk in mapped.chunks(chunk_size))
+
+    return newlines + 1
+
+
+def sum_deltas(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    return sum(int(chunk.sum())
+               for chunk in iter_delta_chunks(path, chunk_size))
+
+
+def get_frequencies(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    # The frequency before each delta of the first pass (starting with 0),
+    # and the drift over the whole pass
+    require_numpy(__name__)
+
+    # One delta per line at most, and any slots left over (eg. for a blank
+    # last line) are left off the end
+    frequencies = numpy.empty(count_lines(path, chunk_size),
+                              dtype=numpy.int64)
+    count = 0
+    drift = 0
+
+    for chunk in iter_delta_chunks(path, chunk_size):
+        if not len(chunk):
+            continue
+
+        sums = numpy.cumsum(chunk)
+        frequencies[count] = drift
+        frequencies[count + 1:count + len(chunk)] = sums[:-1] + drift
+        count += len(chunk)
+        drift += int(sums[-1])
+
+    return frequencies[:count], drift
+
+
+def find_first_repeat_in_pass(frequencies):
+    # The index of the first frequency seen before in frequencies, or None.
+    # A stable sort keeps equal frequencies in the order they're reached, so
+    # the first repeat is the earliest second place of any run of them.
+    order = numpy.argsort(frequencies, kind="stable")
+    ordered = frequencies[order]
+    repeats = order[1:][ordered[1:] == ordered[:-1]]
+
+    return int(repeats.min()) if len(repeats) else None
+
+
+def find_first_repeat(frequencies, drift):
+    # As solution2.find_first_repeat, given the frequencies of the first
+    # pass and its drift (which mustn't be 0)
+    repeat = find_first_repeat_in_pass(frequencies)
+    if repeat is not None:
+        return int(frequencies[repeat])
+
+    direction = 1 if drift > 0 else -1
+    drift *= direction
+    values = frequencies if direction == 1 else -frequencies
+    remainders = values % drift
+
+    # By remainder, then frequency
+    order = numpy.lexsort((values, remainders))
+    same = remainders[order[1:]] == remainders[order[:-1]]
+    lows = order[:-1][same]
+    highs = order[1:][same]
+
+    if not len(lows):
+        raise ValueError("No frequency is ever reached twice")
+
+    # The frequency at index low gets to the one at high after passes
+    # passes; whichever gets there first, by pass and then by index
+    passes = (values[highs] - values[lows]) // drift
+    first = numpy.lexsort((lows, passes))[0]
+
+    return int(frequencies[highs[first]])
+
+
+def first_repeat_in_file(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    require_numpy(__name__)
+    frequencies, drift = get_frequencies(path, chunk_size)
+
+    if drift == 0:
+        # Back to the start after one pass, if not before
+        repeat = find_first_repeat_in_pass(frequencies)
+        return 0 if repeat is None else int(frequencies[repeat])
+
+    return find_first_repeat(frequencies, drift)
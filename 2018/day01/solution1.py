@@ -13,6 +13,14 @@ def solve(input_text):
     return sum(instructions)
 
 
+def solve_file(path):
+    # As solve(), streaming the file a chunk at a time (needs numpy, so it's
+    # only imported here rather than slowing down every solve())
+    from .frequencies import sum_deltas
+
+    return sum_deltas(path)
+
+
 if __name__ == '__main__':
     from shared.utils import get_input
     from timeit import default_timer as timer
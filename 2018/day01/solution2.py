@@ -6,8 +6,7 @@ from pathlib import Path
 from .solution1 import parse_input
 
 
-def solve(input_text):
-    instructions = parse_input(input_text)
+def loop_until_repeat(instructions):
     frequencies = set([0])
 
     freq = 0
@@ -21,6 +20,67 @@ def solve(input_text):
             frequencies.add(freq)
 
 
+def find_first_repeat(instructions):
+    # Each pass through the instructions shifts every frequency in it by the
+    # same drift: i instructions into the kth pass after the first, the
+    # frequency is k * drift more than i instructions into the first. So a
+    # later pass can only repeat a frequency from the first with the same
+    # remainder mod drift, and of those the nearest in the direction of the
+    # drift is reached first. O(n log n) however many passes it'd take.
+
+    # Any repeat within the first pass comes before the rest
+    frequencies = []
+    seen = set()
+    freq = 0
+    for delta in instructions:
+        if freq in seen:
+            return freq
+        seen.add(freq)
+        frequencies.append(freq)
+        freq += delta
+    drift = freq
+
+    if drift == 0:
+        # Back to the start after one pass
+        return loop_until_repeat(instructions)
+
+    # Make the drift positive, so each frequency moves up to the next
+    # largest one with the same remainder
+    direction = 1 if drift > 0 else -1
+    drift *= direction
+    ordered = sorted(
+        (freq * direction % drift, freq * direction, n)
+        for n, freq in enumerate(frequencies)
+    )
+
+    first = None
+    for (remainder, low, n), (next_remainder, high, _) in zip(ordered,
+                                                              ordered[1:]):
+        if remainder == next_remainder:
+            # The index of the instruction reaching high from low
+            index = (high - low) // drift * len(frequencies) + n
+            if first is None or index < first[0]:
+                first = (index, high)
+
+    if first is None:
+        raise ValueError("No frequency is ever reached twice")
+
+    return first[1] * direction
+
+
+def solve(input_text):
+    instructions = parse_input(input_text)
+    return find_first_repeat(instructions)
+
+
+def solve_file(path):
+    # As solve(), reading the file a chunk at a time and keeping the
+    # frequencies as an int64 array (needs numpy, so it's only imported here)
+    from .frequencies import first_repeat_in_file
+
+    return first_repeat_in_file(path)
+
+
 if __name__ == '__main__':
     from shared.utils import get_input
     from timeit import default_timer as timer
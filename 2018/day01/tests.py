@@ -2,10 +2,12 @@
 # -*- coding: utf-8 -*-
 
 from pathlib import Path
+import random
 import unittest
 
+from shared.testing import InputFileTestCase
 from shared.utils import get_input
-from . import solution1, solution2
+from . import frequencies, solution1, solution2
 
 
 SOLUTION_DIR = Path(__file__).parent
@@ -91,6 +93,75 @@ class TestSolution2(TestSolution):
         solution = self.module.solve(input_text)
         self.assertEqual(14, solution)
 
+    def test_find_first_repeat_matches_loop(self):
+        rng = random.Random(1)
+        cases = [
+            [1, -2, 3, 1],
+            [-6, 3, 8, 5, -6],
+            [7, 7, -2, -7, -4],
+            [-7, -7, 2, 7, 4],      # drifting down
+            [1000, -999],           # hundreds of passes
+            [3, -3],                # no drift at all
+        ]
+        cases += [[rng.randint(-20, 20) for _ in range(rng.randint(2, 10))]
+                  for _ in range(200)]
+
+        for instructions in cases:
+            try:
+                found = solution2.find_first_repeat(instructions)
+            except ValueError:
+                continue  # the loop would never finish
+            self.assertEqual(solution2.loop_until_repeat(instructions),
+                             found)
+
+    def test_find_first_repeat_never_repeating(self):
+        with self.assertRaises(ValueError):
+            solution2.find_first_repeat([1, 1])
+
+
+@unittest.skipIf(frequencies.numpy is None, "needs numpy")
+class TestFrequencies(InputFileTestCase):
+    def write_instructions(self, instructions, end="\n"):
+        self.write("\n".join("{:+d}".format(delta)
+                             for delta in instructions) + end)
+
+    def test_solve_file(self):
+        for module, inputs in ((solution1, (0, 1, 2, 3)),
+                               (solution2, (0, 4, 5, 6, 7))):
+            for n in inputs:
+                input_path = SOLUTION_DIR.joinpath(
+                    "test_input{}.txt".format(n)
+                )
+                self.assertEqual(module.solve(get_input(input_path)),
+                                 module.solve_file(input_path))
+
+    def test_matches_find_first_repeat(self):
+        rng = random.Random(2)
+
+        for _ in range(200):
+            instructions = [rng.randint(-20, 20)
+                            for _ in range(rng.randint(2, 10))]
+            try:
+                expected = solution2.find_first_repeat(instructions)
+            except ValueError:
+                expected = None
+
+            self.write_instructions(instructions, end=rng.choice(("", "\n")))
+            # Tiny chunks, so the deltas span many of them
+            for chunk_size in (1, 7, frequencies.DEFAULT_CHUNK_SIZE):
+                self.assertEqual(
+                    sum(instructions),
+                    frequencies.sum_deltas(self.path, chunk_size),
+                )
+                if expected is None:
+                    with self.assertRaises(ValueError):
+                        frequencies.first_repeat_in_file(self.path,
+                                                         chunk_size)
+                else:
+                    self.assertEqual(expected,
+                                     frequencies.first_repeat_in_file(
+                                         self.path, chunk_size))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# The part 1 checksum for millions of IDs: the IDs (all the same length) are
+# the rows of a matrix of bytes, and each row's letters are counted by a
+# single bincount over the whole matrix, with every row's letters offset into
+# a range of their own. That's done a block of rows at a time, so the counts
+# never take more than a few MiB however many IDs there are.
+
+from shared.optional import numpy, require_numpy
+
+
+BLOCK_ROWS = 1 << 16
+
+
+def to_matrix(box_ids):
+    require_numpy(__name__)
+
+    box_ids = list(box_ids)
+    length = len(box_ids[0]) if box_ids else 0
+    if any(len(box_id) != length for box_id in box_ids):
+        raise ValueError("Box IDs must all be the same length")
+
+    data = "".join(box_ids).encode("ascii")
+    return numpy.frombuffer(data, dtype=numpy.uint8).reshape(
+        len(box_ids), length
+    )
+
+
+def read_matrix(path):
+    # Straight from the file's bytes, without making a string of each line
+    require_numpy(__name__)
+
+    with open(path, "rb") as infile:
+        data = infile.read().rstrip(b"\r\n")
+    if not data:
+        return numpy.zeros((0, 0), dtype=numpy.uint8)
+
+    # Every line ends the way the first does, the last included
+    ending = b"\r\n" if b"\r\n" in data[:data.find(b"\n") + 1] else b"\n"
+    data += ending
+    width = data.index(b"\n") + 1
+    if len(data) % width:
+        raise ValueError("Box IDs must all be the same length")
+
+    # Lines of other lengths could still add up to whole rows (eg. "abc",
+    # "a" and "b" as "abc" and "a\nb"), but then some row has a line break
+    # in the middle or doesn't end with one
+    rows = numpy.frombuffer(data, dtype=numpy.uint8).reshape(-1, width)
+    box_ids = rows[:, :width - len(ending)]
+    if ((rows[:, width - len(ending):] != list(ending)).any()
+            or (box_ids == ord("\n")).any()):
+        raise ValueError("Box IDs must all be the same length")
+
+    return box_ids
+
+
+def letter_histograms(matrix):
+    # How many times each letter appears in each row, with a column per
+    # letter from the lowest in the matrix to the highest
+    require_numpy(__name__)
+
+    rows, length = matrix.shape
+    if not rows or not length:
+        return numpy.zeros((rows, 0), dtype=numpy.intp)
+
+    lowest = int(matrix.min())
+    letters = int(matrix.max()) - lowest + 1
+    offsets = numpy.arange(rows, dtype=numpy.intp)[:, None] * letters
+    indices = (matrix - lowest) + offsets
+
+    return numpy.bincount(indices.ravel(), minlength=rows * letters).reshape(
+        rows, letters
+    )
+
+
+def count_repeats(matrix, block_rows=BLOCK_ROWS):
+    # As solution1.count_repeats, for the rows of matrix
+    require_numpy(__name__)
+
+    twos = threes = 0
+
+    for start in range(0, len(matrix), block_rows):
+        counts = letter_histograms(matrix[start:start + block_rows])
+        twos += int((counts == 2).any(axis=1).sum())
+        threes += int((counts == 3).any(axis=1).sum())
+
+    return twos, threes
+
+
+def checksum_file(path):
+    twos, threes = count_repeats(read_matrix(path))
+    return twos * threes
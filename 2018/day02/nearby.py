@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Near-duplicate box IDs: every pair that differs in at most k letters, for
+# k beyond the puzzle's 1. Cut an ID into k+1 blocks and any ID at most k
+# letters away must agree with it on at least one whole block, as k letters
+# can only spoil k of them. So IDs are grouped by each block in turn and
+# only those sharing a block are compared, rather than every pair.
+
+from collections import defaultdict
+from pathlib import Path
+import sys
+
+from .solution2 import count_differences, parser
+
+
+def get_blocks(length, k):
+    # k+1 (start, end) slices covering an ID of the given length, as evenly
+    # as they'll go (some are empty if there are fewer letters than blocks)
+    bounds = [length * block // (k + 1) for block in range(k + 2)]
+    return list(zip(bounds, bounds[1:]))
+
+
+def find_pairs_within(box_ids, k):
+    # Pairs of IDs (in the order they're given, and each pair once) of the
+    # same length differing in at most k letters
+    if k < 0:
+        raise ValueError("k must be at least 0, not {}".format(k))
+
+    by_length = defaultdict(list)
+    for index, box_id in enumerate(box_ids):
+        by_length[len(box_id)].append(index)
+
+    pairs = []
+
+    for length, indices in by_length.items():
+        blocks = get_blocks(length, k)
+
+        for block, (start, end) in enumerate(blocks):
+            groups = defaultdict(list)
+            for index in indices:
+                groups[box_ids[index][start:end]].append(index)
+
+            earlier_blocks = blocks[:block]
+            for group in groups.values():
+                for n, index1 in enumerate(group):
+                    id1 = box_ids[index1]
+                    for index2 in group[n + 1:]:
+                        id2 = box_ids[index2]
+                        # A pair agreeing on an earlier block was compared
+                        # then
+                        if any(id1[first:last] == id2[first:last]
+                               for first, last in earlier_blocks):
+                            continue
+                        if count_differences(id1, id2) <= k:
+                            pairs.append((index1, index2))
+
+    return [(box_ids[index1], box_ids[index2])
+            for index1, index2 in sorted(pairs)]
+
+
+def find_near_duplicates(input_text, k):
+    return find_pairs_within(parser(input_text), k)
+
+
+if __name__ == '__main__':
+    from shared.utils import get_input
+    from timeit import default_timer as timer
+
+    start = timer()
+
+    k = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    input_path = Path(__file__).parent.joinpath("input.txt")
+    input_text = get_input(input_path)
+    for id1, id2 in find_near_duplicates(input_text, k):
+        print(id1, id2)
+
+    end = timer()
+    print()
+    print("-" * 80)
+    print("Time elapsed: {:.3f}s".format(end - start))
@@ -34,6 +34,14 @@ def solve(input_text):
     return twos * threes
 
 
+def solve_file(path):
+    # As solve(), counting letters for all the IDs at once (needs numpy, so
+    # it's only imported here rather than slowing down every solve())
+    from .histograms import checksum_file
+
+    return checksum_file(path)
+
+
 if __name__ == '__main__':
     from shared.utils import get_input
     from timeit import default_timer as timer
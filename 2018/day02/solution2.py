@@ -1,7 +1,6 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from itertools import combinations
 from pathlib import Path
 
 
@@ -11,26 +10,35 @@ def parser(input_text):
 
 def count_differences(text1, text2):
     # assume lengths agree because they do for known inputs
-        if len(text1) == 0:
-            return 0
-        else:
-            match = 0 if text1[-1] == text2[-1] else 1
-            return match + count_differences(text1[:-1], text2[:-1])
+    return sum(char1 != char2 for char1, char2 in zip(text1, text2))
 
 
 def find_off_by_one_pair(box_ids):
-    id_pairs = combinations(box_ids, 2)
-    for id1, id2 in id_pairs:
-        if count_differences(id1, id2) == 1:
-            return(id1, id2)
+    # Two IDs differ by exactly one letter when, with the letter at some
+    # position blanked out, they're the same. So one position at a time,
+    # each ID is looked up by what's left once that letter's dropped. Each
+    # of those L copies is L letters to build and hash, so that's O(n·L²),
+    # rather than the O(n²·L) of comparing every pair of IDs.
+    length = max((len(box_id) for box_id in box_ids), default=0)
+
+    for position in range(length):
+        seen = {}
+        for box_id in box_ids:
+            if position >= len(box_id):
+                continue
+            masked = box_id[:position] + box_id[position + 1:]
+            other = seen.setdefault(masked, box_id)
+            # The same ID twice isn't off by one
+            if other != box_id:
+                return other, box_id
+
+    return None
 
 
 def get_matching_letters(text1, text2):
     # assume lengths agree because they do for known inputs
-    if len(text1) == 0:
-        return ""
-    match = text1[-1] if text1[-1] == text2[-1] else ""
-    return get_matching_letters(text1[:-1], text2[:-1]) + match
+    return "".join(char1 for char1, char2 in zip(text1, text2)
+                   if char1 == char2)
 
 
 def solve(input_text):
@@ -1,11 +1,14 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+from itertools import combinations
 from pathlib import Path
+import random
 import unittest
 
+from shared.testing import InputFileTestCase
 from shared.utils import get_input
-from . import solution1, solution2
+from . import histograms, nearby, solution1, solution2
 
 
 SOLUTION_DIR = Path(__file__).parent
@@ -84,6 +87,30 @@ class TestSolution2(TestSolution):
         self.assertEqual(("fghij", "fguij"),
                          solution2.find_off_by_one_pair(self.box_ids))
 
+    def test_find_off_by_one_pair_matches_pairwise(self):
+        rng = random.Random(3)
+
+        for _ in range(200):
+            box_ids = ["".join(rng.choice("ab") for _ in range(4))
+                       for _ in range(rng.randint(0, 6))]
+            pair = solution2.find_off_by_one_pair(box_ids)
+            if pair is None:
+                self.assertFalse(any(
+                    solution2.count_differences(id1, id2) == 1
+                    for id1, id2 in combinations(box_ids, 2)
+                ))
+            else:
+                id1, id2 = pair
+                self.assertEqual(1, solution2.count_differences(id1, id2))
+                self.assertLess(box_ids.index(id1), box_ids.index(id2))
+
+    def test_long_ids(self):
+        # Far longer than the recursion limit
+        box_ids = ["x" * 5000 + "ab", "x" * 5000 + "ba", "x" * 5000 + "bb"]
+        one, two = solution2.find_off_by_one_pair(box_ids)
+        self.assertEqual(1, solution2.count_differences(one, two))
+        self.assertEqual(5001, len(solution2.get_matching_letters(one, two)))
+
     def test_get_matching_letters(self):
         self.assertEqual("", solution2.get_matching_letters(
             self.box_ids[0], self.box_ids[1]))
@@ -97,5 +124,96 @@ class TestSolution2(TestSolution):
         self.assertEqual(self.expected, solution)
 
 
+@unittest.skipIf(histograms.numpy is None, "needs numpy")
+class TestHistograms(InputFileTestCase):
+    box_ids = TestSolution1.box_ids
+
+    def test_letter_histograms(self):
+        counts = histograms.letter_histograms(
+            histograms.to_matrix(["aab", "cca"])
+        )
+        self.assertEqual([[2, 1, 0], [1, 0, 2]], counts.tolist())
+
+    def test_count_repeats_matches_counter(self):
+        rng = random.Random(5)
+
+        for _ in range(50):
+            box_ids = ["".join(rng.choice("abcdef") for _ in range(7))
+                       for _ in range(rng.randint(0, 20))]
+            expected = solution1.count_repeats(box_ids)
+            matrix = histograms.to_matrix(box_ids)
+            self.assertEqual(expected, histograms.count_repeats(matrix))
+            # Over several blocks
+            self.assertEqual(expected,
+                             histograms.count_repeats(matrix, block_rows=3))
+
+    def test_read_matrix(self):
+        for ending in (b"\n", b"\r\n"):
+            for last in (b"", ending):
+                data = ending.join(box_id.encode("ascii")
+                                   for box_id in self.box_ids) + last
+                self.write(data)
+                self.assertEqual(
+                    histograms.to_matrix(self.box_ids).tolist(),
+                    histograms.read_matrix(self.path).tolist(),
+                )
+
+    def test_unequal_lengths(self):
+        with self.assertRaises(ValueError):
+            histograms.to_matrix(["abc", "ab"])
+        for data in (b"abc\nab\n", b"ab\nabcd\n", b"abc\nabcd",
+                     b"abc\na\nb\n"):
+            self.write(data)
+            with self.assertRaises(ValueError):
+                histograms.read_matrix(self.path)
+
+    def test_solve_file(self):
+        input_path = SOLUTION_DIR.joinpath("test_input.txt")
+        self.assertEqual(solution1.solve(get_input(input_path)),
+                         solution1.solve_file(input_path))
+
+
+class TestNearby(unittest.TestCase):
+    def test_get_blocks(self):
+        self.assertEqual([(0, 2), (2, 5)], nearby.get_blocks(5, 1))
+        self.assertEqual([(0, 0), (0, 1), (1, 1), (1, 2)],
+                         nearby.get_blocks(2, 3))
+
+    def test_find_pairs_within(self):
+        box_ids = ["abcde", "abxde", "xbcdy", "zzzzz", "abcde", "abc"]
+        self.assertEqual([("abcde", "abcde")],
+                         nearby.find_pairs_within(box_ids, 0))
+        self.assertEqual(
+            [("abcde", "abxde"), ("abcde", "abcde"), ("abxde", "abcde")],
+            nearby.find_pairs_within(box_ids, 1),
+        )
+        self.assertEqual(6, len(nearby.find_pairs_within(box_ids, 3)))
+
+    def test_find_pairs_within_matches_pairwise(self):
+        rng = random.Random(4)
+
+        for _ in range(100):
+            box_ids = ["".join(rng.choice("abc")
+                               for _ in range(rng.randint(2, 6)))
+                       for _ in range(rng.randint(0, 12))]
+            for k in range(5):
+                expected = [
+                    (id1, id2) for id1, id2 in combinations(box_ids, 2)
+                    if len(id1) == len(id2)
+                    and solution2.count_differences(id1, id2) <= k
+                ]
+                self.assertEqual(expected,
+                                 nearby.find_pairs_within(box_ids, k))
+
+    def test_find_near_duplicates(self):
+        input_text = get_input(SOLUTION_DIR.joinpath("test_input2.txt"))
+        self.assertEqual([("fghij", "fguij")],
+                         nearby.find_near_duplicates(input_text, 1))
+
+    def test_negative_k(self):
+        with self.assertRaises(ValueError):
+            nearby.find_pairs_within(["abc"], -1)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -5,15 +5,13 @@ from collections import Counter
 from pathlib import Path
 import re
 
+from shared.parsing import integer_rows, rows
 
-claim_regex = re.compile("^#(\d+) @ (\d+),(\d+): (\d+)x(\d+)$")
 
+claim_regex = re.compile("^#(\d+) @ (\d+),(\d+): (\d+)x(\d+)$")
 
-def parse_claim(claim_string):
-    match = claim_regex.match(claim_string)
-    groups = match.groups()
-    num, x, y, dx, dy = [int(group) for group in groups]
 
+def get_claim_area(x, y, dx, dy):
     result = []
     for i in range(x, x + dx):
         for j in range(y, y + dy):
@@ -22,6 +20,21 @@ def parse_claim(claim_string):
     return result
 
 
+def parse_claim(claim_string):
+    match = claim_regex.match(claim_string)
+    groups = match.groups()
+    num, x, y, dx, dy = [int(group) for group in groups]
+
+    return get_claim_area(x, y, dx, dy)
+
+
+def parse_claims(input_text):
+    return [
+        get_claim_area(x, y, dx, dy)
+        for num, x, y, dx, dy in rows(integer_rows(input_text, 5), 5)
+    ]
+
+
 def combine_claims(claims_list):
     combined_claims = Counter()
 
@@ -33,7 +46,7 @@ def combine_claims(claims_list):
 
 
 def solve(input_text):
-    claims = [parse_claim(line) for line in input_text]
+    claims = parse_claims(input_text)
     combined = combine_claims(claims)
     return sum([n > 1 for n in combined.values()])
 
@@ -5,6 +5,9 @@ from collections import Counter
 from pathlib import Path
 import re
 
+from shared.parsing import integer_rows, rows
+from .solution1 import get_claim_area
+
 
 claim_regex = re.compile("^#(\d+) @ (\d+),(\d+): (\d+)x(\d+)$")
 
@@ -14,12 +17,14 @@ def parse_claim(claim_string):
     groups = match.groups()
     num, x, y, dx, dy = [int(group) for group in groups]
 
-    result = []
-    for i in range(x, x + dx):
-        for j in range(y, y + dy):
-            result.append((i, j))
+    return (num, get_claim_area(x, y, dx, dy))
+
 
-    return (num, result)
+def parse_claims(input_text):
+    return [
+        (num, get_claim_area(x, y, dx, dy))
+        for num, x, y, dx, dy in rows(integer_rows(input_text, 5), 5)
+    ]
 
 
 def combine_claims(claims_list):
@@ -37,7 +42,7 @@ def check_for_overlaps(claim_areas, combined_claims):
 
 
 def solve(input_text):
-    claims = [parse_claim(line) for line in input_text]
+    claims = parse_claims(input_text)
     combined = combine_claims(claims)
     for claim in claims:
         if check_for_overlaps(claim[1], combined):
@@ -59,6 +59,14 @@ class TestSolution1(TestSolution):
         self.assertCountEqual(self.claim2_areas, claim2)
         self.assertCountEqual(self.claim3_areas, claim3)
 
+    def test_parse_claims(self):
+        claims = solution1.parse_claims(self.input_text)
+
+        self.assertEqual(3, len(claims))
+        self.assertCountEqual(self.claim1_areas, claims[0])
+        self.assertCountEqual(self.claim2_areas, claims[1])
+        self.assertCountEqual(self.claim3_areas, claims[2])
+
     def test_combine_claims(self):
         combined_claims = solution1.combine_claims(
             [self.claim1_areas, self.claim2_areas, self.claim3_areas]
@@ -91,6 +99,12 @@ class TestSolution2(TestSolution):
         self.assertCountEqual(self.claim2_areas, claim2)
         self.assertCountEqual(self.claim3_areas, claim3)
 
+    def test_parse_claims(self):
+        claims = solution2.parse_claims(self.input_text)
+
+        self.assertEqual([1, 2, 3], [num for num, area in claims])
+        self.assertCountEqual(self.claim1_areas, claims[0][1])
+
     def test_combine_claims(self):
         combined_claims = solution2.combine_claims([
             (1, self.claim1_areas),
@@ -5,6 +5,7 @@ from collections import defaultdict, Counter
 from datetime import date, timedelta
 import re
 
+from shared.cache import cached_parser
 from .shift import Shift
 
 
@@ -15,6 +16,7 @@ shift_event_regex = re.compile("^\[1518-(\d{2})-(\d{2}) (\d{2}):(\d{2})\] ("
                                ")$")
 
 
+@cached_parser()
 def parse(input_text):
     shifts = defaultdict(dict)
     for event_string in input_text:
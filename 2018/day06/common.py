@@ -1,6 +1,8 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+from shared.grid import Grid
+
 
 def parse(input_text):
     return [(int(x), int(y)) for x, y in (line.split(", ") for line in input_text)]
@@ -16,15 +18,20 @@ def get_manhattan_distance(x, y, coord):
     return abs(x - coord[0]) + abs(y - coord[1])
 
 
-def complete_grid(coords, func):
+def complete_grid(coords, func, empty=-1):
+    # Cells for which func returns None are set to empty
     max_x, max_y = get_max_x_and_y(coords)
-    x_range = range(max_x + round(max_x / 10) + 1)
-    y_range = range(max_y + round(max_y / 10) + 1)
-
-    grid = [
-        [
-            func(x, y, coords) for x in x_range
-        ] for y in y_range
-    ]
+    width = max_x + round(max_x / 10) + 1
+    height = max_y + round(max_y / 10) + 1
+
+    grid = Grid(width, height)
+    cells = grid.cells
+    i = 0
+
+    for y in range(height):
+        for x in range(width):
+            value = func(x, y, coords)
+            cells[i] = empty if value is None else value
+            i += 1
 
     return grid
@@ -23,32 +23,24 @@ def get_closest_destination(x, y, coords):
 
 
 def is_bound(n, grid):
-    # A terribly naive way to determine this
-    for row in grid:
-        # n in first column
-        if row[0] == n:
-            return False
+    # Areas reaching the edge of the grid carry on forever
+    edges = [
+        grid.row(0),
+        grid.row(grid.height - 1),
+        grid.column(0),
+        grid.column(grid.width - 1),
+    ]
 
-        # n in last column
-        if row[-1] == n:
-            return False
-
-    # n in first or last row
-    if n in grid[0] or n in grid[-1]:
-        return False
-
-    return True
+    return not any(n in edge for edge in edges)
 
 
 def solve(input_text):
     coords = parse(input_text)
     grid = complete_grid(coords, get_closest_destination)
-    flat_grid = [cell for row in grid for cell in row]
-
     biggest_range = 0
 
     for n in range(len(coords)):
-        count = flat_grid.count(n)
+        count = grid.count(n)
         if is_bound(n, grid) and count > biggest_range:
             biggest_range = count
 
@@ -13,9 +13,8 @@ def calculate_distance_from_all_coords(x, y, coords):
 def solve(input_text, n=32):
     coords = parse(input_text)
     grid = complete_grid(coords, calculate_distance_from_all_coords)
-    flat_grid = [cell for row in grid for cell in row]
 
-    return len([cell for cell in flat_grid if cell < n])
+    return sum(1 for cell in grid.cells if cell < n)
 
 
 if __name__ == '__main__':
@@ -4,6 +4,7 @@
 from pathlib import Path
 import unittest
 
+from shared.grid import Grid
 from shared.utils import get_input
 from . import solution1, solution2, common
 
@@ -73,17 +74,17 @@ class TestCommon(unittest.TestCase, CoordsMixin):
 
     def test_complete_grid(self):
         expected = [
-            [None, None, None, None, None, None, None, None, None, None],
-            [None, 0, None, None, None, None, None, None, None, None],
-            [None, None, None, None, None, None, None, None, None, None],
-            [None, None, None, None, None, None, None, None, 2, None],
-            [None, None, None, 3, None, None, None, None, None, None],
-            [None, None, None, None, None, 4, None, None, None, None],
-            [None, 1, None, None, None, None, None, None, None, None],
-            [None, None, None, None, None, None, None, None, None, None],
-            [None, None, None, None, None, None, None, None, None, None],
-            [None, None, None, None, None, None, None, None, 5, None],
-            [None, None, None, None, None, None, None, None, None, None],
+            [-1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+            [-1, 0, -1, -1, -1, -1, -1, -1, -1, -1],
+            [-1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+            [-1, -1, -1, -1, -1, -1, -1, -1, 2, -1],
+            [-1, -1, -1, 3, -1, -1, -1, -1, -1, -1],
+            [-1, -1, -1, -1, -1, 4, -1, -1, -1, -1],
+            [-1, 1, -1, -1, -1, -1, -1, -1, -1, -1],
+            [-1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+            [-1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
+            [-1, -1, -1, -1, -1, -1, -1, -1, 5, -1],
+            [-1, -1, -1, -1, -1, -1, -1, -1, -1, -1],
         ]
 
         def some_pointless_func(x, y, coords):
@@ -93,7 +94,7 @@ class TestCommon(unittest.TestCase, CoordsMixin):
                 return None
 
         grid = self.module.complete_grid(self.test_coords, some_pointless_func)
-        self.assertEqual(expected, grid)
+        self.assertEqual(expected, grid.to_lists())
 
 
 class TestSolution1(TestSolution, CoordsMixin):
@@ -116,28 +117,28 @@ class TestSolution1(TestSolution, CoordsMixin):
 
     def test_complete_grid_with_get_closest_destination(self):
         expected = [
-            [0, 0, 0, 0, 0, None, 2, 2, 2, 2],
-            [0, 0, 0, 0, 0, None, 2, 2, 2, 2],
+            [0, 0, 0, 0, 0, -1, 2, 2, 2, 2],
+            [0, 0, 0, 0, 0, -1, 2, 2, 2, 2],
             [0, 0, 0, 3, 3, 4, 2, 2, 2, 2],
             [0, 0, 3, 3, 3, 4, 2, 2, 2, 2],
-            [None, None, 3, 3, 3, 4, 4, 2, 2, 2],
-            [1, 1, None, 3, 4, 4, 4, 4, 2, 2],
-            [1, 1, 1, None, 4, 4, 4, 4, None, None],
-            [1, 1, 1, None, 4, 4, 4, 5, 5, 5],
-            [1, 1, 1, None, 4, 4, 5, 5, 5, 5],
-            [1, 1, 1, None, 5, 5, 5, 5, 5, 5],
-            [1, 1, 1, None, 5, 5, 5, 5, 5, 5],
+            [-1, -1, 3, 3, 3, 4, 4, 2, 2, 2],
+            [1, 1, -1, 3, 4, 4, 4, 4, 2, 2],
+            [1, 1, 1, -1, 4, 4, 4, 4, -1, -1],
+            [1, 1, 1, -1, 4, 4, 4, 5, 5, 5],
+            [1, 1, 1, -1, 4, 4, 5, 5, 5, 5],
+            [1, 1, 1, -1, 5, 5, 5, 5, 5, 5],
+            [1, 1, 1, -1, 5, 5, 5, 5, 5, 5],
         ]
         grid = common.complete_grid(self.test_coords,
                                     self.module.get_closest_destination)
-        self.assertEqual(expected, grid)
+        self.assertEqual(expected, grid.to_lists())
 
     def test_is_bound(self):
-        grid = [
+        grid = Grid.from_rows([
             [1, 2, 3],
             [4, 5, 6],
             [7, 8, 9],
-        ]
+        ])
 
         self.assertTrue(self.module.is_bound(5, grid))
 
@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+from array import array
 from collections import deque
 import re
 
@@ -18,22 +19,43 @@ def place_marble(circle, next_marble):
     circle.append(next_marble)
 
 
-def play_game(num_players, num_marbles):
+def play_game(num_players, num_marbles, checkpoint=None, every=100_000):
+    # every is in marbles
     players = [0 for n in range(num_players)]
-
     circle = deque([0])
-    current_player = 0
-
-    for n in range(1, num_marbles + 1):
-        if n % 23 == 0:
-            circle.rotate(7)
-            players[current_player] += n
-            players[current_player] += circle.pop()
-            circle.rotate(-1)
-        else:
-            place_marble(circle, n)
-
-        current_player += 1
-        current_player %= num_players
+    first = 1
+
+    if checkpoint is not None:
+        state = checkpoint.resume()
+        if state is not None:
+            values, arrays = state
+            first = values["next_marble"]
+            players = arrays["players"].tolist()
+            circle = deque(arrays["circle"])
+
+    for start in range(first, num_marbles + 1, every):
+        end = min(start + every, num_marbles + 1)
+        current_player = (start - 1) % num_players
+
+        for n in range(start, end):
+            if n % 23 == 0:
+                circle.rotate(7)
+                players[current_player] += n
+                players[current_player] += circle.pop()
+                circle.rotate(-1)
+            else:
+                place_marble(circle, n)
+
+            current_player += 1
+            current_player %= num_players
+
+        if checkpoint is not None:
+            checkpoint.update(end - 1, num_marbles, lambda: (
+                {"next_marble": end},
+                {"players": array("q", players), "circle": array("L", circle)},
+            ))
+
+    if checkpoint is not None:
+        checkpoint.clear()
 
     return players
@@ -3,13 +3,15 @@
 
 from pathlib import Path
 
+from shared.checkpoint import get_checkpoint
 from .common import parse, play_game
 
 
 def solve(input_text):
     num_players, num_marbles = parse(input_text)
     num_marbles *= 100
-    return max(play_game(num_players, num_marbles))
+    checkpoint = get_checkpoint("day09.part2", [num_players, num_marbles])
+    return max(play_game(num_players, num_marbles, checkpoint))
 
 
 if __name__ == '__main__':
@@ -3,8 +3,10 @@
 
 from collections import deque
 from pathlib import Path
+import tempfile
 import unittest
 
+from shared.checkpoint import Checkpoint
 from shared.utils import get_input
 from . import solution1, solution2, common
 
@@ -94,6 +96,25 @@ class TestCommon(unittest.TestCase):
                 max(self.module.play_game(players, marbles))
             )
 
+    def test_play_game_resumes(self):
+        def stop(done, total):
+            if done == 500:
+                raise KeyboardInterrupt
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory).joinpath("game")
+            checkpoint = Checkpoint(path, [10, 1618], 0, stop)
+            with self.assertRaises(KeyboardInterrupt):
+                self.module.play_game(10, 1618, checkpoint, every=100)
+            self.assertTrue(path.exists())
+
+            # Carries on from marble 401
+            checkpoint = Checkpoint(path, [10, 1618], 0)
+            self.assertEqual(401, checkpoint.resume()[0]["next_marble"])
+            scores = self.module.play_game(10, 1618, checkpoint, every=100)
+            self.assertEqual(8317, max(scores))
+            self.assertFalse(path.exists())
+
 
 class TestSolution1(TestSolution):
     module = solution1
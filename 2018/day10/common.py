@@ -3,22 +3,17 @@
 
 
 from itertools import combinations
-import re
 
-
-regex = re.compile(
-    "position=<([- ]?\d+), ([- ]?\d+)> velocity=<([- ]?\d+), ([- ]?\d+)>"
-)
+from shared.cache import cached_parser
+from shared.parsing import integer_rows, rows
 
 
+@cached_parser()
 def parse(input_text):
-    result = []
-
-    for line in input_text:
-        x, y, dx, dy = regex.match(line).groups()
-        result.append([(int(x), int(y)), (int(dx), int(dy))])
-
-    return result
+    return [
+        [(x, y), (dx, dy)]
+        for x, y, dx, dy in rows(integer_rows(input_text, 4), 4)
+    ]
 
 
 def find_time_with_closest_fit(rescue_message):
@@ -2,6 +2,22 @@
 # -*- coding: utf-8 -*-
 
 from collections import deque
+from functools import lru_cache
+
+from shared import automata
+
+
+@lru_cache()
+def get_rule_table(rules):
+    # rules are the patterns giving a plant, as a tuple. None if "....."
+    # gives one, which the table can't do (the line would grow forever), but
+    # PlantPots._next_gen can, as it only looks at the pots it has.
+    try:
+        return automata.make_line_table(
+            lambda window: "".join(".#"[n] for n in window) in rules
+        )
+    except ValueError:
+        return None
 
 
 class PlantPots:
@@ -44,11 +60,29 @@ class PlantPots:
         return "#" if to_match in rules else "."
 
     def advance(self, rules):
+        if automata.numpy is not None:
+            table = get_rule_table(tuple(rules))
+            if table is not None:
+                return self._advance_numpy(table)
+
         return PlantPots(
             "".join(self._next_gen(i, rules) for i in range(len(self.data))),
             self.offset
         )
 
+    def _advance_numpy(self, table):
+        numpy = automata.numpy
+        pots = numpy.frombuffer(str(self).encode(), dtype=numpy.uint8)
+        pots, position = automata.line_step(
+            (pots == ord("#")).view(numpy.uint8), -self.offset, table
+        )
+
+        if not len(pots):
+            return PlantPots(".....")
+
+        string = numpy.where(pots, ord("#"), ord(".")).astype(numpy.uint8)
+        return PlantPots(string.tobytes().decode(), -position)
+
     def score(self):
         return sum(
             (i - self.offset)
@@ -3,33 +3,28 @@
 
 from pathlib import Path
 
+from shared.cycles import fast_forward
 from .common import parse
 from .plantpots import PlantPots
 
 
 def solve(input_text, num_generations=20):
     plant_state, rules = parse(input_text)
-    plantpots = PlantPots(plant_state)
 
-    first_repeat_gen = None
-    prev_plantpots = plantpots
-
-    for n in range(num_generations):
-        plantpots = plantpots.advance(rules)
-
-        if str(plantpots) == str(prev_plantpots):
-            first_repeat_gen = n
-            break
-
-        prev_plantpots = plantpots
-
-    score = plantpots.score()
-
-    if first_repeat_gen is not None:
-        remaining_generations = num_generations - first_repeat_gen - 1
-        score = score + remaining_generations * (score - prev_plantpots.score())
-
-    return score
+    # The plants settle into a pattern that repeats, usually drifting
+    # along the row as it does
+    plantpots = fast_forward(
+        PlantPots(plant_state),
+        lambda plantpots: plantpots.advance(rules),
+        num_generations,
+        key=str,
+        offset=lambda plantpots: -plantpots.offset,
+        translate=lambda plantpots, distance: PlantPots(
+            str(plantpots), plantpots.offset - distance
+        ),
+    )
+
+    return plantpots.score()
 
 
 if __name__ == '__main__':
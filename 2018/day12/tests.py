@@ -5,6 +5,7 @@ from pathlib import Path
 import unittest
 from unittest.mock import patch
 
+from shared import automata
 from shared.utils import get_input
 from . import solution1, solution2, common
 from .plantpots import PlantPots
@@ -71,6 +72,36 @@ class TestPlantPots(unittest.TestCase):
         self.assertEqual("..#....#..", str(new_plantpots))
         self.assertEqual(1, new_plantpots.offset)
 
+    def test_advance_without_numpy(self):
+        plant_state, rules = common.parse(
+            get_input(SOLUTION_DIR.joinpath("test_input.txt"))
+        )
+        plantpots = PlantPots(plant_state)
+
+        for _ in range(20):
+            with patch.object(automata, "numpy", None):
+                expected = plantpots.advance(rules)
+            plantpots = plantpots.advance(rules)
+
+            self.assertEqual(str(expected), str(plantpots))
+            self.assertEqual(expected.offset, plantpots.offset)
+
+    def test_advance_empty_pots_growing_plants(self):
+        # No rule table for this, so it has to be done without numpy
+        rules = {
+            ".....": "#",
+            "..#..": "#",
+        }
+        plantpots = PlantPots("..#..")
+
+        for _ in range(3):
+            with patch.object(automata, "numpy", None):
+                expected = plantpots.advance(rules)
+            plantpots = plantpots.advance(rules)
+
+            self.assertEqual(str(expected), str(plantpots))
+            self.assertEqual(expected.offset, plantpots.offset)
+
     def test__next_get(self):
         plantpots = PlantPots("..#..")
         rules = {
@@ -157,7 +157,7 @@ class TestCommon(unittest.TestCase, TestValues):
 
     def test_parser(self):
         tracks, carts = self.module.parse(self.initial_data)
-        self.assertEqual(self.initial_tracks, tracks.data)
+        self.assertEqual(self.initial_tracks, tracks.data.to_lists())
         self.assertEqual(2, len(carts))
         self.assertCountEqual(
             ["2, 0, >", "9, 3, v"],
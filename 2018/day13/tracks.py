@@ -1,10 +1,13 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+from shared.grid import CharGrid
+
 
 class Tracks:
     def __init__(self, initial_data):
-        self.data = [row[:] for row in initial_data]
+        # initial_data is a sequence of rows, each a string or list of chars
+        self.data = CharGrid.from_lines("".join(row) for row in initial_data)
 
     def get(self, x, y):
-        return self.data[y][x]
+        return self.data.get(x, y)
@@ -1,6 +1,10 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+from array import array
+
+from shared.checkpoint import get_checkpoint
+
 
 def update_elf_pos(recipes, pos):
     increment_by = recipes[pos] + 1
@@ -19,22 +23,54 @@ def make_hot_chocolate(recipes, elf1, elf2):
     return (elf1, elf2)
 
 
-def solve(input_value):
+def is_at_end(recipes, input_value):
+    # Either as the last recipes or just before the last one, as two can be
+    # made at once
+    length = len(input_value)
+    return input_value in (recipes[-length:], recipes[-length - 1: -1])
+
+
+def make_recipes_until(recipes, elf1, elf2, input_value, rounds):
+    # Makes up to the given number of rounds of recipes, stopping early if
+    # input_value turns up; returns whether it did, and where the elves are
+    for _ in range(rounds):
+        if is_at_end(recipes, input_value):
+            return True, elf1, elf2
+        elf1, elf2 = make_hot_chocolate(recipes, elf1, elf2)
+
+    return is_at_end(recipes, input_value), elf1, elf2
+
+
+def solve(input_value, every=1_000_000):
+    checkpoint = get_checkpoint("day14.part2", input_value)
     input_value = [int(val) for val in input_value]
     recipes = [3, 7]
     elf1 = 0
     elf2 = 1
 
-    length1 = len(input_value)
-    length2 = len(input_value) + 1
+    state = checkpoint.resume()
+    if state is not None:
+        values, arrays = state
+        recipes = arrays["recipes"].tolist()
+        elf1, elf2 = values["elves"]
 
-    while input_value not in (recipes[-length1:], recipes[-length2: -1]):
-        elf1, elf2 = make_hot_chocolate(recipes, elf1, elf2)
+    found = False
+    while not found:
+        found, elf1, elf2 = make_recipes_until(
+            recipes, elf1, elf2, input_value, every
+        )
+        if not found:
+            checkpoint.update(len(recipes), None, lambda: (
+                {"elves": [elf1, elf2]}, {"recipes": array("B", recipes)}
+            ))
+
+    checkpoint.clear()
 
-    if recipes[-length1:] == input_value:
-        return len(recipes) - length1
+    length = len(input_value)
+    if recipes[-length:] == input_value:
+        return len(recipes) - length
     else:
-        return len(recipes) - length2
+        return len(recipes) - length - 1
 
 
 if __name__ == '__main__':
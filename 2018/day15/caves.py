@@ -3,6 +3,12 @@
 
 from operator import attrgetter, itemgetter
 
+from shared.grid import CharGrid
+from shared.search import bfs
+
+
+OPEN = ord(".")
+
 
 class CombatantBaseClass:
     letter = None
@@ -42,37 +48,42 @@ class Goblin(CombatantBaseClass):
 
 class Caves:
     def __init__(self, data):
-        self.grid = []
+        # The grid holds each combatant's letter; the combatants themselves
+        # are looked up by location in self.combatants
+        self.grid = CharGrid.from_lines(data)
+        self.combatants = {}
         self.goblins = []
         self.elves = []
-        self.height = len(data)
-        self.width = len(data[0])
-
-        for x in range(self.width):
-            col = []
-            self.grid.append(col)
+        self.height = self.grid.height
+        self.width = self.grid.width
 
-            for y in range(self.height):
-                cell_contents = data[y][x]
+        for y in range(self.height):
+            for x in range(self.width):
+                cell_contents = self.grid.get(x, y)
 
                 if cell_contents == "G":
                     new_goblin = Goblin(x, y)
                     self.goblins.append(new_goblin)
-                    col.append(new_goblin)
+                    self.combatants[(x, y)] = new_goblin
                 elif cell_contents == "E":
                     new_elf = Elf(x, y)
                     self.elves.append(new_elf)
-                    col.append(new_elf)
-                else:
-                    col.append(cell_contents)
+                    self.combatants[(x, y)] = new_elf
 
         self.sort()
 
     def set(self, x, y, value):
-        self.grid[x][y] = value
+        # value is either a combatant or the character for an empty square
+        if isinstance(value, CombatantBaseClass):
+            self.combatants[(x, y)] = value
+        else:
+            self.combatants.pop((x, y), None)
+
+        self.grid.set(x, y, str(value))
 
     def get(self, x, y):
-        return self.grid[x][y]
+        combatant = self.combatants.get((x, y))
+        return self.grid.get(x, y) if combatant is None else combatant
 
     def sort(self):
         self.elves.sort(key=attrgetter("y", "x"))
@@ -87,19 +98,17 @@ class Caves:
         return (abs(x1 - x2) + abs(y1 - y2)) <= 1
 
     def in_grid(self, x, y):
-        return 0 <= x < self.width and 0 <= y < self.height
+        return self.grid.in_bounds(x, y)
 
     def get_squares_in_range(self, x, y):
-        return [
-            coord for coord in [(x, y - 1), (x - 1, y), (x + 1, y), (x, y + 1)]
-            if self.in_grid(*coord)
-        ]
+        # In reading order
+        return self.grid.neighbours(x, y)
 
     def is_empty(self, x, y, grid=None):
         if grid is None:
             grid = self.grid
 
-        return grid[x][y] == "."
+        return grid.get(x, y) == "."
 
     def get_open_squares_in_range(self, x, y, grid=None):
         if grid is None:
@@ -125,86 +134,53 @@ class Caves:
 
         return sorted(list(targets), key=itemgetter(1, 0))
 
+    def get_open_neighbours(self, index):
+        # As get_open_squares_in_range, for flat grid indices
+        cells = self.grid.cells
+        return [i for i in self.grid.neighbour_indices(index)
+                if cells[i] == OPEN]
+
     def get_best_move(self, combatant, opponents=None):
         targets = self.get_target_squares(combatant)
 
-        if not targets or self.is_trapped(combatant, targets):
+        if not targets:
             return None
 
-        potential_moves = self.get_open_squares_in_range(
-            *combatant.get_location()
-        )
-
-        best_moves = {}
-        best_move = None
-
-        for x, y in targets:
-            grid_copy = [col[:] for col in self.grid]
-
-            current_layer = set([(x, y)])
-            n = 0
-
-            # Stop when we run out of moves to explore or we've reached the
-            # number of moves at which we already found a higher priority target
-            while current_layer and (best_move is None or best_move > n):
-                next_layer = set()
-
-                for (x, y) in current_layer:
-                    if (x, y) in potential_moves:
-                        best_move = n
-                        best_moves[(x, y)] = n
+        # Squares are searched as flat indices, which are in reading order
+        grid = self.grid
+        location = grid.index(*combatant.get_location())
+        targets = set(grid.index(x, y) for x, y in targets)
 
-                    grid_copy[x][y] = n
-
-                    next_layer.update(
-                        self.get_open_squares_in_range(x, y, grid_copy) or []
-                    )
+        # Find the nearest target square, the first in reading order if tied
+        distances = bfs(
+            [location], self.get_open_neighbours, until=targets.__contains__
+        )
+        reached = [(distances[i], i) for i in targets if i in distances]
 
-                current_layer = next_layer
-                n += 1
+        if not reached:
+            return None
 
-        # Get best moves and rank by UP, LEFT, RIGHT, DOWN
-        moves = [key for key, value in best_moves.items() if value == best_move]
+        target = min(reached)[1]
 
-        if not moves:
-            return None
+        # Then the first step towards it, again in reading order if tied
+        moves = set(self.get_open_neighbours(location))
+        distances = bfs(
+            [target], self.get_open_neighbours, until=moves.__contains__
+        )
+        move = min((distances[i], i) for i in moves if i in distances)[1]
 
-        moves.sort(key=itemgetter(1, 0))
-        return moves[0]
+        return grid.position(move)
 
     def move_combatant(self, combatant):
         best_move = self.get_best_move(combatant)
 
         if best_move is not None:
-            x, y = combatant.get_location()
-            self.grid[x][y] = "."
+            self.set(*combatant.get_location(), ".")
 
             x, y = best_move
-            self.grid[x][y] = combatant
+            self.set(x, y, combatant)
             combatant.move(x, y)
 
-    def is_trapped(self, combatant, targets):
-        grid_copy = [col[:] for col in self.grid]
-
-        current_layer = [combatant.get_location()]
-
-        while current_layer:
-            next_layer = set()
-
-            for (x, y) in current_layer:
-                if (x, y) in targets:
-                    return False
-
-                grid_copy[x][y] = "X"
-
-                next_layer.update(
-                    self.get_open_squares_in_range(x, y, grid_copy) or []
-                )
-
-            current_layer = next_layer
-
-        return True
-
     def get_opponents_within_range(self, combatant):
         opposing_letter = "G" if str(combatant) == "E" else "E"
 
@@ -220,9 +196,8 @@ class Caves:
         combatant.attack(opponent)
 
         if opponent.is_dead:
-            x, y = opponent.get_location()
             # Remove from grid
-            self.grid[x][y] = "."
+            self.set(*opponent.get_location(), ".")
 
             # Remove from self.elves/self.goblins
             if str(opponent) == "E":
@@ -253,8 +228,4 @@ class Caves:
         return game_over
 
     def __str__(self):
-        return "\n".join(
-            "".join(
-                str(self.grid[x][y]) for x in range(self.width)
-            ) for y in range(self.height)
-        )
+        return str(self.grid)
@@ -195,14 +195,14 @@ class TestCaves(unittest.TestCase):
         caves = Caves(self.example_input1)
 
         self.assertEqual(
-            (2, 1), caves.get_best_move(caves.grid[1][1], caves.elves)
+            (2, 1), caves.get_best_move(caves.get(1, 1), caves.elves)
         )
 
     def test_get_best_move2(self):
         caves = Caves(self.example_input3)
 
         self.assertEqual(
-            (4, 1), caves.get_best_move(caves.grid[3][1], caves.elves)
+            (4, 1), caves.get_best_move(caves.get(3, 1), caves.elves)
         )
 
     def test_get_best_move3(self):
@@ -217,7 +217,7 @@ class TestCaves(unittest.TestCase):
         ]
         caves = Caves(test_input)
         self.assertEqual(
-            (3, 1), caves.get_best_move(caves.grid[2][1], caves.goblins)
+            (3, 1), caves.get_best_move(caves.get(2, 1), caves.goblins)
         )
 
     def test_get_best_move4(self):
@@ -231,7 +231,7 @@ class TestCaves(unittest.TestCase):
         ]
         caves = Caves(test_input)
         self.assertEqual(
-            (2, 2), caves.get_best_move(caves.grid[2][1], caves.elves)
+            (2, 2), caves.get_best_move(caves.get(2, 1), caves.elves)
         )
 
     def test_advance(self):
@@ -257,11 +257,11 @@ class TestCaves(unittest.TestCase):
     def test_get_opponents_within_range(self):
         arg = self.example_cave1_after_three_moves.split("\n")
         caves = Caves(arg)
-        elf = caves.grid[4][3]
-        caves.grid[5][3].hit_points = 199
+        elf = caves.get(4, 3)
+        caves.get(5, 3).hit_points = 199
         expected_goblins = [
-            caves.grid[5][3], caves.grid[4][2],
-            caves.grid[3][3], caves.grid[4][4],
+            caves.get(5, 3), caves.get(4, 2),
+            caves.get(3, 3), caves.get(4, 4),
         ]
         self.assertEqual(
             expected_goblins, caves.get_opponents_within_range(elf)
@@ -270,7 +270,7 @@ class TestCaves(unittest.TestCase):
     def test_advance_attack_result(self):
         arg = self.example_cave1_after_three_moves.split("\n")
         caves = Caves(arg)
-        caves.grid[4][2].hit_points = 199
+        caves.get(4, 2).hit_points = 199
         caves.advance()
 
         self.assertEqual(200, caves.goblins[0].hit_points)
@@ -3,101 +3,7 @@
 
 from pathlib import Path
 
-def addr(a, b, c, reg):
-    reg = reg[:]
-    reg[c] = reg[a] + reg[b]
-    return reg
-
-
-def addi(a, b, c, reg):
-    reg = reg[:]
-    reg[c] = reg[a] + b
-    return reg
-
-def mulr(a, b, c, reg):
-    reg = reg[:]
-    reg[c] = reg[a] * reg[b]
-    return reg
-
-
-def muli(a, b, c, reg):
-    reg = reg[:]
-    reg[c] = reg[a] * b
-    return reg
-
-
-def banr(a, b, c, reg):
-    reg = reg[:]
-    reg[c] = reg[a] & reg[b]
-    return reg
-
-
-def bani(a, b, c, reg):
-    reg = reg[:]
-    reg[c] = reg[a] & b
-    return reg
-
-
-def borr(a, b, c, reg):
-    reg = reg[:]
-    reg[c] = reg[a] | reg[b]
-    return reg
-
-
-def bori(a, b, c, reg):
-    reg = reg[:]
-    reg[c] = reg[a] | b
-    return reg
-
-
-def setr(a, b, c, reg):
-    reg = reg[:]
-    reg[c] = reg[a]
-    return reg
-
-
-def seti(a, b, c, reg):
-    reg = reg[:]
-    reg[c] = a
-    return reg
-
-
-def gtir(a, b, c, reg):
-    reg = reg[:]
-    reg[c] = int(a > reg[b])
-    return reg
-
-
-def gtri(a, b, c, reg):
-    reg = reg[:]
-    reg[c] = int(reg[a] > b)
-    return reg
-
-
-def gtrr(a, b, c, reg):
-    reg = reg[:]
-    reg[c] = int(reg[a] > reg[b])
-    return reg
-
-
-def eqir(a, b, c, reg):
-    reg = reg[:]
-    reg[c] = int(a == reg[b])
-    return reg
-
-
-def eqri(a, b, c, reg):
-    reg = reg[:]
-    reg[c] = int(reg[a] == b)
-    return reg
-
-
-def eqrr(a, b, c, reg):
-    reg = reg[:]
-    reg[c] = int(reg[a] == reg[b])
-    return reg
-
-
+from shared.elfcode import OPCODES, OPERATIONS
 
 
 def parse(input_text):
@@ -126,19 +32,16 @@ def parse(input_text):
 
 
 def solve(input_text):
-    opcodes = [
-        addr, addi, mulr, muli, banr, bani, borr, bori,
-        setr, seti, gtir, gtri, gtrr, eqir, eqri, eqrr
-    ]
     instructions = parse(input_text)
 
     answer = 0
 
     for before, (op, a, b, c), after in instructions:
         count = 0
-        for opcode in opcodes:
+        for opcode in OPCODES:
+            reg = before[:]
             try:
-                reg = opcode(a, b, c, before)
+                OPERATIONS[opcode](reg, a, b, c)
             except IndexError:
                 pass
             else:
@@ -4,100 +4,7 @@
 from collections import defaultdict
 from pathlib import Path
 
-
-def addr(a, b, c, reg):
-    reg = reg[:]
-    reg[c] = reg[a] + reg[b]
-    return reg
-
-
-def addi(a, b, c, reg):
-    reg = reg[:]
-    reg[c] = reg[a] + b
-    return reg
-
-def mulr(a, b, c, reg):
-    reg = reg[:]
-    reg[c] = reg[a] * reg[b]
-    return reg
-
-
-def muli(a, b, c, reg):
-    reg = reg[:]
-    reg[c] = reg[a] * b
-    return reg
-
-
-def banr(a, b, c, reg):
-    reg = reg[:]
-    reg[c] = reg[a] & reg[b]
-    return reg
-
-
-def bani(a, b, c, reg):
-    reg = reg[:]
-    reg[c] = reg[a] & b
-    return reg
-
-
-def borr(a, b, c, reg):
-    reg = reg[:]
-    reg[c] = reg[a] | reg[b]
-    return reg
-
-
-def bori(a, b, c, reg):
-    reg = reg[:]
-    reg[c] = reg[a] | b
-    return reg
-
-
-def setr(a, b, c, reg):
-    reg = reg[:]
-    reg[c] = reg[a]
-    return reg
-
-
-def seti(a, b, c, reg):
-    reg = reg[:]
-    reg[c] = a
-    return reg
-
-
-def gtir(a, b, c, reg):
-    reg = reg[:]
-    reg[c] = int(a > reg[b])
-    return reg
-
-
-def gtri(a, b, c, reg):
-    reg = reg[:]
-    reg[c] = int(reg[a] > b)
-    return reg
-
-
-def gtrr(a, b, c, reg):
-    reg = reg[:]
-    reg[c] = int(reg[a] > reg[b])
-    return reg
-
-
-def eqir(a, b, c, reg):
-    reg = reg[:]
-    reg[c] = int(a == reg[b])
-    return reg
-
-
-def eqri(a, b, c, reg):
-    reg = reg[:]
-    reg[c] = int(reg[a] == b)
-    return reg
-
-
-def eqrr(a, b, c, reg):
-    reg = reg[:]
-    reg[c] = int(reg[a] == reg[b])
-    return reg
+from shared.elfcode import OPCODES, OPERATIONS, Program
 
 
 def parse(input_text):
@@ -132,19 +39,16 @@ def parse(input_text):
 
 
 def solve(input_text):
-    opcodes = [
-        addr, addi, mulr, muli, banr, bani, borr, bori,
-        setr, seti, gtir, gtri, gtrr, eqir, eqri, eqrr
-    ]
     instructions, program = parse(input_text)
 
     potentials = defaultdict(set)
 
     for before, (op, a, b, c), after in instructions:
         working = []
-        for opcode in opcodes:
+        for opcode in OPCODES:
+            reg = before[:]
             try:
-                reg = opcode(a, b, c, before)
+                OPERATIONS[opcode](reg, a, b, c)
             except IndexError:
                 pass
             else:
@@ -153,7 +57,7 @@ def solve(input_text):
 
         potentials[op].update(working)
 
-    opcodes_to_assign = opcodes[:]
+    opcodes_to_assign = list(OPCODES)
     opcode_numbers = {}
 
     loops = 0
@@ -171,11 +75,13 @@ def solve(input_text):
     if loops == 1000:
         raise Exception("Something's up")
 
-    reg = [0, 0, 0, 0]
-    for op, a, b, c in program:
-        reg = opcode_numbers[op](a, b, c, reg)
+    program = Program.from_instructions(
+        [(opcode_numbers[op], a, b, c) for op, a, b, c in program],
+        register=[0, 0, 0, 0]
+    )
+    program.execute()
 
-    return reg[0]
+    return program.register[0]
 
 
 if __name__ == '__main__':
@@ -3,11 +3,11 @@
 
 from pathlib import Path
 
-from .survey import Survey
+from .survey import parse_survey
 
 
 def solve(input_text):
-    survey = Survey(input_text)
+    survey = parse_survey(input_text)
     survey.flow()
     survey.drain()
     return survey.count_water()
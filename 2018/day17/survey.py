@@ -3,11 +3,15 @@
 
 import re
 
+from shared.cache import cached_parser
+from shared.grid import CharGrid
+
 
 regex = re.compile("^([xy])=(\d+), ([xy])=(\d+)\.\.(\d+)$")
+flowing_regex = re.compile(rb"[+|]")
 
 
-class Survey:
+class Survey(CharGrid):
     def __init__(self, data):
         self.max_x = self.min_x = self.min_y = self.max_y = None
         to_fill = []
@@ -21,10 +25,7 @@ class Survey:
         self._create_grid(to_fill)
 
     def _create_grid(self, to_fill):
-        self.grid = [
-            ["." for n in range(self.width)]
-            for row in range(self.height)
-        ]
+        super().__init__(self.width, self.height, ".")
 
         # create clay seams
         for x, y in to_fill:
@@ -70,19 +71,18 @@ class Survey:
             self._update_min_and_max_x(range_end)
             return [(x, coord1) for x in range(range_start, range_end + 1)]
 
-    def get(self, x, y):
-        return self.grid[y][x]
-
-    def set(self, x, y, value):
-        self.grid[y][x] = value
+    # Both stop at the edge of the grid at the latest, where the water
+    # spills over
 
     def get_left_boundary(self, x, y):
-        while self.get(x, y) != "#" and self.get(x, y + 1) in "#~":
+        while x > 0 and self.get(x, y) != "#" and \
+                self.get(x, y + 1) in "#~":
             x -= 1
         return x
 
     def get_right_boundary(self, x, y):
-        while self.get(x, y) != "#" and self.get(x, y + 1) in "#~":
+        while x < self.width - 1 and self.get(x, y) != "#" and \
+                self.get(x, y + 1) in "#~":
             x += 1
         return x
 
@@ -118,13 +118,20 @@ class Survey:
 
         while y < self.height:
             reverse = False
-            x = 0
 
-            while x < self.width:
-                if y == 0:
-                    # If we've reversed this far something's probably wrong,
-                    # but let's just ignore it for now
-                    continue
+            if y == 0:
+                # If we've reversed this far something's probably wrong,
+                # but let's just ignore it for now
+                y += 1
+                continue
+
+            # Only squares with flowing water above can change, and the row
+            # above isn't changed while working along this one
+            above = self.index(0, y - 1)
+
+            for match in flowing_regex.finditer(self.cells, above,
+                                                above + self.width):
+                x = match.start() - above
 
                 if self.get(x, y) == "~":
                     # We're looking at a row we've already filled; ignore
@@ -144,22 +151,17 @@ class Survey:
                     elif self.get(x, y) == ".":
                         # Nothing stopping donwards flow; keep going
                         self.set(x, y, "|")
-                x += 1
 
             y += -1 if reverse else 1
 
     def drain(self):
-        for y in range(self.height):
-            for x in range(self.width):
-                if self.get(x, y) == "|":
-                    self.set(x, y, ".")
+        self.cells = self.cells.replace(b"|", b".")
 
     def count_water(self):
-        return sum(
-            1 for y in range(
-                self.min_y, self.height
-            ) for cell in self.grid[y] if cell in "~|"
-        )
-
-    def __str__(self):
-        return "\n".join("".join(row) for row in self.grid)
+        rows = [self.row(y) for y in range(self.min_y, self.height)]
+        return sum(row.count("~") + row.count("|") for row in rows)
+
+
+@cached_parser(version=2)
+def parse_survey(data):
+    return Survey(data)
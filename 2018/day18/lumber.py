@@ -3,60 +3,68 @@
 
 from collections import Counter
 
+from shared import automata
+from shared.grid import CHARS, CharGrid
+
+
+def next_square(contents, trees, lumberyards):
+    if contents == ".":
+        return "|" if trees >= 3 else "."
+    elif contents == "|":
+        return "#" if lumberyards >= 3 else "|"
+    elif trees >= 1 and lumberyards >= 1:
+        return "#"
+    else:
+        return "."
+
+
+if automata.numpy is not None:
+    # next_square for every square and neighbour count, by byte value
+    COUNTED = (ord("|"), ord("#"))
+    TABLE = automata.make_moore_table(
+        [ord(".")] + list(COUNTED), COUNTED,
+        lambda square, trees, lumberyards: ord(
+            next_square(chr(square), trees, lumberyards)
+        )
+    )
+
 
 class LumberCollectionArea:
     def __init__(self, data):
         self.size = len(data)
-        self.data = [list(line) for line in data]
+        self.data = CharGrid.from_lines(data)
 
     def in_bounds(self, x, y):
-        return x >= 0 and x < self.size and y >= 0 and y < self.size
+        return self.data.in_bounds(x, y)
 
     def get(self, x, y):
-        return self.data[y][x]
+        return self.data.get(x, y)
 
     def get_surrounding_square_contents(self, x, y):
-        surrounding_squares = [
-            (x - 1, y - 1),
-            (x, y - 1),
-            (x + 1, y - 1),
-            (x - 1, y),
-            (x + 1, y),
-            (x - 1, y + 1),
-            (x, y + 1),
-            (x + 1, y + 1)
-        ]
-
-        surrounding_square_contents = [
-            self.get(*square) for square in surrounding_squares
-            if self.in_bounds(*square)
-        ]
-
-        return Counter(surrounding_square_contents)
+        cells = self.data.cells
+        surrounding_squares = self.data.neighbour_indices(
+            self.data.index(x, y), diagonal=True
+        )
+
+        return Counter(CHARS[cells[i]] for i in surrounding_squares)
 
     def change_square(self, x, y):
-        contents = self.get(x, y)
         surrounding = self.get_surrounding_square_contents(x, y)
-        if contents == ".":
-            if surrounding["|"] >= 3:
-                return "|"
-            else:
-                return "."
-        elif contents == "|":
-            if surrounding["#"] >= 3:
-                return "#"
-            else:
-                return "|"
-        elif surrounding["#"] >= 1 and surrounding["|"] >= 1:
-            return "#"
-        else:
-            return "."
+        return next_square(self.get(x, y), surrounding["|"], surrounding["#"])
 
     def update_squares(self):
-        self.data = [
-            [self.change_square(x, y) for x in range(self.size)]
-            for y in range(self.size)
-        ]
+        if automata.numpy is not None:
+            cells = self.data.to_numpy()
+            cells[...] = automata.moore_step(cells, TABLE, COUNTED)
+            return
+
+        updated = self.data.copy()
+
+        for y in range(self.size):
+            for x in range(self.size):
+                updated.set(x, y, self.change_square(x, y))
+
+        self.data = updated
 
     def __str__(self):
-        return "\n".join("".join(line) for line in self.data)
+        return str(self.data)
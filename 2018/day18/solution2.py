@@ -4,6 +4,7 @@
 from collections import Counter
 from pathlib import Path
 
+from shared.cycles import fast_forward
 from .lumber import LumberCollectionArea
 
 
@@ -12,28 +13,18 @@ def score(area):
     return counts["|"] * counts["#"]
 
 
+def advance(area):
+    # In place, which is fine as only keys are kept without verify
+    area.update_squares()
+    return area
+
+
 def solve(input_text):
-    area = LumberCollectionArea(input_text)
-
-    previous_areas = []
-    repeated = False
-    n = 0
-
-    while n < 1_000_000_000:
-        area.update_squares()
-
-        if not repeated:
-            string = str(area)
-            if string in previous_areas:
-                repeated = True
-                repeats_after = n - previous_areas.index(string)
-                remaining = 1_000_000_000 - n
-                advance_by = (remaining // repeats_after) * repeats_after
-                n += advance_by
-            else:
-                previous_areas.append(string)
-
-        n += 1
+    # The area settles into a cycle long before a billion minutes
+    area = fast_forward(
+        LumberCollectionArea(input_text), advance, 1_000_000_000,
+        key=lambda area: bytes(area.data.cells)
+    )
 
     return score(area)
 
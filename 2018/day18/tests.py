@@ -3,7 +3,9 @@
 
 from pathlib import Path
 import unittest
+from unittest.mock import patch
 
+from shared import automata
 from shared.utils import get_input
 from . import solution1, solution2
 from .lumber import LumberCollectionArea
@@ -250,6 +252,14 @@ class TestLumberCollectionArea(unittest.TestCase, ValuesToTest):
             area.update_squares()
             self.assertEqual(expected, str(area))
 
+    def test_update_squares_without_numpy(self):
+        area = LumberCollectionArea(self.test_input)
+
+        with patch.object(automata, "numpy", None):
+            area.update_squares()
+
+        self.assertEqual(self.str_at_minute1, str(area))
+
 
 class TestSolution1(TestSolution):
     module = solution1
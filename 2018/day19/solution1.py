@@ -3,7 +3,7 @@
 
 from pathlib import Path
 
-from .program import Program
+from shared.elfcode import Program
 
 
 def solve(input_text):
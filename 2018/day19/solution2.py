@@ -1,26 +1,18 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from math import ceil
 from pathlib import Path
 
-from .program import Program
-
-
-def get_factors(n):
-    # Definitely not the quickest way to do this
-    return [i for i in range(1, n + 1) if n % i == 0]
+from shared.elfcode import Program
 
 
 def solve(input_text, reg0=0):
-    if reg0 == 0:
-        eventual_reg2 = 1024
-    elif reg0 == 1:
-        eventual_reg2 = 10_551_424
-    else:
-        raise Exception("Why are you doing this to me?")
-
-    return sum(get_factors(eventual_reg2))
+    # The program sums the divisors of a number it works out first, which
+    # is far bigger when starting with 1 in register 0; the compiled program
+    # recognises the loops doing that and skips them
+    program = Program(input_text, [reg0, 0, 0, 0, 0, 0])
+    program.execute()
+    return program.register[0]
 
 
 if __name__ == '__main__':
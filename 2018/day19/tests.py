@@ -4,6 +4,7 @@
 from pathlib import Path
 import unittest
 
+from shared.generators import DAY19_PROGRAM
 from shared.utils import get_input
 from . import solution1, solution2
 
@@ -40,11 +41,23 @@ class TestSolution1(TestSolution):
 
 class TestSolution2(TestSolution):
     module = solution2
-    expected = 2047
+    expected = 6
 
     def test_solver(self):
         solution = self.module.solve(self.input_text)
         self.assertEqual(self.expected, solution)
 
+    def test_divisor_sum(self):
+        # Sums the divisors of 60 + 600,000 with 1 in register 0, which
+        # takes far too long without recognising the loops doing it
+        program = [
+            line.format(part1=60, extra=600_000) for line in DAY19_PROGRAM
+        ]
+        self.assertEqual(168, self.module.solve(program))
+        self.assertEqual(
+            sum(i for i in range(1, 600_061) if 600_060 % i == 0),
+            self.module.solve(program, 1)
+        )
+
 if __name__ == '__main__':
     unittest.main()
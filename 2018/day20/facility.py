@@ -1,9 +1,10 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-
 from operator import itemgetter
 
+from shared.search import bfs
+
 
 class Node:
     def __init__(self, x=0, y=0, distance=0, directory=None):
@@ -14,21 +15,14 @@ class Node:
         self.directory = directory or {}
         self.directory[(x, y)] = self
 
-    def update_distance(self, n):
-        if self.distance > n:
-            self.distance = n
-            for child in self.children:
-                child.update_distance(n + 1)
-
     def add_child(self, child_node):
         self.children.append(child_node)
 
     def create_child(self, x, y):
         if (x, y) in self.directory:
             child_node = self.directory[(x, y)]
-            child_node.update_distance(self.distance + 1)
         else:
-            child_node = Node(x, y, self.distance + 1, self.directory)
+            child_node = Node(x, y, directory=self.directory)
 
         self.add_child(child_node)
         return child_node
@@ -52,6 +46,7 @@ class FacilityMap:
     def __init__(self, path_regex="^$"):
         self.tree = Node()
         self.parse(self.tree, path_regex)
+        self.update_distances()
 
     def parse(self, node, path_regex, start=1):
         parent_node = node
@@ -70,6 +65,15 @@ class FacilityMap:
         if path_regex[start] != "$":
             return start
 
+    def update_distances(self):
+        # Once every door's known, rather than as they're found, which used to
+        # mean walking everything past a room again each time a shorter route
+        # to it turned up
+        distances = bfs([self.tree], lambda node: node.children)
+
+        for node, distance in distances.items():
+            node.distance = distance
+
     def _translate(self, x, y, d):
         dx, dy = self.directions[d]
         return (x + dx, y + dy)
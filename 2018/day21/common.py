@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+
+def get_halting_check(program):
+    # Register 0 is only ever read by the comparison deciding whether to
+    # halt, against the value the program has just worked out. Returns the
+    # comparison's instruction number and the register holding that value.
+    for n, (opcode, a, b, c) in enumerate(program.instructions):
+        if opcode == "eqrr" and 0 in (a, b):
+            return n, b if a == 0 else a
+
+    raise ValueError("Program never compares anything with register 0")
+
+
+def get_halting_values(program):
+    # Every value compared with register 0 in turn, any of which register 0
+    # could start with to halt the program there. Register 0 is left alone,
+    # so the program carries on (forever, if nothing stops it) afterwards.
+    check, register = get_halting_check(program)
+
+    while True:
+        program.execute(until=check)
+
+        if not program.can_execute():
+            return
+
+        yield program.register[register]
+        program.step()
+
+
+def get_first_and_last_unique(values, bits=24):
+    # The first value and the last before any repeats. Values fitting in
+    # bits (all of them, for the program's 24-bit hash) are marked off in a
+    # bitmap, 2 MB for 24 bits, rather than a set that grows with them.
+    seen = bytearray((1 << bits) // 8 + 1)
+    others = set()
+    first = last = None
+
+    for value in values:
+        if 0 <= value < 1 << bits:
+            byte, bit = value >> 3, 1 << (value & 7)
+
+            if seen[byte] & bit:
+                break
+            seen[byte] |= bit
+
+        elif value in others:
+            break
+        else:
+            others.add(value)
+
+        if first is None:
+            first = value
+        last = value
+
+    return first, last
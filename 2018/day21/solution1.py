@@ -1,43 +1,27 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+from pathlib import Path
 
-def solve():
-    one = two = three = five = 0
+from shared.elfcode import Program
+from .common import get_halting_values
 
-    five = 65_536
-    two = 2_238_642
 
-    end = False
-    while not end:
-        three = five & 255
-        two += three
-        two &= 16_777_215
-        two *= 65_899
-        two &= 16_777_215
-
-        if 256 > five:
-            break
-
-        three = 0
-
-        while five >= 256:
-            one = three + 1
-            one *= 256
-            if one > five:
-                five = three
-                break
-            three += 1
-
-    return two
+def solve(input_text):
+    # The program halts soonest if register 0 holds the first value it's
+    # compared with
+    return next(get_halting_values(Program(input_text)))
 
 
 if __name__ == '__main__':
+    from shared.utils import get_input
     from timeit import default_timer as timer
 
     start = timer()
 
-    solution = solve()
+    input_path = Path(__file__).parent.joinpath("input.txt")
+    input_text = get_input(input_path)
+    solution = solve(input_text)
     print(solution)
 
     end = timer()
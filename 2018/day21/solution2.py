@@ -1,48 +1,30 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+from pathlib import Path
 
-def solve():
-    one = two = three = five = 0
-    last_new_two = None
-    twos_found = set()
-
-    while True:
-        five = two | 65_536
-        two = 2_238_642
-
-        while True:
-            three = five & 255
-            two += three
-            two &= 16_777_215
-            two *= 65_899
-            two &= 16_777_215
-
-            if 256 > five:
-                if two in twos_found:
-                    return last_new_two
-                else:
-                    last_new_two = two
-                    twos_found.add(two)
-
-                break
-
-            three = 0
-            while five >= 256:
-                one = three + 1
-                one *= 256
-                if one > five:
-                    five = three
-                    break
-                three += 1
+from shared.elfcode import Program
+from .common import get_first_and_last_unique, get_halting_values
+
+
+def solve(input_text):
+    # The values compared with register 0 eventually repeat; the program
+    # runs longest (while still halting) with the last one before they do
+    values = get_halting_values(Program(input_text))
+    first, last = get_first_and_last_unique(values)
+
+    return last
 
 
 if __name__ == '__main__':
+    from shared.utils import get_input
     from timeit import default_timer as timer
 
     start = timer()
 
-    solution = solve()
+    input_path = Path(__file__).parent.joinpath("input.txt")
+    input_text = get_input(input_path)
+    solution = solve(input_text)
     print(solution)
 
     end = timer()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from itertools import islice
+import unittest
+
+from shared.elfcode import Program
+from shared.generators import DAY21_PROGRAM
+from . import solution1, solution2
+from .common import (
+    get_first_and_last_unique, get_halting_check, get_halting_values
+)
+
+
+class TestSolution(unittest.TestCase):
+    module = None
+    seed = 2_238_642
+    expected = None
+
+    def setUp(self):
+        if self.module is None:
+            raise NotImplementedError(
+                "subclasses of TestSolution must provide module to test"
+            )
+        if self.expected is None:
+            raise NotImplementedError(
+                "subclasses of TestSolution must provide expected value"
+            )
+        self.input_text = [line.format(seed=self.seed)
+                           for line in DAY21_PROGRAM]
+
+
+class TestCommon(TestSolution):
+    module = solution1
+    expected = [13_970_209, 9_646_979, 15_549_307]
+
+    def test_get_halting_check(self):
+        self.assertEqual((28, 2), get_halting_check(Program(self.input_text)))
+
+    def test_get_halting_values(self):
+        values = get_halting_values(Program(self.input_text))
+        self.assertEqual(self.expected, list(islice(values, 3)))
+
+    def test_halts(self):
+        program = Program(self.input_text, [self.expected[1], 0, 0, 0, 0, 0])
+        self.assertEqual(self.expected[:2],
+                         list(get_halting_values(program)))
+        self.assertFalse(program.can_execute())
+
+    def test_get_first_and_last_unique(self):
+        self.assertEqual((5, 2), get_first_and_last_unique([5, 7, 2, 7, 1]))
+        self.assertEqual((5, 1), get_first_and_last_unique([5, 7, 2, 1]))
+        self.assertEqual(
+            (-1, 1 << 30),
+            get_first_and_last_unique([-1, 3, 1 << 30, -1, 3], bits=8)
+        )
+
+
+class TestSolution1(TestSolution):
+    module = solution1
+    expected = 13_970_209
+
+    def test_solver(self):
+        solution = self.module.solve(self.input_text)
+        self.assertEqual(self.expected, solution)
+
+
+class TestSolution2(TestSolution):
+    module = solution2
+    expected = 6_267_260
+
+    def test_solver(self):
+        solution = self.module.solve(self.input_text)
+        self.assertEqual(self.expected, solution)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,8 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from collections import defaultdict
-import math
+from shared.grid import CharGrid, Grid
+from shared.search import astar
 
 
 class Caves:
@@ -20,30 +20,33 @@ class Caves:
         self.create_caverns(x + 1, y + 1)
 
     def get_geology(self, x, y):
-        return self.geology[y][x]
+        return self.geology.get(x, y)
 
     def get_erosion(self, x, y):
-        return self.erosion[y][x]
+        return self.erosion.get(x, y)
 
     def get_type(self, x, y):
-        return self.caves[y][x]
+        return self.caves.get(x, y)
 
     def get_risk(self, x, y):
         return self.cave_risks[self.get_type(x, y)]
 
     def set_geology(self, x, y):
+        self.extend(x, y)
+
         if (x, y) in [(0, 0), self.target]:
-            self.geology[y][x] = 0
+            geology = 0
         elif y == 0:
-            self.geology[y][x] = x * 16_807
+            geology = x * 16_807
         elif x == 0:
-            self.geology[y][x] = y * 48_271
+            geology = y * 48_271
         else:
-            self.geology[y][x] = self.get_erosion(
-                x, y - 1) * self.get_erosion(x - 1, y)
+            geology = self.get_erosion(x, y - 1) * self.get_erosion(x - 1, y)
+
+        self.geology.set(x, y, geology)
 
     def set_erosion(self, x, y):
-        self.erosion[y][x] = (self.get_geology(x, y) + self.depth) % 20_183
+        self.erosion.set(x, y, (self.get_geology(x, y) + self.depth) % 20_183)
 
     def set_cave_type(self, x, y):
         cave_types = ".=|"
@@ -55,26 +58,68 @@ class Caves:
         else:
             cave_type = cave_types[self.get_erosion(x, y) % 3]
 
-        self.caves[y][x] = cave_type
+        self.caves.set(x, y, cave_type)
 
     def create_caverns(self, width, height):
-        self.geology = defaultdict(lambda: defaultdict(lambda: None))
-        self.erosion = defaultdict(lambda: defaultdict(lambda: None))
-        self.caves = defaultdict(lambda: defaultdict(lambda: None))
+        # width and height cover the squares set so far; the grids behind
+        # them can be bigger, to leave room for the caves to grow into
+        self.width = width
+        self.height = height
+        self.geology = Grid(width, height)
+        self.erosion = Grid(width, height)
+        self.caves = CharGrid(width, height, " ")
 
         for y in range(height):
             for x in range(width):
-                self.set_geology(x, y)
-                self.set_erosion(x, y)
-                self.set_cave_type(x, y)
+                self.set_cave(x, y)
+
+    def set_cave(self, x, y):
+        self.set_geology(x, y)
+        self.set_erosion(x, y)
+        self.set_cave_type(x, y)
+
+    def grow(self, width, height):
+        # Squares depend on those above and to the left, so fill in any new
+        # columns for the existing rows before adding new rows
+        old_width = self.width
+        old_height = self.height
+
+        for y in range(old_height):
+            for x in range(old_width, width):
+                self.set_cave(x, y)
+
+        for y in range(old_height, height):
+            for x in range(max(width, old_width)):
+                self.set_cave(x, y)
+
+    def extend(self, x, y):
+        # Makes room for (x, y), doubling the size of the grids whenever
+        # they're outgrown so that growing a row or column at a time doesn't
+        # copy them every time
+        self.width = max(self.width, x + 1)
+        self.height = max(self.height, y + 1)
+
+        if self.width > self.caves.width or self.height > self.caves.height:
+            width = self.caves.width
+            height = self.caves.height
+
+            if self.width > width:
+                width = max(self.width, width * 2)
+            if self.height > height:
+                height = max(self.height, height * 2)
+
+            self.geology.resize(width, height)
+            self.erosion.resize(width, height)
+            self.caves.resize(width, height, " ")
 
     def __str__(self):
         return "\n".join(
-            "".join(row.values()) for row in self.caves.values()
+            self.caves.row(y)[:self.width] for y in range(self.height)
         )
 
 
 class CaveNav:
+    equipment = "CTN"
     cave_equipment = {
         "M": ["C", "T"],
         "T": ["C", "T"],
@@ -85,7 +130,6 @@ class CaveNav:
 
     def __init__(self, depth, x, y):
         self.caves = Caves(depth, x, y)
-        self.routes = defaultdict(dict)
 
     def get_neighbouring_caves(self, x, y):
         neighbours = [
@@ -95,147 +139,52 @@ class CaveNav:
             (x + 1, y),  # right
         ]
 
-        height = len(self.caves.caves)
-        width = len(self.caves.caves[0])
-
         return set(
             (x, y) for (x, y) in neighbours
-            if 0 <= x < width and 0 <= y < height
+            if 0 <= x < self.caves.width and 0 <= y < self.caves.height
         )
 
     def get_valid_equipment(self, x, y):
         return self.cave_equipment[self.caves.get_type(x, y)]
 
-    def get_fastest_routes(self, x, y):
-        return self.routes[(x, y)]
+    def encode(self, x, y, equipment):
+        # Search states are packed into ints, which are much quicker to hash
+        # and compare than tuples
+        return (y << 16 | x) << 2 | self.equipment.index(equipment)
 
-    def update_fastest_routes(self, x, y):
-        updated = False
+    def decode(self, state):
+        position = state >> 2
+        return (position & 0xFFFF, position >> 16, self.equipment[state & 3])
 
-        equipment1, equipment2 = self.get_valid_equipment(x, y)
-        fastest1 = fastest2 = math.inf
+    def get_moves(self, state):
+        x, y, equipment = self.decode(state)
+        moves = []
 
-        # If this is the Mouth, return early
-        if x == y == 0:
-            self.routes[(x, y)] = {"C": 7, "T": 0}
-            return
-
-        # Get best neighbouring times for valid equipments
-        for neighbour in self.get_neighbouring_caves(x, y):
-            for equip, minutes in self.get_fastest_routes(*neighbour).items():
-
-                if equipment1 == equip:
-                    fastest1 = min(fastest1, minutes + 1)
-                elif equipment2 == equip:
-                    fastest2 = min(fastest2, minutes + 1)
-
-        # Fastest route may involve changing equipment after moving, also filter
-        # out equipment for which we have no route (fastest == math.inf)
-        fastest = {eq: f for (eq, f) in [
-            (equipment1, min(fastest1, fastest2 + 7)),
-            (equipment2, min(fastest2, fastest1 + 7))
-        ]
-            if f is not math.inf
-        }
-
-        # Compare to previously calculated routes, if they exist
-        current_routes = self.get_fastest_routes(x, y)
-
-        for equip, minutes in fastest.items():
-            if equip in current_routes:
-                if current_routes[equip] > minutes:
-                    current_routes[equip] = minutes
-                    updated = True
-            else:
-                updated = True
-                current_routes[equip] = minutes
-
-        # If we've updated/added times for any equipment on this square, check
-        # neighbouring squares that have already been completed and update if
-        # this provides a quicker route
-        if updated:
-            for neighbour in self.get_neighbouring_caves(x, y):
-                if neighbour in self.routes and self.routes[neighbour] != {}:
-                    self.update_fastest_routes(*neighbour)
+        # Grow the caves as the search reaches their edges
+        if x + 1 >= self.caves.width or y + 1 >= self.caves.height:
+            self.caves.grow(
+                max(self.caves.width, x + 2), max(self.caves.height, y + 2)
+            )
 
-    def get_fastest_route_to_target(self):
-        # TODO this function contains quite a bit of repetion - could refactor
-        # some of the growing map section at the end
+        for other in self.get_valid_equipment(x, y):
+            if other != equipment:
+                moves.append((self.encode(x, y, other), 7))
 
-        def manhattan_to_target(x, y):
-            x1, y1 = self.caves.target
-            return abs(x - x1) + abs(y - y1)
+        for x1, y1 in self.get_neighbouring_caves(x, y):
+            if equipment in self.get_valid_equipment(x1, y1):
+                moves.append((self.encode(x1, y1, equipment), 1))
 
-        height = len(self.caves.caves)
-        width = len(self.caves.caves[0])
+        return moves
 
-        for y in range(height):
-            for x in range(width):
-                self.update_fastest_routes(x, y)
-
-        any_faster = True
-
-        # for as long as we find a potential faster route, we grow our cave map
-        while any_faster:
-            # Get the current fastest route
-            fastest_route = self.get_fastest_routes(*self.caves.target)["T"]
-            any_faster = False
-
-            # Grow horizontally by one column
-            x = width
-            width += 1
-            y = 0
-
-            while y < height:
-                # Create new cell in cave
-                self.caves.set_geology(x, y)
-                self.caves.set_erosion(x, y)
-                self.caves.set_cave_type(x, y)
-
-                # Calculate fastest route for cell (updates all previous cells
-                # if faster route found as a result, so may update target)
-                self.update_fastest_routes(x, y)
-
-                routes = self.get_fastest_routes(x, y)
-
-                if routes:
-                    # Fastest possible route to target via this route, assuming
-                    # all connecting cells require no equipment changes
-                    latest_route = manhattan_to_target(x, y) + min(
-                        routes.values()
-                    )
-                    # If True, add another column and row
-                    if latest_route < fastest_route:
-                        any_faster = True
-
-                y += 1
-
-            # Grow vertically by one row
-            x = 0
-            height += 1
-
-            while x < width:
-                # Create new cell in cave
-                self.caves.set_geology(x, y)
-                self.caves.set_erosion(x, y)
-                self.caves.set_cave_type(x, y)
-
-                # Calculate fastest route for cell (updates all previous cells
-                # if faster route found as a result, so may update target)
-                self.update_fastest_routes(x, y)
-
-                routes = self.get_fastest_routes(x, y)
-
-                if routes:
-                    # Fastest possible route to target via this route, assuming
-                    # all connecting cells require no equipment changes
-                    latest_route = manhattan_to_target(x, y) + min(
-                        routes.values()
-                    )
-                    # If True, add another column and row
-                    if latest_route < fastest_route:
-                        any_faster = True
-
-                x += 1
-
-        return self.get_fastest_routes(*self.caves.target)["T"]
+    def get_fastest_route_to_target(self):
+        x1, y1 = self.caves.target
+        start = self.encode(0, 0, "T")
+        target = self.encode(x1, y1, "T")
+
+        def estimate(state):
+            # Can't be any quicker than walking straight there, and swapping
+            # to the torch on arrival if it's not already in hand
+            x, y, equipment = self.decode(state)
+            return abs(x - x1) + abs(y - y1) + (0 if equipment == "T" else 7)
+
+        return astar([start], self.get_moves, estimate, target)[target]
@@ -2,13 +2,10 @@
 # -*- coding: utf-8 -*-
 
 from pathlib import Path
-import sys
 
 from .common import parse
 from .caves import CaveNav
 
-sys.setrecursionlimit(10_000)
-
 
 def solve(input_text):
     depth, *target = parse(input_text)
@@ -133,54 +133,28 @@ class TestCaveNav(unittest.TestCase):
             ["T", "N"], cavenav.get_valid_equipment(1, 1)  # Narrow
         )
 
-    def test_get_fastest_routes(self):
+    def test_encode(self):
         cavenav = CaveNav(510, 2, 2)
-        self.assertEqual({}, cavenav.get_fastest_routes(0, 0))
+        state = cavenav.encode(2, 1, "N")
+        self.assertEqual((2, 1, "N"), cavenav.decode(state))
+        self.assertNotEqual(state, cavenav.encode(1, 2, "N"))
 
-        cavenav.update_fastest_routes(0, 0)
-        self.assertEqual(
-            {"T": 0, "C": 7}, cavenav.get_fastest_routes(0, 0)
-        )
-
-    def test_update_fastest_routes(self):
+    def test_get_moves(self):
         cavenav = CaveNav(510, 2, 2)
-        cavenav.update_fastest_routes(0, 0)
-        self.assertEqual(
-            {"T": 0, "C": 7}, cavenav.get_fastest_routes(0, 0)
-        )
-
-        cavenav.update_fastest_routes(1, 0)
+        moves = cavenav.get_moves(cavenav.encode(0, 0, "T"))
         self.assertEqual(
-            {"T": 0, "C": 7}, cavenav.get_fastest_routes(0, 0)
-        )
-        self.assertEqual(
-            {"C": 8, "N": 15}, cavenav.get_fastest_routes(1, 0)
+            {(0, 0, "C", 7), (0, 1, "T", 1)},
+            set((*cavenav.decode(state), minutes) for state, minutes in moves)
         )
 
-        cavenav.update_fastest_routes(1, 1)
-        self.assertEqual(
-            {"T": 0, "C": 7}, cavenav.get_fastest_routes(0, 0)
-        )
-        self.assertEqual(
-            {"C": 8, "N": 15}, cavenav.get_fastest_routes(1, 0)
-        )
-        self.assertEqual(
-            {"T": 23, "N": 16}, cavenav.get_fastest_routes(1, 1)
-        )
+    def test_get_moves_grows_caves(self):
+        cavenav = CaveNav(510, 2, 2)
+        cavenav.get_moves(cavenav.encode(2, 2, "T"))
+        self.assertEqual((4, 4), (cavenav.caves.width, cavenav.caves.height))
 
-        cavenav.update_fastest_routes(0, 1)
-        self.assertEqual(
-            {"T": 0, "C": 7}, cavenav.get_fastest_routes(0, 0)
-        )
-        self.assertEqual(
-            {"C": 8, "N": 10}, cavenav.get_fastest_routes(1, 0)
-        )
-        self.assertEqual(
-            {"T": 2, "N": 9}, cavenav.get_fastest_routes(1, 1)
-        )
-        self.assertEqual(
-            {"T": 1, "C": 8}, cavenav.get_fastest_routes(0, 1)
-        )
+        caves = Caves(510, 2, 2)
+        caves.create_caverns(4, 4)
+        self.assertEqual(str(caves), str(cavenav.caves))
 
     def test_get_fastest_route_to_target(self):
         cavenav = CaveNav(510, 2, 2)
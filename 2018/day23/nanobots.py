@@ -3,6 +3,9 @@
 
 import re
 
+from shared.cache import cached_parser
+from shared.parsing import integer_rows, rows
+
 nanobot_regex = re.compile("^pos=<(-?\d+),(-?\d+),(-?\d+)>, r=(\d+)$")
 
 
@@ -13,6 +16,11 @@ def parse_nanobot(string):
     return Nanobot(x, y, z, r)
 
 
+@cached_parser()
+def parse_nanobots(input_text):
+    return [Nanobot(*row) for row in rows(integer_rows(input_text, 4), 4)]
+
+
 class Nanobot:
     def __init__(self, x, y, z, r):
         self.x = x
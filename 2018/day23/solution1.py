@@ -4,11 +4,11 @@
 from operator import attrgetter
 from pathlib import Path
 
-from .nanobots import parse_nanobot
+from .nanobots import parse_nanobots
 
 
 def solve(input_text):
-    bots = [parse_nanobot(line) for line in input_text]
+    bots = parse_nanobots(input_text)
     largest = max(bots, key=attrgetter("range"))
     return sum(largest.in_range(*bot.pos) for bot in bots)
 
@@ -4,7 +4,7 @@
 from operator import attrgetter, itemgetter
 from pathlib import Path
 
-from .nanobots import parse_nanobot
+from .nanobots import parse_nanobots
 
 
 def distance_from_origin(pos):
@@ -16,7 +16,7 @@ def bots_in_range(bots, x, y, z):
 
 
 def solve(input_text):
-    bots = [parse_nanobot(line) for line in input_text]
+    bots = parse_nanobots(input_text)
 
     # Calculate the best position of those the bots are in - we'll aim to better
     # this
@@ -6,7 +6,7 @@ import unittest
 
 from shared.utils import get_input
 from . import solution1, solution2
-from .nanobots import Nanobot, parse_nanobot
+from .nanobots import Nanobot, parse_nanobot, parse_nanobots
 
 
 SOLUTION_DIR = Path(__file__).parent
@@ -75,6 +75,17 @@ class TestNanobot(unittest.TestCase):
         self.assertEqual((-13, -22, -31), bot.pos)
         self.assertEqual(100, bot.range)
 
+    def test_parse_nanobots(self):
+        bots = parse_nanobots([
+            "pos=<0,0,0>, r=0",
+            "pos=<11,22,33>, r=10",
+            "pos=<-13,-22,-31>, r=100",
+        ])
+
+        self.assertEqual([(0, 0, 0), (11, 22, 33), (-13, -22, -31)],
+                         [bot.pos for bot in bots])
+        self.assertEqual([0, 10, 100], [bot.range for bot in bots])
+
 
 class TestSolution1(TestSolution):
     module = solution1
@@ -0,0 +1,258 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import argparse
+import asyncio
+import json
+import os
+from pathlib import Path
+import platform
+import sys
+from timeit import default_timer as timer
+
+from shared.profiling import DEFAULT_OUTPUT_DIR, PROFILERS
+from .solutions import (
+    DEFAULT_ANSWER_CACHE,
+    ROOT_DIR,
+    discover_days,
+    discover_parts,
+    enable_checkpoints,
+    enable_parse_cache,
+    enable_profiling,
+)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="runner",
+        description="Run the 2018 solutions and report how long they take",
+    )
+    parser.add_argument("days", metavar="DAY", type=int, nargs="*",
+                        help="days to run (default: all of them)")
+    parser.add_argument("-p", "--part", type=int, action="append",
+                        dest="parts", help="part to run (repeatable)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(),
+                        help="number of worker processes")
+    parser.add_argument("-t", "--timeout", type=float,
+                        help="seconds to give each day/part before "
+                             "stopping it")
+    parser.add_argument("-m", "--memory-limit", type=int,
+                        help="MiB of address space each day/part may use")
+    parser.add_argument("--json", action="store_true",
+                        help="write results to stdout as JSON")
+    parser.add_argument("--no-cache", action="store_false",
+                        dest="cache",
+                        help="solve every day even if its answer is cached")
+    parser.add_argument("--parse-cache", action="store_true",
+                        help="cache parsed inputs on disk between runs")
+    parser.add_argument("--checkpoint", action="store_true",
+                        help="save long simulations as they go, and resume "
+                             "them if stopped")
+    parser.add_argument("--profile", action="append", dest="profilers",
+                        choices=PROFILERS + ("all",),
+                        help="profile each solve() call (repeatable)")
+    parser.add_argument("--profile-dir", type=Path,
+                        default=DEFAULT_OUTPUT_DIR,
+                        help="directory to write profiles to")
+    return parser.parse_args(argv)
+
+
+def get_jobs(days, parts):
+    jobs = []
+
+    for day in days:
+        for part in discover_parts(day):
+            if not parts or part in parts:
+                jobs.append((day, part))
+
+    return jobs
+
+
+def get_worker_command(job, answer_cache=None, memory_limit=None):
+    day, part = job
+    command = [sys.executable, "-m", "runner.worker", str(day), str(part)]
+
+    if answer_cache is not None:
+        command += ["--answer-cache", str(answer_cache)]
+    if memory_limit is not None:
+        command += ["--memory-limit", str(memory_limit)]
+
+    return command
+
+
+def make_failed_result(job, error, wall=None, timed_out=False):
+    day, part = job
+    return {
+        "day": day,
+        "part": part,
+        "answer": None,
+        "error": error,
+        "cached": False,
+        "timed_out": timed_out,
+        "wall": wall,
+        "cpu": None,
+        "peak_rss": None,
+    }
+
+
+def read_worker_result(job, returncode, stdout, stderr):
+    lines = stdout.decode().splitlines()
+
+    if returncode == 0 and lines:
+        try:
+            result = json.loads(lines[-1])
+        except ValueError:
+            pass
+        else:
+            result["timed_out"] = False
+            return result
+
+    # Killed, eg. by the kernel for using too much memory, or died some other
+    # way before it could report back
+    details = stderr.decode().strip().splitlines()
+    error = "Worker exited with code {}".format(returncode)
+    if details:
+        error += ": " + details[-1]
+    return make_failed_result(job, error)
+
+
+async def run_worker(job, semaphore, answer_cache=None, timeout=None,
+                     memory_limit=None):
+    # A fresh process per job keeps each peak RSS reading independent, and
+    # means a job can be stopped without affecting any others
+    command = get_worker_command(job, answer_cache, memory_limit)
+
+    async with semaphore:
+        start = timer()
+        process = await asyncio.create_subprocess_exec(
+            *command, cwd=str(ROOT_DIR),
+            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+        )
+
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(),
+                                                    timeout)
+        except asyncio.TimeoutError:
+            return make_failed_result(
+                job, "Timed out after {}s".format(timeout),
+                wall=timer() - start, timed_out=True,
+            )
+        finally:
+            # Timed out or cancelled
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+
+    return read_worker_result(job, process.returncode, stdout, stderr)
+
+
+async def run_workers(jobs, num_processes, report, **options):
+    semaphore = asyncio.Semaphore(num_processes)
+    tasks = [
+        asyncio.ensure_future(run_worker(job, semaphore, **options))
+        for job in jobs
+    ]
+    results = []
+
+    try:
+        for future in asyncio.as_completed(tasks):
+            result = await future
+            results.append(result)
+            if report is not None:
+                report(result)
+    finally:
+        # Only left to do if cancelled, when any jobs still running are
+        # stopped before going any further
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    return sorted(results, key=lambda result: (result["day"], result["part"]))
+
+
+def run_jobs(jobs, num_processes, answer_cache=None, timeout=None,
+             memory_limit=None, report=None):
+    # Runs jobs in parallel, passing each result to report as soon as it's
+    # ready whatever order they finish in; returns them all, in job order
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)  # for the child watcher on older Pythons
+
+    task = loop.create_task(run_workers(
+        jobs, num_processes, report, answer_cache=answer_cache,
+        timeout=timeout, memory_limit=memory_limit,
+    ))
+
+    try:
+        return loop.run_until_complete(task)
+    except KeyboardInterrupt:
+        task.cancel()
+        loop.run_until_complete(asyncio.gather(task, return_exceptions=True))
+        raise
+    finally:
+        loop.close()
+
+
+def format_result(result):
+    heading = "Day {:02} part {}".format(result["day"], result["part"])
+
+    if result["error"] is not None:
+        return "{}: {}".format(heading, result["error"])
+
+    if result["cached"]:
+        return "{}: {}\n    cached".format(
+            heading, result["answer"].replace("\n", "\n    ")
+        )
+
+    rss = result["peak_rss"]
+    return "{}: {}\n    {:.3f}s wall, {:.3f}s cpu, {} peak RSS".format(
+        heading,
+        result["answer"].replace("\n", "\n    "),
+        result["wall"],
+        result["cpu"],
+        "?" if rss is None else "{:.1f} MiB".format(rss / 1024),
+    )
+
+
+def print_result(result):
+    print(format_result(result), flush=True)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    days = args.days or discover_days()
+    jobs = get_jobs(days, args.parts)
+
+    if args.parse_cache:
+        enable_parse_cache()
+    if args.checkpoint:
+        enable_checkpoints()
+    if args.profilers:
+        enable_profiling(args.profilers, args.profile_dir)
+
+    answer_cache = DEFAULT_ANSWER_CACHE if args.cache else None
+
+    results = run_jobs(
+        jobs, max(1, args.jobs), answer_cache, args.timeout,
+        args.memory_limit, report=None if args.json else print_result,
+    )
+
+    hits = sum(result["cached"] for result in results)
+    if hits and not args.json:
+        print("{} of {} answers were cached".format(hits, len(results)))
+
+    timeouts = sum(result["timed_out"] for result in results)
+    if timeouts and not args.json:
+        print("{} of {} timed out".format(timeouts, len(results)))
+
+    if args.json:
+        json.dump({
+            "python": platform.python_version(),
+            "results": results,
+        }, sys.stdout, indent=2)
+        print()
+
+    return 0 if all(result["error"] is None for result in results) else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Solves one day against many input files (eg. a directory of other people's
+# inputs, to cross-check answers) and writes the answers and timings to a CSV
+# or JSON file.
+#
+# Unlike the main runner, worker processes are kept for the whole batch. The
+# day's modules are imported before the pool starts, so anything they work out
+# at import time (opcode tables, automaton rule tables...) is done once and
+# inherited by every worker, and anything they cache as they go (eg. day 12's
+# rule tables) carries over from one input to the next.
+
+import argparse
+import csv
+from functools import partial
+from glob import glob
+import json
+from multiprocessing import Pool
+import os
+from pathlib import Path
+import platform
+import sys
+
+from .solutions import (
+    discover_parts,
+    enable_parse_cache,
+    get_module,
+    run_solution,
+)
+
+
+FIELDS = ("input", "part", "answer", "error", "wall", "cpu")
+
+
+def find_inputs(patterns):
+    # Each pattern is a file, a directory (meaning every file in it) or a glob
+    paths = []
+
+    for pattern in patterns:
+        path = Path(pattern)
+
+        if path.is_dir():
+            matches = [child for child in path.iterdir() if child.is_file()]
+        elif path.exists():
+            matches = [path]
+        else:
+            matches = [Path(match) for match in glob(pattern)]
+            if not matches:
+                raise FileNotFoundError(
+                    "No input files match {}".format(pattern)
+                )
+
+        paths.extend(sorted(matches))
+
+    # The same file could be picked out by more than one pattern
+    return list(dict.fromkeys(paths))
+
+
+def preload(day, parts):
+    for part in parts:
+        get_module(day, part)
+
+
+def solve_input(job, day):
+    input_path, part = job
+    result = run_solution(day, part, input_path)
+    result["input"] = str(input_path)
+    return {field: result[field] for field in FIELDS}
+
+
+def run_batch(day, parts, input_paths, num_processes):
+    # Yields results in the same order as the inputs, each input's parts
+    # together
+    jobs = [(path, part) for path in input_paths for part in parts]
+    preload(day, parts)
+
+    # Parent and workers alike get the modules ready before the first job
+    with Pool(num_processes, initializer=preload,
+              initargs=(day, parts)) as pool:
+        run = partial(solve_input, day=day)
+        chunksize = max(1, len(jobs) // (num_processes * 4))
+        for result in pool.imap(run, jobs, chunksize):
+            yield result
+
+
+def write_csv(outfile, results):
+    writer = csv.DictWriter(outfile, FIELDS, lineterminator="\n")
+    writer.writeheader()
+    writer.writerows(results)
+
+
+def write_json(outfile, day, results):
+    json.dump({
+        "python": platform.python_version(),
+        "day": day,
+        "results": results,
+    }, outfile, indent=2)
+    outfile.write("\n")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="runner.batch",
+        description="Solve one day against many input files",
+    )
+    parser.add_argument("day", metavar="DAY", type=int,
+                        help="day to solve")
+    parser.add_argument("inputs", metavar="INPUT", nargs="+",
+                        help="input files, directories of them or globs")
+    parser.add_argument("-p", "--part", type=int, action="append",
+                        dest="parts", help="part to run (repeatable)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(),
+                        help="number of worker processes")
+    parser.add_argument("-o", "--output", type=Path,
+                        help="file to write results to (default: stdout)")
+    parser.add_argument("-f", "--format", choices=("csv", "json"),
+                        help="output format (default: from the output "
+                             "file's extension, or CSV)")
+    parser.add_argument("--parse-cache", action="store_true",
+                        help="cache parsed inputs on disk between runs")
+    return parser.parse_args(argv)
+
+
+def get_format(args):
+    if args.format is not None:
+        return args.format
+    if args.output is not None and args.output.suffix.lower() == ".json":
+        return "json"
+    return "csv"
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    parts = args.parts or discover_parts(args.day)
+    input_paths = find_inputs(args.inputs)
+
+    if args.parse_cache:
+        enable_parse_cache()
+
+    results = list(run_batch(args.day, parts, input_paths,
+                             max(1, args.jobs)))
+
+    outfile = sys.stdout if args.output is None else open(args.output, "w",
+                                                          newline="")
+    try:
+        if get_format(args) == "json":
+            write_json(outfile, args.day, results)
+        else:
+            write_csv(outfile, results)
+    finally:
+        if outfile is not sys.stdout:
+            outfile.close()
+
+    errors = sum(result["error"] is not None for result in results)
+    if errors:
+        print("{} of {} solves failed".format(errors, len(results)),
+              file=sys.stderr)
+
+    return 0 if not errors else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,242 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import argparse
+from datetime import datetime
+import json
+import os
+from pathlib import Path
+import platform
+import sys
+from timeit import default_timer as timer
+
+from shared.generators import REAL_SIZES, generate
+from .solutions import (
+    ROOT_DIR,
+    build_solve_arguments,
+    discover_days,
+    discover_parts,
+    enable_parse_cache,
+    get_module,
+    read_input,
+)
+
+
+DEFAULT_BASELINE = ROOT_DIR.joinpath("benchmark_baseline.json")
+
+
+def get_cpu_name():
+    try:
+        with open("/proc/cpuinfo") as infile:
+            for line in infile:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+
+    return platform.processor() or None
+
+
+def get_machine_info():
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu": get_cpu_name(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def percentile(sorted_values, fraction):
+    # Linear interpolation between the closest ranks
+    position = (len(sorted_values) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    weight = position - lower
+    return sorted_values[lower] * (1 - weight) + sorted_values[upper] * weight
+
+
+def summarise(timings):
+    timings = sorted(timings)
+    return {
+        "runs": len(timings),
+        "min": timings[0],
+        "median": percentile(timings, 0.5),
+        "p90": percentile(timings, 0.9),
+        "max": timings[-1],
+    }
+
+
+def get_key(day, part, size):
+    return "day{:02}/part{}/x{}".format(day, part, size)
+
+
+def scale_input(day, input_text, size):
+    # Bigger inputs are generated at a multiple of the real input's size, for
+    # the days where that's meaningful and the input format allows it
+    if size == 1:
+        return input_text
+
+    if day not in REAL_SIZES:
+        return None
+
+    try:
+        return generate(day, REAL_SIZES[day] * size)
+    except ValueError:
+        return None
+
+
+def time_solution(day, part, input_text, repeat):
+    solve = get_module(day, part).solve
+    timings = []
+
+    for _ in range(repeat):
+        # Some parsers consume their input, so give each run a fresh copy
+        args = build_solve_arguments(
+            day, part, None if input_text is None else list(input_text)
+        )
+
+        start = timer()
+        solve(*args)
+        timings.append(timer() - start)
+
+    return timings
+
+
+def run_benchmarks(days, parts, sizes, repeat, log=None):
+    results = {}
+
+    for day in days:
+        input_text = read_input(day)
+
+        for size in sizes:
+            scaled = scale_input(day, input_text, size)
+            if size != 1 and scaled is None:
+                continue
+
+            for part in discover_parts(day):
+                if parts and part not in parts:
+                    continue
+
+                key = get_key(day, part, size)
+                results[key] = summarise(
+                    time_solution(day, part, scaled, repeat)
+                )
+
+                if log is not None:
+                    log(key, results[key])
+
+    return results
+
+
+def load_baseline(path):
+    try:
+        with open(path) as infile:
+            return json.load(infile)
+    except FileNotFoundError:
+        return {"runs": []}
+
+
+def save_run(path, run):
+    baseline = load_baseline(path)
+    baseline["runs"].append(run)
+
+    with open(path, "w") as outfile:
+        json.dump(baseline, outfile, indent=2)
+
+
+def find_regressions(results, baseline_results, threshold):
+    regressions = []
+
+    for key, summary in sorted(results.items()):
+        previous = baseline_results.get(key)
+        if previous is None:
+            continue
+
+        if summary["median"] > previous["median"] * (1 + threshold):
+            regressions.append((key, previous["median"], summary["median"]))
+
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="runner.benchmark",
+        description="Benchmark the 2018 solutions against a stored baseline",
+    )
+    parser.add_argument("days", metavar="DAY", type=int, nargs="*",
+                        help="days to benchmark (default: all of them)")
+    parser.add_argument("-p", "--part", type=int, action="append",
+                        dest="parts", help="part to run (repeatable)")
+    parser.add_argument("-s", "--sizes", type=int, nargs="+",
+                        default=[1, 10, 100],
+                        help="input size multipliers")
+    parser.add_argument("-r", "--repeat", type=int, default=5,
+                        help="number of timed runs per benchmark")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE,
+                        help="baseline file to compare against/save to")
+    parser.add_argument("--save", action="store_true",
+                        help="append this run to the baseline file")
+    parser.add_argument("--check", action="store_true",
+                        help="fail if slower than the latest baseline run")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed fractional slowdown of the median")
+    parser.add_argument("--parse-cache", action="store_true",
+                        help="cache parsed inputs on disk between runs")
+    return parser.parse_args(argv)
+
+
+def print_summary(key, summary):
+    print("{}: median {:.4f}s, p90 {:.4f}s ({} runs)".format(
+        key, summary["median"], summary["p90"], summary["runs"]
+    ))
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    days = args.days or discover_days()
+    machine = get_machine_info()
+
+    if args.parse_cache:
+        enable_parse_cache()
+
+    results = run_benchmarks(
+        days, args.parts, args.sizes, max(1, args.repeat), print_summary
+    )
+
+    exit_code = 0
+
+    if args.check:
+        runs = load_baseline(args.baseline)["runs"]
+
+        if not runs:
+            print("No baseline found at {}".format(args.baseline))
+            exit_code = 1
+        else:
+            previous = runs[-1]
+            if previous["machine"] != machine:
+                print("Warning: baseline was recorded on a different machine")
+
+            regressions = find_regressions(
+                results, previous["results"], args.threshold
+            )
+            for key, before, after in regressions:
+                print("REGRESSION {}: {:.4f}s -> {:.4f}s".format(
+                    key, before, after
+                ))
+            if regressions:
+                exit_code = 1
+
+    if args.save:
+        save_run(args.baseline, {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "machine": machine,
+            "results": results,
+        })
+
+    return exit_code
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,520 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Estimates how the running time and peak memory of each solution grow with
+# the size of its input, to find the ones that'll fall over on bigger inputs.
+# Every solution is run on generated inputs at geometrically increasing sizes,
+# and time = c * size^k fitted on a log-log scale to get the exponent k.
+# Anything growing faster than size * log(size) would over the same sizes is
+# flagged.
+#
+# Sizes are in each generator's own units (see shared.generators), and for the
+# 2017 scripts those given in SCRIPTS_2017. Peak memory is what tracemalloc
+# sees allocated while solving, measured in a separate run from the timed ones
+# as tracing slows everything down. Each size is measured in a process of its
+# own, so one taking too long can be stopped.
+
+import argparse
+from collections import namedtuple
+from contextlib import redirect_stdout
+import json
+from math import log
+from multiprocessing import Pool, TimeoutError
+import os
+from pathlib import Path
+import random
+import shutil
+import string
+import sys
+import tempfile
+from timeit import default_timer as timer
+import tracemalloc
+
+from shared.generators import REAL_SIZES, generate
+from shared.profiling import run_script
+from .solutions import (
+    ROOT_DIR,
+    build_solve_arguments,
+    discover_parts,
+    get_module,
+)
+
+
+DIR_2017 = ROOT_DIR.parent.joinpath("2017")
+
+# Added to the n log n exponent before an exponent counts as worse
+DEFAULT_TOLERANCE = 0.2
+
+
+class InputTooBig(Exception):
+    pass
+
+
+def generate_2017_d2(size, rng):
+    # Rows of 16 numbers, two of which divide evenly
+    rows = []
+
+    for _ in range(size):
+        row = [rng.randint(50, 5000) for _ in range(14)]
+        low = rng.randint(2, 500)
+        row += [low, low * rng.randint(2, 9)]
+        rng.shuffle(row)
+        rows.append("\t".join(str(n) for n in row))
+
+    return rows
+
+
+def generate_2017_d4(size, rng):
+    return [
+        " ".join(
+            "".join(rng.choice(string.ascii_lowercase)
+                    for _ in range(rng.randint(2, 7)))
+            for _ in range(rng.randint(4, 10))
+        )
+        for _ in range(size)
+    ]
+
+
+def generate_2017_d5(size, rng):
+    # Mostly backwards jumps, getting longer further into the list
+    return [str(rng.randint(-n, 2)) for n in range(size)]
+
+
+def generate_2017_d8(size, rng):
+    registers = ["".join(rng.choice(string.ascii_lowercase) for _ in range(3))
+                 for _ in range(30)]
+    operators = ["<", "<=", ">", ">=", "==", "!="]
+
+    return [
+        "{} {} {} if {} {} {}".format(
+            rng.choice(registers), rng.choice(("inc", "dec")),
+            rng.randint(-1000, 1000), rng.choice(registers),
+            rng.choice(operators), rng.randint(-10, 10),
+        )
+        for _ in range(size)
+    ]
+
+
+def generate_2017_d9(size, rng, max_depth=20):
+    # One outermost group of nested groups and garbage, some of it with
+    # cancelled characters
+    garbage_chars = ["a", "b", "c", "{", "}", "<", "'", "!>", "!!", "!a"]
+    pieces = ["{"]
+    length = 1
+    depth = 1
+    empty = True  # whether the innermost open group has anything in it yet
+
+    while depth:
+        choice = rng.random()
+
+        if length >= size or (depth > 1 and choice < 0.3):
+            piece = "}"
+            depth -= 1
+            empty = False
+        else:
+            piece = "" if empty else ","
+            if choice < 0.6 and depth < max_depth:
+                piece += "{"
+                depth += 1
+                empty = True
+            else:
+                piece += "<{}>".format("".join(
+                    rng.choice(garbage_chars) for _ in range(rng.randint(0, 8))
+                ))
+                empty = False
+
+        pieces.append(piece)
+        length += len(piece)
+
+    return ["".join(pieces)]
+
+
+def generate_2017_d11(size, rng):
+    directions = ["n", "ne", "se", "s", "sw", "nw"]
+    return [",".join(rng.choice(directions) for _ in range(size))]
+
+
+def generate_2017_d12(size, rng):
+    # Every program piped to at least one other, or itself if none
+    pipes = [set() for _ in range(size)]
+
+    for program in range(size):
+        for _ in range(rng.randint(0, 2)):
+            other = rng.randrange(size)
+            pipes[program].add(other)
+            pipes[other].add(program)
+
+    return [
+        "{} <-> {}".format(
+            program, ", ".join(str(n) for n in sorted(pipes[program] or
+                                                      {program}))
+        )
+        for program in range(size)
+    ]
+
+
+def real_input_2017(day):
+    with open(DIR_2017.joinpath(day, "input.txt")) as infile:
+        return infile.read().split("\n")
+
+
+def generate_2017_d25(size, rng):
+    # The real blueprint, run for size steps
+    lines = real_input_2017("d25")
+    lines[1] = "Perform a diagnostic checksum after {} steps.".format(size)
+    return lines
+
+
+def random_digits(size, rng):
+    return "".join(rng.choice(string.digits) for _ in range(size))
+
+
+# path is relative to the 2017 directory, and size the one to centre the
+# sizes tried on (big enough for the solving to outweigh running the script,
+# and small enough not to take all day). make_input(size, rng) gives the
+# lines to write to input_name (None for nothing to write) and the arguments
+# to run the script with.
+Script = namedtuple("Script", [
+    "day", "path", "input_name", "size", "make_input"
+])
+
+SCRIPTS_2017 = {
+    "d1/captcha.py one": Script(
+        1, "d1/captcha.py", None, 100000,
+        lambda size, rng: (None, ["one", random_digits(size, rng)]),
+    ),
+    "d1/captcha.py two": Script(
+        1, "d1/captcha.py", None, 100000,
+        lambda size, rng: (None, ["two", random_digits(size, rng)]),
+    ),
+    "d2/checksum.py": Script(
+        2, "d2/checksum.py", "spreadsheet.txt", 1000,
+        lambda size, rng: (generate_2017_d2(size, rng), []),
+    ),
+    "d4/passphrase.py": Script(
+        4, "d4/passphrase.py", "passphrases.txt", 10000,
+        lambda size, rng: (generate_2017_d4(size, rng), []),
+    ),
+    "d5/jumps.py": Script(
+        5, "d5/jumps.py", "input.txt", 250,
+        lambda size, rng: (generate_2017_d5(size, rng), []),
+    ),
+    "d8/registers.py": Script(
+        8, "d8/registers.py", "input.txt", 10000,
+        lambda size, rng: (generate_2017_d8(size, rng), []),
+    ),
+    "d9/streams.py": Script(
+        9, "d9/streams.py", "input.txt", 50000,
+        lambda size, rng: (generate_2017_d9(size, rng), []),
+    ),
+    "d11/infinite.py": Script(
+        11, "d11/infinite.py", "input.txt", 2000,
+        lambda size, rng: (generate_2017_d11(size, rng), []),
+    ),
+    "d12/plumber.py": Script(
+        12, "d12/plumber.py", "input.txt", 2000,
+        lambda size, rng: (generate_2017_d12(size, rng), []),
+    ),
+    "d22/virus1.py": Script(
+        22, "d22/virus1.py", "input.txt", 100000,
+        lambda size, rng: (real_input_2017("d22"), [str(size)]),
+    ),
+    "d22/virus2.py": Script(
+        22, "d22/virus2.py", "input.txt", 500000,
+        lambda size, rng: (real_input_2017("d22"), [str(size)]),
+    ),
+    "d25/turing.py": Script(
+        25, "d25/turing.py", "input.txt", 1000000,
+        lambda size, rng: (generate_2017_d25(size, rng), []),
+    ),
+}
+
+
+def measure(call, repeat):
+    # (seconds, peak bytes) of call(), the time being the fastest of repeat
+    # runs
+    timings = []
+
+    for _ in range(repeat):
+        start = timer()
+        call()
+        timings.append(timer() - start)
+
+    tracemalloc.start()
+    try:
+        call()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return min(timings), peak
+
+
+def measure_2018(day, part, size, seed, repeat):
+    try:
+        input_text = generate(day, size, seed)
+    except ValueError as e:
+        raise InputTooBig(str(e))
+
+    solve = get_module(day, part).solve
+
+    def call():
+        # Some parsers consume their input, so give each run a fresh copy
+        solve(*build_solve_arguments(day, part, list(input_text)))
+
+    return measure(call, repeat)
+
+
+def measure_2017(name, size, seed, repeat):
+    script = SCRIPTS_2017[name]
+    lines, args = script.make_input(size, random.Random(seed))
+    source_dir = DIR_2017.joinpath(script.path).parent
+
+    # The scripts read their input from their own directory, so run copies of
+    # them from one holding the generated input instead
+    with tempfile.TemporaryDirectory() as directory:
+        for path in source_dir.glob("*.py"):
+            shutil.copy(str(path), directory)
+        if lines is not None:
+            input_path = os.path.join(directory, script.input_name)
+            with open(input_path, "w") as outfile:
+                # Like the real inputs, without a newline at the end
+                outfile.write("\n".join(lines))
+
+        path = Path(directory, Path(script.path).name)
+
+        def call():
+            with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+                run_script(path, args)
+
+        return measure(call, repeat)
+
+
+def measure_with_timeout(function, args, timeout):
+    # function(*args) in a process of its own, or None if it takes longer
+    # than timeout seconds
+    with Pool(1, maxtasksperchild=1) as pool:
+        result = pool.apply_async(function, args)
+        try:
+            return result.get(timeout)
+        except TimeoutError:
+            return None
+
+
+def get_sizes(centre, steps, factor):
+    # steps sizes increasing by factor, centred on centre (eg. the real
+    # input's size): steps // 2 below it, it, then the rest above it. Sizes
+    # below 2 are left out.
+    sizes = []
+    size = centre
+
+    for _ in range(steps // 2):
+        size //= factor
+
+    for _ in range(steps):
+        if size >= 2:
+            sizes.append(size)
+        size *= factor
+
+    return sizes
+
+
+def fit_exponent(sizes, values):
+    # Least squares slope of log(value) against log(size)
+    if len(sizes) < 2:
+        return None
+
+    xs = [log(size) for size in sizes]
+    ys = [log(max(value, 1e-9)) for value in values]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+
+    return (
+        sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) /
+        sum((x - mean_x) ** 2 for x in xs)
+    )
+
+
+def get_limit(sizes, tolerance=DEFAULT_TOLERANCE):
+    # The exponent n log n would be fitted over these sizes, plus tolerance
+    return fit_exponent(sizes, [size * log(size) for size in sizes]) + \
+        tolerance
+
+
+def analyse(name, function, sizes, arguments, timeout, log=None):
+    # Measures each size in turn until one takes longer than timeout or
+    # fails
+    result = {
+        "name": name,
+        "sizes": [],
+        "times": [],
+        "peaks": [],
+        "timed_out": None,
+        "error": None,
+    }
+
+    for size in sizes:
+        try:
+            measured = measure_with_timeout(function, arguments(size),
+                                            timeout)
+        except InputTooBig:
+            break
+        except Exception as e:
+            result["error"] = "{}: {} at {}".format(type(e).__name__, e, size)
+            break
+
+        if measured is None:
+            result["timed_out"] = size
+            break
+
+        result["sizes"].append(size)
+        result["times"].append(measured[0])
+        result["peaks"].append(measured[1])
+
+        if log is not None:
+            log(name, size, *measured)
+
+    result["time_exponent"] = fit_exponent(result["sizes"], result["times"])
+    result["memory_exponent"] = fit_exponent(result["sizes"],
+                                             result["peaks"])
+    return result
+
+
+def flag(result, tolerance=DEFAULT_TOLERANCE):
+    # Which of time and memory grow faster than n log n
+    if len(result["sizes"]) < 2:
+        return []
+
+    limit = get_limit(result["sizes"], tolerance)
+    return [
+        kind for kind in ("time", "memory")
+        if result[kind + "_exponent"] > limit
+    ]
+
+
+def run_analyses(days, parts, years, steps, factor, repeat, timeout, seed,
+                 log=None):
+    results = []
+
+    if 2018 in years:
+        for day in days:
+            if day not in REAL_SIZES:
+                continue
+
+            sizes = get_sizes(REAL_SIZES[day], steps, factor)
+            for part in discover_parts(day):
+                if parts and part not in parts:
+                    continue
+
+                results.append(analyse(
+                    "2018 day{:02} part{}".format(day, part), measure_2018,
+                    sizes,
+                    lambda size: (day, part, size, seed, repeat),
+                    timeout, log,
+                ))
+
+    if 2017 in years:
+        for name, script in SCRIPTS_2017.items():
+            if script.day not in days:
+                continue
+
+            results.append(analyse(
+                "2017 " + name, measure_2017,
+                get_sizes(script.size, steps, factor),
+                lambda size: (name, size, seed, repeat),
+                timeout, log,
+            ))
+
+    return results
+
+
+def format_exponent(exponent):
+    return "      -" if exponent is None else "{:7.2f}".format(exponent)
+
+
+def format_table(results, tolerance=DEFAULT_TOLERANCE):
+    lines = ["{:<24} {:>16} {:>7} {:>7}  {}".format(
+        "Solution", "Sizes", "Time", "Memory", "Worse than n log n"
+    )]
+
+    for result in results:
+        sizes = result["sizes"]
+        size_range = "{}..{}".format(sizes[0], sizes[-1]) if sizes else "-"
+        flags = flag(result, tolerance)
+
+        if result["timed_out"] is not None:
+            flags.append("timed out at {}".format(result["timed_out"]))
+        if result["error"] is not None:
+            flags.append(result["error"])
+
+        lines.append("{:<24} {:>16} {} {}  {}".format(
+            result["name"], size_range,
+            format_exponent(result["time_exponent"]),
+            format_exponent(result["memory_exponent"]),
+            ", ".join(flags),
+        ))
+
+    return "\n".join(lines)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="runner.complexity",
+        description="Estimate how each solution scales with its input size",
+    )
+    parser.add_argument("days", metavar="DAY", type=int, nargs="*",
+                        help="days to analyse (default: all of them)")
+    parser.add_argument("-p", "--part", type=int, action="append",
+                        dest="parts", help="2018 part to run (repeatable)")
+    parser.add_argument("-y", "--year", type=int, action="append",
+                        dest="years", choices=(2017, 2018),
+                        help="year to analyse (default: both)")
+    parser.add_argument("-s", "--steps", type=int, default=5,
+                        help="number of sizes to try, centred on the real "
+                             "input's size")
+    parser.add_argument("-f", "--factor", type=int, default=2,
+                        help="how much bigger each size is than the last")
+    parser.add_argument("-r", "--repeat", type=int, default=3,
+                        help="timed runs per size (the fastest counts)")
+    parser.add_argument("-t", "--timeout", type=float, default=30,
+                        help="seconds to give each size before stopping")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="how far above n log n's exponent to allow")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="seed for the generated inputs")
+    parser.add_argument("--json", action="store_true",
+                        help="write results to stdout as JSON")
+    return parser.parse_args(argv)
+
+
+def print_measurement(name, size, seconds, peak):
+    print("{} x{}: {:.4f}s, {:.1f} KiB peak".format(
+        name, size, seconds, peak / 1024
+    ), file=sys.stderr, flush=True)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    days = args.days or range(1, 26)
+    years = args.years or (2017, 2018)
+
+    results = run_analyses(
+        days, args.parts, years, args.steps, max(2, args.factor),
+        max(1, args.repeat), args.timeout, args.seed,
+        None if args.json else print_measurement,
+    )
+
+    for result in results:
+        result["worse"] = flag(result, args.tolerance)
+
+    if args.json:
+        json.dump({"results": results}, sys.stdout, indent=2)
+        print()
+    else:
+        print(format_table(results, args.tolerance))
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,240 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import hashlib
+from importlib import import_module
+import os
+from pathlib import Path
+import re
+import sys
+from timeit import default_timer as timer
+import time
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+from shared.cache import ParseCache, hash_input
+from shared.profiling import get_enabled_profilers, profile_call
+from shared.utils import get_input
+
+
+ROOT_DIR = Path(__file__).parent.parent
+DEFAULT_PARSE_CACHE = ROOT_DIR.joinpath(".cache", "parsed")
+DEFAULT_ANSWER_CACHE = ROOT_DIR.joinpath(".cache", "answers")
+DEFAULT_CHECKPOINT_DIR = ROOT_DIR.joinpath(".cache", "checkpoints")
+SHARED_DIR = ROOT_DIR.joinpath("shared")
+
+day_dir_regex = re.compile(r"^day(\d{2})$")
+solution_regex = re.compile(r"^solution(\d+)\.py$")
+
+
+def first_line(input_text):
+    return (input_text[0],)
+
+
+def first_line_or(default, convert=int):
+    # For solutions whose input is hardcoded in their __main__ block, but can
+    # be overridden by an input file (eg. a generated one)
+    def to_arguments(input_text):
+        if input_text is None:
+            return (default,)
+        return (convert(input_text[0]),)
+
+    return to_arguments
+
+
+# Arguments for solve() where it needs something other than the lines of
+# input.txt - these mirror the __main__ blocks of the solutions concerned
+SOLVE_ARGUMENTS = {
+    (5, 1): first_line,
+    (5, 2): first_line,
+    (6, 2): lambda input_text: (input_text, 10000),
+    (7, 2): lambda input_text: (input_text, 5, 60),
+    (11, 1): first_line_or(9798),
+    (11, 2): first_line_or(9798),
+    (12, 2): lambda input_text: (input_text, 50_000_000_000),
+    (14, 1): first_line_or(540391),
+    (14, 2): first_line_or("540391", str),
+    (19, 2): lambda input_text: (input_text, 1),
+}
+
+
+def enable_parse_cache(directory=DEFAULT_PARSE_CACHE):
+    # Read by shared.cache, and inherited by any worker processes started
+    # afterwards
+    os.environ["AOC_PARSE_CACHE"] = str(directory)
+
+
+def enable_checkpoints(directory=DEFAULT_CHECKPOINT_DIR):
+    # Read by shared.checkpoint, as for enable_parse_cache
+    os.environ["AOC_CHECKPOINT_DIR"] = str(directory)
+
+
+def enable_profiling(profilers, directory):
+    # Read by shared.profiling, as for enable_parse_cache
+    os.environ["AOC_PROFILE"] = ",".join(profilers)
+    os.environ["AOC_PROFILE_DIR"] = str(Path(directory).resolve())
+
+
+def get_day_dir(day):
+    return ROOT_DIR.joinpath("day{:02}".format(day))
+
+
+def discover_days():
+    days = []
+
+    for path in ROOT_DIR.iterdir():
+        match = day_dir_regex.match(path.name)
+        if match and path.is_dir():
+            days.append(int(match.group(1)))
+
+    return sorted(days)
+
+
+def discover_parts(day):
+    parts = []
+
+    for path in get_day_dir(day).iterdir():
+        match = solution_regex.match(path.name)
+        if match:
+            parts.append(int(match.group(1)))
+
+    return sorted(parts)
+
+
+def get_module(day, part):
+    return import_module("day{:02}.solution{}".format(day, part))
+
+
+def get_input_path(day):
+    return get_day_dir(day).joinpath("input.txt")
+
+
+def read_input(day, input_path=None):
+    # Returns None rather than raising if the day has no input file, as some
+    # solutions have their input hardcoded instead
+    if input_path is None:
+        input_path = get_input_path(day)
+
+    return get_input(input_path) if input_path.exists() else None
+
+
+def build_solve_arguments(day, part, input_text):
+    to_arguments = SOLVE_ARGUMENTS.get((day, part))
+
+    if to_arguments is None:
+        if input_text is None:
+            raise FileNotFoundError(
+                "No input file found for day {:02}".format(day)
+            )
+        return (input_text,)
+
+    return to_arguments(input_text)
+
+
+def get_solve_arguments(day, part, input_path=None):
+    return build_solve_arguments(day, part, read_input(day, input_path))
+
+
+def get_source_hash(day):
+    # Covers everything a day's solutions can import, and this module for
+    # SOLVE_ARGUMENTS (which can change the answer, eg. 12/2's generation
+    # count), so answers cached against it go stale as soon as any of that
+    # code changes
+    digest = hashlib.sha256()
+    paths = [
+        path
+        for directory in (get_day_dir(day), SHARED_DIR)
+        for path in sorted(directory.glob("*.py"))
+        if path.name != "tests.py"
+    ]
+    paths.append(Path(__file__))
+
+    for path in paths:
+        digest.update(path.relative_to(ROOT_DIR).as_posix().encode())
+        digest.update(b"\0")
+        digest.update(path.read_bytes())
+        digest.update(b"\0")
+
+    return digest.hexdigest()
+
+
+def get_answer_key(cache, day, part, input_text):
+    return cache.make_key(
+        "day{:02}/part{}".format(day, part),
+        get_source_hash(day),
+        hash_input(input_text) if input_text is not None else None,
+    )
+
+
+def get_peak_rss():
+    # Peak resident set size of this process in KiB (None if unknown)
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        peak //= 1024  # reported in bytes rather than KiB
+    return peak
+
+
+def run_solution(day, part, input_path=None, answer_cache=None):
+    # answer_cache is a directory in which to look up and store answers,
+    # keyed by the input and the source code of the day's solutions (see
+    # get_source_hash)
+    result = {
+        "day": day,
+        "part": part,
+        "answer": None,
+        "error": None,
+        "cached": False,
+    }
+
+    start_wall = start_cpu = None
+
+    try:
+        module = get_module(day, part)
+
+        start_wall = timer()
+        start_cpu = time.process_time()
+
+        input_text = read_input(day, input_path)
+
+        # A cached answer would leave nothing to profile
+        if answer_cache is not None and get_enabled_profilers():
+            answer_cache = None
+
+        if answer_cache is not None:
+            cache = ParseCache(answer_cache)
+            key = get_answer_key(cache, day, part, input_text)
+            try:
+                answer = cache.load(key)
+            except KeyError:
+                pass
+            else:
+                result["cached"] = True
+
+        if not result["cached"]:
+            args = build_solve_arguments(day, part, input_text)
+            answer = str(profile_call(
+                "day{:02}.part{}".format(day, part), module.solve, *args
+            ))
+
+            if answer_cache is not None:
+                cache.store(key, answer)
+    except Exception as e:
+        result["error"] = "{}: {}".format(type(e).__name__, e)
+    else:
+        result["answer"] = answer
+
+    if start_wall is not None:
+        result["wall"] = timer() - start_wall
+        result["cpu"] = time.process_time() - start_cpu
+    else:
+        result["wall"] = result["cpu"] = None
+
+    result["peak_rss"] = get_peak_rss()
+
+    return result
@@ -0,0 +1,319 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import csv
+import json
+from math import log
+from pathlib import Path
+import random
+import tempfile
+import unittest
+from unittest import mock
+
+from . import batch, benchmark, complexity, solutions
+from .__main__ import get_jobs, read_worker_result, run_jobs
+
+
+class TestDiscovery(unittest.TestCase):
+    def test_discover_days(self):
+        days = solutions.discover_days()
+        self.assertEqual(1, days[0])
+        self.assertIn(23, days)
+        self.assertEqual(sorted(set(days)), days)
+
+    def test_discover_parts(self):
+        self.assertEqual([1, 2], solutions.discover_parts(1))
+
+    def test_get_jobs(self):
+        self.assertEqual([(1, 1), (1, 2), (2, 1), (2, 2)],
+                         get_jobs([1, 2], None))
+        self.assertEqual([(1, 2), (2, 2)], get_jobs([1, 2], [2]))
+
+
+class TestSolveArguments(unittest.TestCase):
+    def test_default_arguments_are_input_lines(self):
+        path = solutions.get_day_dir(1).joinpath("test_input0.txt")
+        args = solutions.get_solve_arguments(1, 1, path)
+        self.assertEqual((["+1", "-2", "+3", "+1"],), args)
+
+    def test_first_line_only(self):
+        path = solutions.get_day_dir(5).joinpath("test_input.txt")
+        input_text, = solutions.get_solve_arguments(5, 1, path)
+        self.assertEqual("dabAcCaCBAcCcaDA", input_text)
+
+    def test_hardcoded_input(self):
+        args = solutions.get_solve_arguments(14, 2)
+        self.assertEqual(("540391",), args)
+
+    def test_hardcoded_input_can_be_overridden(self):
+        self.assertEqual((1234,), solutions.build_solve_arguments(
+            11, 1, ["1234"]
+        ))
+
+    def test_missing_input(self):
+        path = solutions.get_day_dir(1).joinpath("missing.txt")
+        with self.assertRaises(FileNotFoundError):
+            solutions.get_solve_arguments(1, 1, path)
+
+
+class TestRunSolution(unittest.TestCase):
+    def test_run_solution(self):
+        path = solutions.get_day_dir(1).joinpath("test_input0.txt")
+        result = solutions.run_solution(1, 2, path)
+        self.assertEqual("2", result["answer"])
+        self.assertIsNone(result["error"])
+        self.assertGreaterEqual(result["wall"], 0)
+        self.assertGreaterEqual(result["cpu"], 0)
+
+    def test_run_solution_records_errors(self):
+        path = solutions.get_day_dir(1).joinpath("missing.txt")
+        result = solutions.run_solution(1, 1, path)
+        self.assertIsNone(result["answer"])
+        self.assertTrue(result["error"].startswith("FileNotFoundError"))
+
+    def test_answer_cache(self):
+        path = solutions.get_day_dir(1).joinpath("test_input0.txt")
+
+        with tempfile.TemporaryDirectory() as directory:
+            first = solutions.run_solution(1, 2, path, answer_cache=directory)
+            second = solutions.run_solution(1, 2, path, answer_cache=directory)
+            self.assertFalse(first["cached"])
+            self.assertTrue(second["cached"])
+            self.assertEqual("2", second["answer"])
+
+            other = solutions.get_day_dir(1).joinpath("test_input4.txt")
+            result = solutions.run_solution(1, 2, other,
+                                            answer_cache=directory)
+            self.assertFalse(result["cached"])
+
+            # Any change to the source starts afresh
+            with mock.patch.object(solutions, "get_source_hash",
+                                   return_value="changed"):
+                result = solutions.run_solution(1, 2, path,
+                                                answer_cache=directory)
+            self.assertFalse(result["cached"])
+
+    def test_source_hash(self):
+        self.assertEqual(solutions.get_source_hash(1),
+                         solutions.get_source_hash(1))
+        self.assertNotEqual(solutions.get_source_hash(1),
+                            solutions.get_source_hash(2))
+
+    def test_source_hash_covers_solve_arguments(self):
+        # As SOLVE_ARGUMENTS can change an answer, so can its module
+        read_bytes = Path.read_bytes
+        runner_path = Path(solutions.__file__)
+
+        def edited(path):
+            data = read_bytes(path)
+            return data + b"\n" if path == runner_path else data
+
+        before = solutions.get_source_hash(12)
+        with mock.patch.object(Path, "read_bytes", edited):
+            self.assertNotEqual(before, solutions.get_source_hash(12))
+
+
+class TestBenchmark(unittest.TestCase):
+    def test_percentile(self):
+        values = [1, 2, 3, 4, 5]
+        self.assertEqual(3, benchmark.percentile(values, 0.5))
+        self.assertEqual(1, benchmark.percentile(values, 0))
+        self.assertEqual(5, benchmark.percentile(values, 1))
+        self.assertAlmostEqual(4.6, benchmark.percentile(values, 0.9))
+        self.assertEqual(7, benchmark.percentile([7], 0.9))
+
+    def test_summarise(self):
+        summary = benchmark.summarise([0.3, 0.1, 0.2])
+        self.assertEqual(3, summary["runs"])
+        self.assertEqual(0.1, summary["min"])
+        self.assertEqual(0.2, summary["median"])
+        self.assertEqual(0.3, summary["max"])
+
+    def test_scale_input(self):
+        self.assertEqual(["text"], benchmark.scale_input(9, ["text"], 1))
+        self.assertEqual(10000, len(benchmark.scale_input(1, ["+1"], 10)))
+        # Fixed size input
+        self.assertIsNone(benchmark.scale_input(11, ["9798"], 10))
+        # Too big for the input format
+        self.assertIsNone(benchmark.scale_input(7, ["text"], 10))
+
+    def test_find_regressions(self):
+        baseline = {
+            "day01/part1/x1": {"median": 1.0},
+            "day01/part2/x1": {"median": 1.0},
+        }
+        results = {
+            "day01/part1/x1": {"median": 1.2},
+            "day01/part2/x1": {"median": 1.3},
+            "day02/part1/x1": {"median": 9.0},
+        }
+        self.assertEqual(
+            [("day01/part2/x1", 1.0, 1.3)],
+            benchmark.find_regressions(results, baseline, 0.25),
+        )
+
+    def test_time_solution(self):
+        path = solutions.get_day_dir(1).joinpath("test_input0.txt")
+        input_text = solutions.read_input(1, path)
+        timings = benchmark.time_solution(1, 1, input_text, 3)
+        self.assertEqual(3, len(timings))
+
+
+class TestRunJobs(unittest.TestCase):
+    def test_run_jobs(self):
+        reported = []
+        results = run_jobs([(1, 2), (1, 1)], 2, report=reported.append)
+        self.assertCountEqual(results, reported)
+        self.assertEqual(["470", "790"],
+                         [result["answer"] for result in results])
+        self.assertFalse(any(result["timed_out"] for result in results))
+
+    def test_timeout(self):
+        result, = run_jobs([(1, 1)], 1, timeout=0.001)
+        self.assertTrue(result["timed_out"])
+        self.assertIsNone(result["answer"])
+        self.assertEqual("Timed out after 0.001s", result["error"])
+
+    def test_read_worker_result(self):
+        result = read_worker_result(
+            (1, 1), 0, b"something printed\n\n{\"answer\": \"3\"}\n", b""
+        )
+        self.assertEqual("3", result["answer"])
+        self.assertFalse(result["timed_out"])
+
+        result = read_worker_result((1, 1), -9, b"", b"")
+        self.assertEqual("Worker exited with code -9", result["error"])
+
+
+class TestBatch(unittest.TestCase):
+    def test_find_inputs(self):
+        day_dir = solutions.get_day_dir(1)
+        paths = batch.find_inputs([
+            str(day_dir.joinpath("test_input[01].txt")),
+            str(day_dir.joinpath("test_input1.txt")),
+        ])
+        self.assertEqual(
+            [day_dir.joinpath("test_input0.txt"),
+             day_dir.joinpath("test_input1.txt")],
+            paths,
+        )
+
+        with tempfile.TemporaryDirectory() as directory:
+            Path(directory, "b.txt").touch()
+            Path(directory, "a.txt").touch()
+            self.assertEqual(
+                ["a.txt", "b.txt"],
+                [path.name for path in batch.find_inputs([directory])],
+            )
+
+        with self.assertRaises(FileNotFoundError):
+            batch.find_inputs([str(day_dir.joinpath("nothing*.txt"))])
+
+    def test_run_batch(self):
+        day_dir = solutions.get_day_dir(1)
+        paths = [day_dir.joinpath("test_input0.txt"),
+                 day_dir.joinpath("test_input4.txt")]
+        results = list(batch.run_batch(1, [1, 2], paths, 2))
+        self.assertEqual(
+            [(str(paths[0]), 1, "3"), (str(paths[0]), 2, "2"),
+             (str(paths[1]), 1, "0"), (str(paths[1]), 2, "0")],
+            [(result["input"], result["part"], result["answer"])
+             for result in results],
+        )
+        self.assertTrue(all(result["error"] is None for result in results))
+
+    def test_main(self):
+        path = str(solutions.get_day_dir(1).joinpath("test_input0.txt"))
+
+        with tempfile.TemporaryDirectory() as directory:
+            output = Path(directory, "answers.csv")
+            self.assertEqual(0, batch.main([
+                "1", path, "-p", "2", "-j", "1", "-o", str(output)
+            ]))
+            with open(output) as infile:
+                rows = list(csv.DictReader(infile))
+            self.assertEqual([(path, "2", "2")], [
+                (row["input"], row["part"], row["answer"]) for row in rows
+            ])
+
+            output = Path(directory, "answers.json")
+            batch.main(["1", path, "-p", "1", "-j", "1", "-o", str(output)])
+            with open(output) as infile:
+                results = json.load(infile)["results"]
+            self.assertEqual("3", results[0]["answer"])
+
+
+class TestComplexity(unittest.TestCase):
+    def test_get_sizes(self):
+        self.assertEqual([250, 500, 1000, 2000, 4000],
+                         complexity.get_sizes(1000, 5, 2))
+        self.assertEqual([3, 9, 27], complexity.get_sizes(9, 3, 3))
+        self.assertEqual([2, 4], complexity.get_sizes(2, 3, 2))
+
+    def test_fit_exponent(self):
+        sizes = [10, 20, 40, 80]
+        self.assertAlmostEqual(
+            2, complexity.fit_exponent(sizes, [3 * n ** 2 for n in sizes])
+        )
+        self.assertAlmostEqual(
+            0, complexity.fit_exponent(sizes, [5 for n in sizes])
+        )
+        self.assertIsNone(complexity.fit_exponent([10], [1]))
+
+    def test_flag(self):
+        sizes = [1000, 2000, 4000]
+        result = {
+            "sizes": sizes,
+            "time_exponent": complexity.fit_exponent(
+                sizes, [n * log(n) for n in sizes]
+            ),
+            "memory_exponent": 2,
+        }
+        self.assertEqual(["memory"], complexity.flag(result))
+
+    def test_analyse(self):
+        result = complexity.analyse(
+            "day01", complexity.measure_2018, [100, 200],
+            lambda size: (1, 1, size, 0, 1), 30
+        )
+        self.assertEqual([100, 200], result["sizes"])
+        self.assertEqual(2, len(result["times"]))
+        self.assertIsNotNone(result["time_exponent"])
+        self.assertIsNone(result["error"])
+
+        # Day 4's generator can't make this many guards
+        result = complexity.analyse(
+            "day04", complexity.measure_2018, [10, 100_000],
+            lambda size: (4, 1, size, 0, 1), 30
+        )
+        self.assertEqual([10], result["sizes"])
+        self.assertIsNone(result["error"])
+
+    def test_measure_2017(self):
+        seconds, peak = complexity.measure_2017("d2/checksum.py", 20, 0, 1)
+        self.assertGreater(seconds, 0)
+        self.assertGreater(peak, 0)
+
+    def test_2017_streams_are_valid(self):
+        stream, = complexity.generate_2017_d9(500, random.Random(1))
+        depth = 0
+        garbage = cancelled = False
+
+        for char in stream:
+            if cancelled:
+                cancelled = False
+            elif garbage:
+                cancelled = char == "!"
+                garbage = char != ">"
+            elif char == "<":
+                garbage = True
+            else:
+                depth += {"{": 1, "}": -1}.get(char, 0)
+                self.assertGreaterEqual(depth, 0)
+
+        self.assertEqual(0, depth)
+        self.assertGreaterEqual(len(stream), 500)
+
+
+if __name__ == '__main__':
+    unittest.main()
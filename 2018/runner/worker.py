@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Runs a single day/part in a process of its own for the runner, and writes
+# the result as JSON on the last line of stdout
+
+import argparse
+import json
+from pathlib import Path
+import sys
+
+from .solutions import resource, run_solution
+
+
+def limit_memory(mebibytes):
+    # Caps the address space of this process, so going over the budget raises
+    # MemoryError rather than taking the machine down with it
+    if resource is None:
+        return
+
+    limit = mebibytes * 1024 * 1024
+    resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="runner.worker")
+    parser.add_argument("day", type=int)
+    parser.add_argument("part", type=int)
+    parser.add_argument("--answer-cache", type=Path)
+    parser.add_argument("--memory-limit", type=int)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    if args.memory_limit is not None:
+        limit_memory(args.memory_limit)
+
+    result = run_solution(args.day, args.part,
+                          answer_cache=args.answer_cache)
+
+    if args.memory_limit is not None and result["error"] == "MemoryError: ":
+        result["error"] += "over the {} MiB limit".format(args.memory_limit)
+
+    # Anything the solution printed comes before this
+    print()
+    print(json.dumps(result))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
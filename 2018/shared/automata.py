@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Cellular automata on numpy arrays of small integers (eg. the bytes of a
+# CharGrid). Rules are worked out once for every combination of a cell and
+# what's around it, then each generation is a few whole-array operations and a
+# lookup in that table instead of a Python loop over the cells.
+#
+# Two neighbourhoods are covered: the eight cells surrounding each cell of a
+# grid (Moore), and the cells up to radius either side in a line, for which
+# cells are only ever 0 or 1.
+
+from .optional import numpy, require_numpy
+
+
+def make_moore_table(states, counted, rule):
+    # table[state, n1, n2, ...] is rule(state, n1, n2, ...), where n1, n2...
+    # are how many of a cell's neighbours are in each of the counted states
+    require_numpy(__name__)
+    shape = (max(states) + 1,) + (9,) * len(counted)
+    table = numpy.zeros(shape, dtype=numpy.uint8)
+
+    for state in states:
+        for counts in numpy.ndindex(shape[1:]):
+            table[(state,) + counts] = rule(state, *counts)
+
+    return table
+
+
+def count_moore_neighbours(cells, state):
+    # How many of each cell's eight neighbours are in state; anything beyond
+    # the edges doesn't count
+    padded = numpy.pad(cells == state, 1).astype(numpy.uint8)
+    height, width = cells.shape
+
+    counts = numpy.zeros(cells.shape, dtype=numpy.uint8)
+    for dy in range(3):
+        for dx in range(3):
+            if dx != 1 or dy != 1:
+                counts += padded[dy:dy + height, dx:dx + width]
+
+    return counts
+
+
+def moore_step(cells, table, counted):
+    # The next generation of a 2D array of states, with table and counted as
+    # given to make_moore_table
+    counts = [count_moore_neighbours(cells, state) for state in counted]
+    return table[(cells, *counts)]
+
+
+def make_line_table(rule, radius=2):
+    # table[i] is rule(window), where window is the tuple of 0s and 1s whose
+    # bits (most significant first) make up i
+    require_numpy(__name__)
+    size = 2 * radius + 1
+    table = numpy.zeros(1 << size, dtype=numpy.uint8)
+
+    for i in range(1 << size):
+        window = tuple((i >> (size - 1 - n)) & 1 for n in range(size))
+        table[i] = rule(window)
+
+    if table[0]:
+        raise ValueError("Empty cells can't come alive on their own, as the "
+                         "line would fill up forever")
+
+    return table
+
+
+def line_step(cells, offset, table, radius=2):
+    # The next generation of a line of 0s and 1s whose first cell is at
+    # position offset, and its new offset. The line grows by up to radius at
+    # each end, then is trimmed back to its first and last live cells.
+    size = 2 * radius + 1
+    padded = numpy.pad(cells, 2 * radius)
+    index = numpy.zeros(len(cells) + 2 * radius, dtype=numpy.intp)
+
+    for n in range(size):
+        index <<= 1
+        index |= padded[n:n + len(index)]
+
+    cells = table[index]
+    offset -= radius
+
+    alive = numpy.flatnonzero(cells)
+    if not len(alive):
+        return cells[:0], offset
+
+    return cells[alive[0]:alive[-1] + 1], offset + int(alive[0])
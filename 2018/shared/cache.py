@@ -0,0 +1,169 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# On-disk cache of parsed inputs, keyed by the parser, its version, a SHA-256
+# of the parser's module source and a SHA-256 of the input, so repeated runs
+# over the same input skip parsing.
+# It's off unless AOC_PARSE_CACHE is set to the directory to keep it in.
+
+from functools import wraps
+import hashlib
+import inspect
+import os
+from pathlib import Path
+import pickle
+import tempfile
+
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def hash_input(input_text):
+    # SHA-256 of an input given as lines, str or bytes; None for anything
+    # else (eg. a generator, which hashing would use up)
+    digest = hashlib.sha256()
+
+    if isinstance(input_text, list):
+        for line in input_text:
+            digest.update(line.encode("utf-8"))
+            digest.update(b"\n")
+    elif isinstance(input_text, str):
+        digest.update(input_text.encode("utf-8"))
+    elif isinstance(input_text, (bytes, bytearray)):
+        digest.update(input_text)
+    else:
+        return None
+
+    return digest.hexdigest()
+
+
+def hash_source(function):
+    # SHA-256 of the source file defining function, or of its bytecode when
+    # there's no file to read (eg. it was defined interactively)
+    try:
+        path = inspect.getsourcefile(function)
+    except TypeError:
+        path = None
+
+    if path is not None:
+        try:
+            return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+        except OSError:
+            pass
+
+    return hashlib.sha256(function.__code__.co_code).hexdigest()
+
+
+class ParseCache:
+    suffix = ".pickle"
+
+    def __init__(self, directory, max_bytes=DEFAULT_MAX_BYTES):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def make_key(self, name, version, input_hash):
+        key = "{}\0{}\0{}".format(name, version, input_hash)
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def _path(self, key):
+        return self.directory.joinpath(key + self.suffix)
+
+    def load(self, key):
+        path = self._path(key)
+
+        try:
+            with open(path, "rb") as infile:
+                value = pickle.load(infile)
+        except FileNotFoundError:
+            raise KeyError(key)
+        except Exception:
+            # Unreadable (eg. truncated, or pickled by a since-changed class)
+            path.unlink()
+            raise KeyError(key)
+
+        # Mark as recently used
+        os.utime(path)
+        return value
+
+    def store(self, key, value):
+        # Write to a temporary file first so readers never see half a value
+        handle, temp_path = tempfile.mkstemp(dir=self.directory)
+        try:
+            with os.fdopen(handle, "wb") as outfile:
+                pickle.dump(value, outfile, pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self._path(key))
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+        self.evict()
+
+    def evict(self):
+        # Remove least recently used entries until under the size limit
+        entries = []
+        total = 0
+
+        for path in self.directory.glob("*" + self.suffix):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        entries.sort()
+
+        while total > self.max_bytes and entries:
+            _, size, path = entries.pop(0)
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def get(self, name, version, parser, input_text):
+        input_hash = hash_input(input_text)
+        if input_hash is None:
+            return parser(input_text)
+
+        key = self.make_key(name, version, input_hash)
+
+        try:
+            return self.load(key)
+        except KeyError:
+            value = parser(input_text)
+            self.store(key, value)
+            return value
+
+
+def get_default_cache():
+    directory = os.environ.get("AOC_PARSE_CACHE")
+    if not directory:
+        return None
+
+    max_mib = os.environ.get("AOC_PARSE_CACHE_MIB")
+    if max_mib:
+        return ParseCache(directory, int(max_mib) * 1024 * 1024)
+    return ParseCache(directory)
+
+
+def cached_parser(version=1):
+    # Decorator for parse functions taking the input as their only argument.
+    # Changes to the parser's own module invalidate its entries by themselves;
+    # bump version when its output changes through code elsewhere (eg. a
+    # class it returns that's defined in another module).
+    def decorator(parser):
+        name = "{}.{}".format(parser.__module__, parser.__qualname__)
+        version_key = "{}\0{}".format(version, hash_source(parser))
+
+        @wraps(parser)
+        def wrapper(input_text):
+            cache = get_default_cache()
+            if cache is None:
+                return parser(input_text)
+            return cache.get(name, version_key, parser, input_text)
+
+        return wrapper
+
+    return decorator
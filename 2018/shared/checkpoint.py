@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Saving long simulations as they go, so one that's stopped part way (eg. a
+# preempted job) can carry on from where it got to rather than from the start.
+# It's off unless AOC_CHECKPOINT_DIR is set to the directory to save in, and
+# saves at most every AOC_CHECKPOINT_INTERVAL seconds (default 60). Setting
+# AOC_PROGRESS prints how far each simulation has got to stderr.
+#
+# A simulation's state is given as a dict of plain values (anything JSON can
+# hold) and a dict of array.array, written as raw bytes after a JSON header,
+# so even millions of numbers save and load quickly. Checkpoints are tagged
+# with a key (eg. the puzzle input) and only resumed by a simulation with the
+# same one.
+#
+# A simulation that takes a checkpoint calls resume() before starting, and
+# carries on from the state it gives back if there is one. It then calls
+# update() every so many steps of its own (its every argument), which
+# reports progress and saves once the interval's passed, and clear() once
+# it's finished.
+
+from array import array
+import json
+import os
+from pathlib import Path
+import sys
+import tempfile
+from timeit import default_timer as timer
+
+
+DEFAULT_INTERVAL = 60.0
+SUFFIX = ".checkpoint"
+
+
+def save_state(path, key, values, arrays):
+    header = {
+        "key": key,
+        "values": values,
+        "arrays": [
+            [name, data.typecode, len(data)] for name, data in arrays.items()
+        ],
+    }
+
+    # Write to a temporary file first, so being stopped part way through
+    # saving leaves the previous checkpoint intact
+    path = Path(path)
+    handle, temp_path = tempfile.mkstemp(dir=path.parent)
+    try:
+        with os.fdopen(handle, "wb") as outfile:
+            outfile.write(json.dumps(header).encode("utf-8"))
+            outfile.write(b"\n")
+            for data in arrays.values():
+                data.tofile(outfile)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+def load_state(path, key):
+    # (values, arrays) as saved, or None if there's no checkpoint for key
+    try:
+        with open(path, "rb") as infile:
+            header = json.loads(infile.readline().decode("utf-8"))
+            if header["key"] != key:
+                return None
+
+            arrays = {}
+            for name, typecode, length in header["arrays"]:
+                data = array(typecode)
+                data.fromfile(infile, length)
+                arrays[name] = data
+    except FileNotFoundError:
+        return None
+    except (ValueError, KeyError, EOFError):
+        # Unreadable, eg. written by an older version of the simulation
+        return None
+
+    return header["values"], arrays
+
+
+def print_progress(name):
+    def progress(done, total):
+        if total is None:
+            message = "{}: {}".format(name, done)
+        else:
+            message = "{}: {}/{} ({:.1%})".format(name, done, total,
+                                                  done / total)
+        print(message, file=sys.stderr, flush=True)
+
+    return progress
+
+
+class Checkpoint:
+    # With path None nothing's saved or resumed, but progress is still
+    # reported. progress(done, total) is called on every update; total may be
+    # None if it isn't known in advance.
+
+    def __init__(self, path=None, key=None, interval=DEFAULT_INTERVAL,
+                 progress=None):
+        self.path = None if path is None else Path(path)
+        # As it'll be after a round trip through JSON, for comparing
+        self.key = json.loads(json.dumps(key))
+        self.interval = interval
+        self.progress = progress
+        self.last_saved = timer()
+
+    def resume(self):
+        if self.path is None:
+            return None
+        return load_state(self.path, self.key)
+
+    def update(self, done, total, get_state):
+        # get_state() gives the (values, arrays) to save, and is only called
+        # when it's time to save them
+        if self.progress is not None:
+            self.progress(done, total)
+
+        if self.path is None:
+            return
+
+        if timer() - self.last_saved >= self.interval:
+            self.save(*get_state())
+
+    def save(self, values, arrays):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        save_state(self.path, self.key, values, arrays)
+        self.last_saved = timer()
+
+    def clear(self):
+        # Once finished, so the next run starts afresh
+        if self.path is not None:
+            try:
+                self.path.unlink()
+            except FileNotFoundError:
+                pass
+
+
+def get_checkpoint(name, key):
+    # Set up from the environment, as described at the top
+    directory = os.environ.get("AOC_CHECKPOINT_DIR")
+    interval = os.environ.get("AOC_CHECKPOINT_INTERVAL")
+
+    return Checkpoint(
+        Path(directory).joinpath(name + SUFFIX) if directory else None,
+        key,
+        float(interval) if interval else DEFAULT_INTERVAL,
+        print_progress(name) if os.environ.get("AOC_PROGRESS") else None,
+    )
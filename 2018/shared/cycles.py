@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# For simulations that end up repeating themselves: step through states until
+# one comes round again, then skip over as many whole cycles as fit.
+#
+# States are compared by key(state) (the state itself by default), which has
+# to be hashable and is kept for every generation until the cycle's found, so
+# something compact like a string, bytes or tuple is best. If keys can
+# collide (eg. they're hashes), verify checks a match for real: True compares
+# the states with ==, otherwise it's called with the earlier state and the
+# current one. Only then are the states themselves kept as well, so with
+# verify step must return new ones rather than changing them in place; without
+# it, step can update a state in place and return it.
+#
+# Some states repeat in a different place, like a pattern drifting along a
+# line. For those, key should ignore the position, offset(state) give it as a
+# number and translate(state, distance) move a state along by distance.
+
+from collections import namedtuple
+from operator import eq
+
+
+# start is the generation the cycle was first entered, length how many
+# generations it takes to come round and shift how far it moves each time.
+# state is the state at generation start + length, or at limit if no cycle
+# was found, when length and shift are None.
+Cycle = namedtuple("Cycle", ["start", "length", "shift", "state"])
+
+
+def find_cycle(state, step, key=None, verify=None, offset=None, limit=None):
+    seen = {}
+    generation = 0
+
+    if verify is True:
+        verify = eq
+
+    while limit is None or generation < limit:
+        state_key = state if key is None else key(state)
+        position = 0 if offset is None else offset(state)
+        matches = seen.setdefault(state_key, [])
+
+        for start, start_position, start_state in matches:
+            if verify is None or verify(start_state, state):
+                return Cycle(
+                    start, generation - start, position - start_position,
+                    state
+                )
+
+        matches.append(
+            (generation, position, None if verify is None else state)
+        )
+        state = step(state)
+        generation += 1
+
+    return Cycle(None, None, None, state)
+
+
+def fast_forward(state, step, generations, key=None, verify=None,
+                 offset=None, translate=None):
+    # The state after the given number of generations
+    cycle = find_cycle(state, step, key, verify, offset, limit=generations)
+    state = cycle.state
+
+    if cycle.length is None:
+        return state
+
+    remaining = generations - cycle.start - cycle.length
+    cycles, extra = divmod(remaining, cycle.length)
+
+    for _ in range(extra):
+        state = step(state)
+
+    if cycles and cycle.shift:
+        state = translate(state, cycles * cycle.shift)
+
+    return state
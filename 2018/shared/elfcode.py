@@ -0,0 +1,575 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# The ElfCode machine from days 16, 19 and 21. Programs are parsed once and
+# compiled into Python, with a function for each instruction a jump could land
+# on that runs from there in local variables. Reads of the instruction
+# pointer's register are constants when compiling, so jumps that can only go
+# one or two places are followed in the generated code rather than returning
+# to Program.execute, and the register itself is only written back when
+# execution stops. Loops that match one of a few known idioms (see IDIOMS) are
+# replaced by code working out their result directly.
+#
+# Passing a Tracer to Program.execute runs the program one instruction at a
+# time instead, counting what runs and taking snapshots of the registers, for
+# working out what a program does (python -m shared.elfcode prints a report).
+
+import argparse
+from collections import Counter, deque
+from pathlib import Path
+
+OPCODES = (
+    "addr", "addi", "mulr", "muli", "banr", "bani", "borr", "bori",
+    "setr", "seti", "gtir", "gtri", "gtrr", "eqir", "eqri", "eqrr",
+)
+
+# What each opcode stores in register c; ra and rb are the registers named by
+# a and b, while a and b on their own are immediate values
+EXPRESSIONS = {
+    "addr": "{ra} + {rb}",
+    "addi": "{ra} + {b}",
+    "mulr": "{ra} * {rb}",
+    "muli": "{ra} * {b}",
+    "banr": "{ra} & {rb}",
+    "bani": "{ra} & {b}",
+    "borr": "{ra} | {rb}",
+    "bori": "{ra} | {b}",
+    "setr": "{ra}",
+    "seti": "{a}",
+    "gtir": "1 if {a} > {rb} else 0",
+    "gtri": "1 if {ra} > {b} else 0",
+    "gtrr": "1 if {ra} > {rb} else 0",
+    "eqir": "1 if {a} == {rb} else 0",
+    "eqri": "1 if {ra} == {b} else 0",
+    "eqrr": "1 if {ra} == {rb} else 0",
+}
+
+
+def make_operation(opcode):
+    # A function applying opcode to a register list in place
+    source = "def {}(r, a, b, c):\n    r[c] = {}\n".format(
+        opcode, EXPRESSIONS[opcode].format(ra="r[a]", rb="r[b]", a="a", b="b")
+    )
+    namespace = {}
+    exec(source, namespace)
+    return namespace[opcode]
+
+
+OPERATIONS = {opcode: make_operation(opcode) for opcode in OPCODES}
+
+
+def parse(lines):
+    ip = None
+    instructions = []
+
+    for line in lines:
+        parts = line.split()
+
+        if not parts:
+            continue
+        elif parts[0] == "#ip":
+            ip = int(parts[1])
+        elif parts[0] in EXPRESSIONS:
+            instructions.append((parts[0], *map(int, parts[1:4])))
+        else:
+            raise ValueError("Unknown instruction: {!r}".format(line))
+
+    return ip, instructions
+
+
+def divisor_sum(n):
+    total = 0
+    i = 1
+
+    while i * i <= n:
+        if n % i == 0:
+            total += i if i * i == n else i + n // i
+        i += 1
+
+    return total
+
+
+# Loops the compiler replaces with what they work out. In patterns, names
+# stand for (different) registers, with ip the instruction pointer's, capitals
+# for immediate values, @n for the loop's first instruction plus n and None
+# for operands that are ignored. The loop exits to the instruction after the
+# pattern, having run the source instead.
+COMMUTATIVE = {"addr", "mulr", "banr", "borr", "eqrr"}
+
+IDIOMS = {
+    # for i in 1..n: for j in 1..n: if i * j == n: total += i
+    "divisor sum": {
+        "pattern": [
+            ("seti", 1, None, "i"),
+            ("seti", 1, None, "j"),
+            ("mulr", "i", "j", "t"),
+            ("eqrr", "t", "n", "t"),
+            ("addr", "t", "ip", "ip"),
+            ("addi", "ip", 1, "ip"),
+            ("addr", "i", "total", "total"),
+            ("addi", "j", 1, "j"),
+            ("gtrr", "j", "n", "t"),
+            ("addr", "ip", "t", "ip"),
+            ("seti", "@1", None, "ip"),
+            ("addi", "i", 1, "i"),
+            ("gtrr", "i", "n", "t"),
+            ("addr", "t", "ip", "ip"),
+            ("seti", "@0", None, "ip"),
+        ],
+        "reads": ["total", "n"],
+        "source": [
+            "{total} = {total} + divisor_sum({n})",
+            "{i} = {j} = max({n}, 1) + 1",
+            "{t} = 1",
+        ],
+    },
+    # q = 0; while (q + 1) * K <= x: q += 1
+    "division": {
+        "pattern": [
+            ("seti", 0, None, "q"),
+            ("addi", "q", 1, "t"),
+            ("muli", "t", "K", "t"),
+            ("gtrr", "t", "x", "t"),
+            ("addr", "t", "ip", "ip"),
+            ("addi", "ip", 1, "ip"),
+            ("seti", "@8", None, "ip"),
+            ("addi", "q", 1, "q"),
+            ("seti", "@0", None, "ip"),
+        ],
+        "reads": ["x"],
+        "check": lambda operands: operands["K"] > 0,
+        "source": [
+            "{q} = max({x} // {K}, 0)",
+            "{t} = 1",
+        ],
+    },
+}
+
+
+def match_pattern(pattern, instructions, start, ip):
+    # The registers and values standing in for the pattern's names, if the
+    # instructions from start match it
+    if ip is None or start + len(pattern) > len(instructions):
+        return None
+
+    operands = {"ip": ip}
+
+    for n, (opcode, *expected) in enumerate(pattern):
+        actual_opcode, *actual = instructions[start + n]
+
+        if actual_opcode != opcode:
+            return None
+
+        orders = [actual]
+        if opcode in COMMUTATIVE:
+            orders.append([actual[1], actual[0], actual[2]])
+
+        for order in orders:
+            attempt = dict(operands)
+
+            for name, value in zip(expected, order):
+                if name is None:
+                    continue
+                elif isinstance(name, int):
+                    if value != name:
+                        break
+                elif name[0] == "@":
+                    if value != start + int(name[1:]):
+                        break
+                elif attempt.setdefault(name, value) != value:
+                    break
+            else:
+                operands = attempt
+                break
+        else:
+            return None
+
+    registers = [value for name, value in operands.items()
+                 if name[0].islower()]
+    if len(set(registers)) != len(registers):
+        return None
+
+    return operands
+
+
+def match_idiom(instructions, start, ip, breakpoints=()):
+    # The first idiom starting at start, with the operands it matched; none
+    # match across a breakpoint, which has to be stopped at
+    for name, idiom in IDIOMS.items():
+        pattern = idiom["pattern"]
+
+        if any(start < n < start + len(pattern) for n in breakpoints):
+            continue
+
+        operands = match_pattern(pattern, instructions, start, ip)
+
+        if operands is not None and idiom.get("check", bool)(operands):
+            return idiom, operands
+
+    return None
+
+
+def compile_block(ip, instructions, start, breakpoints=(), size=200):
+    # Source for a function running instructions from start until it jumps
+    # somewhere unknown, runs off the end of the program or reaches a
+    # breakpoint. Jumps to known places are followed: conditional jumps on a
+    # comparison become if statements, and jumping back to start loops
+    # without leaving the function. size caps how many instructions are
+    # inlined, as following both sides of every branch can multiply them.
+    loaded = []
+    budget = [size]
+
+    def read(register, n, written):
+        if register == ip:
+            return str(n)
+        if register not in written and register not in loaded:
+            loaded.append(register)
+        return "r{}".format(register)
+
+    def store(written):
+        return ["r[{0}] = r{0}".format(register) for register in written]
+
+    def follow(target, written, comparisons, visited):
+        if target == start and target not in breakpoints:
+            return store(written) + ["continue"]
+
+        if (target in breakpoints or target in visited or budget[0] <= 0
+                or not 0 <= target < len(instructions)):
+            return store(written) + ["return {}".format(target)]
+
+        return emit(target, written, comparisons, visited)
+
+    def emit(n, written, comparisons, visited):
+        written = written[:]
+        comparisons = set(comparisons)
+        visited = visited | {n}
+        budget[0] -= 1
+
+        idiom = match_idiom(instructions, n, ip, breakpoints)
+
+        if idiom is not None:
+            return emit_idiom(n, *idiom, written, comparisons, visited)
+
+        opcode, a, b, c = instructions[n]
+        expression = EXPRESSIONS[opcode]
+        operands = {"a": a, "b": b}
+
+        if "{ra}" in expression:
+            operands["ra"] = read(a, n, written)
+        if "{rb}" in expression:
+            operands["rb"] = read(b, n, written)
+
+        expression = expression.format(**operands)
+
+        if c != ip:
+            if c not in written:
+                written.append(c)
+
+            if opcode[:2] in ("gt", "eq"):
+                comparisons.add(c)
+            else:
+                comparisons.discard(c)
+
+            return ["r{} = {}".format(c, expression)] + follow(
+                n + 1, written, comparisons, visited
+            )
+
+        if "r" not in expression:
+            # Jumping somewhere that's known now
+            return follow(eval(expression) + 1, written, comparisons, visited)
+
+        if opcode == "addr" and ip in (a, b) and (a if b == ip else b) in \
+                comparisons:
+            # Skipping the next instruction or not
+            condition = "r{}".format(a if b == ip else b)
+            skip = follow(n + 2, written, comparisons, visited)
+            return (["if {}:".format(condition)] +
+                    ["    " + line for line in skip] +
+                    follow(n + 1, written, comparisons, visited))
+
+        return store(written) + ["return ({}) + 1".format(expression)]
+
+    def emit_idiom(n, idiom, operands, written, comparisons, visited):
+        names = {}
+
+        for name, value in operands.items():
+            if name[0].isupper():
+                names[name] = value
+            elif name != "ip":
+                names[name] = "r{}".format(value)
+
+        for name in idiom["reads"]:
+            read(operands[name], n, written)
+
+        for opcode, a, b, c in idiom["pattern"]:
+            if c != "ip" and operands[c] not in written:
+                written.append(operands[c])
+            comparisons.discard(operands[c])
+
+        lines = [line.format(**names) for line in idiom["source"]]
+        exit = n + len(idiom["pattern"])
+
+        return lines + follow(exit, written, comparisons, visited)
+
+    body = emit(start, [], set(), frozenset())
+    body = (["r{0} = r[{0}]".format(register) for register in loaded] +
+            ["while True:"] + ["    " + line for line in body])
+
+    return "def block_{}(r):\n{}\n".format(
+        start, "\n".join("    " + line for line in body)
+    )
+
+
+class CompiledProgram(dict):
+    # Blocks by the instruction they start at, compiled the first time
+    # execution reaches each one
+    def __init__(self, ip, instructions, breakpoints=()):
+        super().__init__()
+        self.ip = ip
+        self.instructions = instructions
+        self.breakpoints = frozenset(breakpoints)
+
+    def __missing__(self, start):
+        source = compile_block(
+            self.ip, self.instructions, start, self.breakpoints
+        )
+        namespace = {"divisor_sum": divisor_sum}
+        exec(compile(source, "<elfcode>", "exec"), namespace)
+
+        block = self[start] = namespace["block_{}".format(start)]
+        return block
+
+
+class Tracer:
+    # Counts how often each instruction runs and every jump taken, and keeps
+    # the registers from the last size times execution reached a breakpoint.
+    # Stops the program after limit instructions, if given.
+    def __init__(self, breakpoints=(), size=100, limit=None):
+        self.breakpoints = frozenset(breakpoints)
+        self.snapshots = deque(maxlen=size)
+        self.limit = limit
+        self.counts = Counter()
+        self.jumps = Counter()
+        self.steps = 0
+
+    def get_loops(self):
+        # Every backward jump taken closes a loop from where it lands to where
+        # it jumped from; outer loops come before those nested in them. A
+        # loop's start is entered however often it ran, less every backward
+        # jump into it (from its own loop or others starting there). Backward
+        # jumps to somewhere never reached any other way (eg. back from a
+        # setup block) aren't loops, so are left out.
+        backward = Counter()
+        for (source, target), n in self.jumps.items():
+            if target <= source:
+                backward[target] += n
+
+        loops = []
+
+        for (source, target), iterations in self.jumps.items():
+            entries = self.counts[target] - backward[target]
+            if target > source or entries <= 0:
+                continue
+
+            executed = sum(self.counts[n] for n in range(target, source + 1))
+            loops.append({
+                "start": target,
+                "end": source,
+                "iterations": iterations,
+                "entries": entries,
+                "executed": executed,
+            })
+
+        loops.sort(key=lambda loop: (loop["start"], -loop["end"]))
+
+        for loop in loops:
+            loop["depth"] = sum(
+                1 for other in loops if other is not loop and
+                other["start"] <= loop["start"] and
+                other["end"] >= loop["end"]
+            )
+
+        return loops
+
+    def report(self, program, width=40):
+        total = max(self.steps, 1)
+        most = max(self.counts.values(), default=1)
+        lines = [
+            "{:,} instructions executed".format(self.steps),
+            "",
+            "  ip        count       %  instruction",
+        ]
+
+        for n, (opcode, a, b, c) in enumerate(program.instructions):
+            count = self.counts[n]
+            lines.append("{:4}  {:11,}  {:5.1f}%  {} {} {} {:<12} {}".format(
+                n, count, 100 * count / total, opcode, a, b, c,
+                "#" * round(width * count / most)
+            ).rstrip())
+
+        lines.extend(["", "Loops (by the backward jump closing them):"])
+
+        for loop in self.get_loops():
+            lines.append(
+                "{}{}-{}: {:,} iterations, entered {:,} times, {:,} "
+                "instructions ({:.1f}%)".format(
+                    "  " * (loop["depth"] + 1), loop["start"], loop["end"],
+                    loop["iterations"], loop["entries"], loop["executed"],
+                    100 * loop["executed"] / total
+                )
+            )
+
+        if self.breakpoints:
+            lines.extend([
+                "",
+                "Last {} of the registers at breakpoints {}:".format(
+                    len(self.snapshots), sorted(self.breakpoints)
+                ),
+                "        step    ip  registers",
+            ])
+            lines.extend(
+                "{:12,}  {:4}  {}".format(step, n, list(register))
+                for step, n, register in self.snapshots
+            )
+
+        return "\n".join(lines)
+
+
+class Program:
+    def __init__(self, lines_to_parse=(), register=None):
+        ip, instructions = parse(lines_to_parse)
+        self.load(instructions, ip, register)
+
+    @classmethod
+    def from_instructions(cls, instructions, ip=None, register=None):
+        # For instructions that are already parsed, as (opcode, a, b, c)
+        program = cls()
+        program.load(instructions, ip, register)
+        return program
+
+    def load(self, instructions, ip=None, register=None):
+        self.ip = ip
+        self.instructions = [tuple(line) for line in instructions]
+        self.register = [0] * 6 if register is None else list(register)
+        self.next_instruction = 0
+        self.compiled = {}
+
+    def compile(self, breakpoints=()):
+        breakpoints = frozenset(breakpoints)
+
+        if breakpoints not in self.compiled:
+            self.compiled[breakpoints] = CompiledProgram(
+                self.ip, self.instructions, breakpoints
+            )
+
+        return self.compiled[breakpoints]
+
+    def execute(self, until=None, tracer=None):
+        # Runs until the program halts or is about to execute instruction
+        # until
+        if tracer is not None:
+            return self.execute_traced(tracer, until)
+
+        blocks = self.compile(() if until is None else (until,))
+        register = self.register
+        end = len(self.instructions)
+        n = self.next_instruction
+
+        if 0 <= n < end and n != until:
+            while 0 <= n < end and n != until:
+                n = blocks[n](register)
+
+            if self.ip is not None:
+                register[self.ip] = n - 1
+
+        self.next_instruction = n
+
+    def execute_traced(self, tracer, until=None):
+        # As execute, but an instruction at a time and nothing compiled, so
+        # tracing costs nothing when it's not being done
+        instructions = self.instructions
+        register = self.register
+        ip = self.ip
+        end = len(instructions)
+        counts = tracer.counts
+        jumps = tracer.jumps
+        breakpoints = tracer.breakpoints
+        limit = tracer.limit
+        n = self.next_instruction
+
+        while 0 <= n < end and n != until:
+            if limit is not None and tracer.steps >= limit:
+                break
+
+            if ip is not None:
+                register[ip] = n
+
+            if n in breakpoints:
+                tracer.snapshots.append((tracer.steps, n, tuple(register)))
+
+            opcode, a, b, c = instructions[n]
+            OPERATIONS[opcode](register, a, b, c)
+            counts[n] += 1
+            tracer.steps += 1
+
+            following = (n if ip is None else register[ip]) + 1
+            if following != n + 1:
+                jumps[(n, following)] += 1
+            n = following
+
+        self.next_instruction = n
+
+    def step(self):
+        # Executes a single instruction, without compiling anything
+        if self.ip is not None:
+            self.register[self.ip] = self.next_instruction
+
+        opcode, a, b, c = self.instructions[self.next_instruction]
+        OPERATIONS[opcode](self.register, a, b, c)
+
+        if self.ip is not None:
+            self.next_instruction = self.register[self.ip]
+        self.next_instruction += 1
+
+    def can_execute(self):
+        return 0 <= self.next_instruction < len(self.instructions)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="shared.elfcode",
+        description="Trace an ElfCode program and report where it spends "
+                    "its time",
+    )
+    parser.add_argument("path", type=Path, help="program to run")
+    parser.add_argument("-r", "--registers", default="0,0,0,0,0,0",
+                        help="starting registers (default: %(default)s)")
+    parser.add_argument("-b", "--break", type=int, action="append",
+                        default=[], dest="breakpoints",
+                        help="instruction to snapshot the registers at "
+                             "(repeatable)")
+    parser.add_argument("-n", "--snapshots", type=int, default=20,
+                        help="how many snapshots to keep "
+                             "(default: %(default)s)")
+    parser.add_argument("-l", "--limit", type=int, default=10_000_000,
+                        help="instructions to run at most "
+                             "(default: %(default)s)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    registers = [int(value) for value in args.registers.split(",")]
+    program = Program(args.path.read_text().splitlines(), registers)
+    tracer = Tracer(args.breakpoints, args.snapshots, args.limit)
+    program.execute(tracer=tracer)
+
+    print(tracer.report(program))
+    print()
+    print("Halted" if not program.can_execute() else "Stopped", "with",
+          program.register)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,644 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Seeded generators for puzzle inputs of (almost) any size. Each returns a
+# list of lines in the same form as shared.utils.get_input, so the output can
+# be fed straight into the existing parsers and solve() functions.
+
+from datetime import date, timedelta
+from itertools import product
+import random
+import string
+
+from .elfcode import OPCODES, OPERATIONS
+
+
+def generate_day01(size, rng):
+    deltas = [rng.choice((-1, 1)) * rng.randint(1, 100) for _ in range(size)]
+    return ["{:+d}".format(delta) for delta in deltas]
+
+
+def generate_day02(size, rng, length=26):
+    box_ids = set()
+
+    while len(box_ids) < max(size - 1, 1):
+        box_ids.add("".join(
+            rng.choice(string.ascii_lowercase) for _ in range(length)
+        ))
+
+    box_ids = list(box_ids)
+    rng.shuffle(box_ids)
+
+    # Add the one pair of IDs that differ by a single character (random IDs
+    # this long are all but certain to differ by more than that otherwise)
+    original = rng.choice(box_ids)
+    pos = rng.randrange(length)
+    replacement = rng.choice(string.ascii_lowercase.replace(original[pos], ""))
+    box_ids.insert(
+        rng.randrange(len(box_ids) + 1),
+        original[:pos] + replacement + original[pos + 1:]
+    )
+
+    return box_ids
+
+
+def generate_day03(size, rng, fabric_size=1000):
+    claims = []
+
+    for n in range(1, size):
+        width = rng.randint(10, 29)
+        height = rng.randint(10, 29)
+
+        if n % 2 == 0 or n == size - 1 > 1:
+            # Overlap the previous claim, so no claim stands alone
+            _, x, y, _, _ = claims[-1]
+            x = min(max(x + rng.randint(-5, 5), 0), fabric_size - width)
+            y = min(max(y + rng.randint(-5, 5), 0), fabric_size - height)
+        else:
+            x = rng.randint(0, fabric_size - width)
+            y = rng.randint(0, fabric_size - height)
+
+        claims.append((n, x, y, width, height))
+
+    # The claim that doesn't overlap any other sits just off the fabric used
+    # for the rest
+    claims.append((size, fabric_size + 1, rng.randint(0, 100), 5, 5))
+    rng.shuffle(claims)
+
+    return ["#{} @ {},{}: {}x{}".format(*claim) for claim in claims]
+
+
+def generate_day04(size, rng):
+    # Shifts are keyed by date, so there's at most one per day of 1518
+    first_day = date(1518, 1, 2)
+    num_days = (date(1518, 12, 31) - first_day).days + 1
+    if size > num_days:
+        raise ValueError("day 4 has at most {} shifts".format(num_days))
+
+    guards = rng.sample(range(10, 4000), max(size // 8, 1))
+    lines = []
+
+    for n, offset in enumerate(sorted(rng.sample(range(num_days), size))):
+        shift_date = first_day + timedelta(days=offset)
+
+        if rng.random() < 0.5:
+            start = "{} 23:{:02}".format(shift_date - timedelta(days=1),
+                                         rng.randint(45, 59))
+        else:
+            start = "{} 00:{:02}".format(shift_date, rng.randint(0, 3))
+
+        lines.append("[{}] Guard #{} begins shift".format(
+            start, rng.choice(guards)
+        ))
+
+        # Make sure at least one guard gets some sleep
+        num_sleeps = rng.randint(1 if n == 0 else 0, 3)
+        minutes = sorted(rng.sample(range(5, 60), num_sleeps * 2))
+
+        for asleep, awake in zip(minutes[::2], minutes[1::2]):
+            lines.append("[{} 00:{:02}] falls asleep".format(shift_date,
+                                                             asleep))
+            lines.append("[{} 00:{:02}] wakes up".format(shift_date, awake))
+
+    rng.shuffle(lines)
+    return lines
+
+
+def generate_day05(size, rng):
+    units = string.ascii_letters
+    return ["".join(rng.choice(units) for _ in range(size))]
+
+
+def generate_day06(size, rng, low=40, high=360):
+    # The solutions assume every distance is under 999
+    coords = rng.sample(
+        [(x, y) for x in range(low, high) for y in range(low, high)], size
+    )
+    return ["{}, {}".format(x, y) for x, y in coords]
+
+
+def generate_day07(size, rng):
+    # Steps are single capital letters, which caps the size of the graph
+    letters = list(string.ascii_uppercase)
+    edges = [(i, j) for i in range(len(letters))
+             for j in range(i + 1, len(letters))]
+    if size > len(edges):
+        raise ValueError(
+            "day 7 has at most {} requirements".format(len(edges))
+        )
+
+    rng.shuffle(letters)
+    return [
+        "Step {} must be finished before step {} can begin.".format(
+            letters[i], letters[j]
+        ) for i, j in rng.sample(edges, size)
+    ]
+
+
+def generate_day08(size, rng):
+    # A random recursive tree, which keeps the depth logarithmic in size
+    children = [[] for _ in range(size)]
+    for node in range(1, size):
+        children[rng.randrange(node)].append(node)
+
+    num_metas = [rng.randint(1, 11) for _ in range(size)]
+    numbers = []
+    stack = [(0, False)]
+
+    while stack:
+        node, children_done = stack.pop()
+
+        if children_done:
+            # Mostly refer to children that exist, for part 2's sake
+            highest = len(children[node]) + 1 if children[node] else 9
+            numbers.extend(
+                rng.randint(1, highest) for _ in range(num_metas[node])
+            )
+        else:
+            numbers.append(len(children[node]))
+            numbers.append(num_metas[node])
+            stack.append((node, True))
+            stack.extend((child, False) for child in reversed(children[node]))
+
+    return [" ".join(str(n) for n in numbers)]
+
+
+def generate_day09(size, rng):
+    return ["{} players; last marble is worth {} points".format(
+        rng.randint(9, 500), size
+    )]
+
+
+def generate_day10(size, rng, message_width=60, message_height=10):
+    # Lights start spread out and converge into a small box at a random time.
+    # Lights that all move together never converge, so there are at least
+    # two, and the second moves differently from the first.
+    time = rng.randint(10000, 11000)
+    velocities = []
+    lines = []
+
+    for n in range(max(size, 2)):
+        x = rng.randrange(message_width)
+        y = rng.randrange(message_height)
+        dx = rng.choice((-1, 1)) * rng.randint(1, 5)
+        dy = rng.choice((-1, 1)) * rng.randint(1, 5)
+        while n == 1 and (dx, dy) == velocities[0]:
+            dx = rng.choice((-1, 1)) * rng.randint(1, 5)
+            dy = rng.choice((-1, 1)) * rng.randint(1, 5)
+
+        velocities.append((dx, dy))
+        lines.append("position=<{: d}, {: d}> velocity=<{: d}, {: d}>".format(
+            x - dx * time, y - dy * time, dx, dy
+        ))
+
+    return lines
+
+
+def generate_day11(size, rng):
+    # The grid is always 300x300; only the serial number varies
+    return [str(rng.randint(1000, 9999))]
+
+
+def generate_day12(size, rng):
+    state = "".join(rng.choice("#.") for _ in range(size))
+
+    # Every rule moves a plant one pot to the right, so the pattern settles
+    # into a steady drift and part 2 can fast-forward
+    patterns = ("".join(pots) for pots in product("#.", repeat=5))
+    rules = ["{} => {}".format(pattern, pattern[1]) for pattern in patterns]
+    rng.shuffle(rules)
+
+    return ["initial state: {}".format(state), ""] + rules
+
+
+def generate_day13(size, rng, pairs_per_loop=10):
+    # Carts run round separate rectangular loops in pairs heading towards each
+    # other, plus one more that is left running once all the others crash
+    num_pairs = max(size // 2, 1)
+    loops = []
+
+    while num_pairs > 0 or not loops:
+        pairs = min(num_pairs, pairs_per_loop)
+        num_pairs -= pairs
+        top = "-"
+
+        for _ in range(pairs):
+            top += ">" + "-" * rng.randint(1, 5) + "<"
+            top += "-" * rng.randint(1, 5)
+
+        loops.append(top)
+
+    # The odd one out runs clockwise round the last loop
+    loops[-1] += ">" + "-" * rng.randint(5, 10)
+
+    width = max(len(top) for top in loops) + 2
+    lines = []
+
+    for top in loops:
+        length = rng.randint(len(top), width - 2)
+        top += "-" * (length - len(top))
+        height = rng.randint(1, 5)
+
+        lines.append("/" + top + "\\")
+        lines.extend("|" + " " * length + "|" for _ in range(height))
+        lines.append("\\" + "-" * length + "/")
+        lines.append("")
+
+    return [line.ljust(width) for line in lines[:-1]]
+
+
+def generate_day14(size, rng):
+    return [str(size)]
+
+
+def generate_day15(size, rng):
+    # Walls only ever take up isolated squares, so the cave stays connected
+    # and every battle runs to completion
+    size = max(size, 7)
+    grid = [["#"] * size for _ in range(size)]
+    open_squares = []
+
+    for y in range(1, size - 1):
+        for x in range(1, size - 1):
+            if x % 2 == 0 and y % 2 == 0 and rng.random() < 0.4:
+                continue
+            grid[y][x] = "."
+            open_squares.append((x, y))
+
+    num_units = max(size * size // 40, 2)
+    for n, (x, y) in enumerate(rng.sample(open_squares, num_units)):
+        grid[y][x] = "GE"[n % 2] if n < 2 else rng.choice("GE")
+
+    return ["".join(row) for row in grid]
+
+
+def _apply_operation(opcode, a, b, c, reg):
+    reg = reg[:]
+    OPERATIONS[opcode](reg, a, b, c)
+    return reg
+
+
+def _matching_operations(before, a, b, c, after):
+    return set(
+        opcode for opcode in OPCODES
+        if _apply_operation(opcode, a, b, c, before) == after
+    )
+
+
+def _random_sample(rng, opcode):
+    before = [rng.randrange(4) for _ in range(4)]
+    a, b, c = (rng.randrange(4) for _ in range(3))
+    return before, a, b, c, _apply_operation(opcode, a, b, c, before)
+
+
+def generate_day16(size, rng, program_length=None):
+    opcodes = list(OPCODES)
+    rng.shuffle(opcodes)
+    numbers = dict(zip(opcodes, rng.sample(range(16), 16)))
+
+    # The solution can only pin down an opcode if its samples match nothing
+    # but opcodes it has already pinned down, so build up an order in which
+    # that holds and only keep samples that respect it
+    order = []
+    remaining = opcodes[:]
+    while remaining:
+        for opcode in remaining:
+            allowed = set(order) | {opcode}
+            for _ in range(1000):
+                sample = _random_sample(rng, opcode)
+                if _matching_operations(*sample) <= allowed:
+                    break
+            else:
+                continue
+            order.append(opcode)
+            remaining.remove(opcode)
+            break
+        else:
+            raise RuntimeError("Unable to find unambiguous samples")
+
+    lines = []
+    for n in range(max(size, 16)):
+        opcode = order[n] if n < 16 else rng.choice(order)
+        allowed = set(order[:order.index(opcode) + 1])
+
+        while True:
+            before, a, b, c, after = _random_sample(rng, opcode)
+            if _matching_operations(before, a, b, c, after) <= allowed:
+                break
+
+        lines.append("Before: {}".format(before))
+        lines.append("{} {} {} {}".format(numbers[opcode], a, b, c))
+        lines.append("After:  {}".format(after))
+        lines.append("")
+
+    lines.extend(["", ""])
+
+    # Mask off anything multiplied so the registers stay small
+    for _ in range(program_length or size):
+        opcode = rng.choice(opcodes)
+        a, b, c = (rng.randrange(4) for _ in range(3))
+        lines.append("{} {} {} {}".format(numbers[opcode], a, b, c))
+        if opcode in ("mulr", "muli"):
+            lines.append("{} {} 255 {}".format(numbers["bani"], c, c))
+
+    return lines
+
+
+def generate_day17(size, rng, cell_size=24):
+    # Open-topped clay buckets, each made of three veins, laid out in rows of
+    # cells so they never overlap. Each row is shifted sideways by a random
+    # amount so water spilling out of one row lands in buckets below.
+    num_buckets = max(size // 3, 1)
+    columns = max(int(num_buckets ** 0.5), 1)
+    left = 500 - (columns * cell_size) // 2
+    lines = []
+
+    for n in range(num_buckets):
+        row, column = divmod(n, columns)
+
+        if column == 0:
+            if row == 0:
+                # Centre a bucket under the spring
+                shift = (500 - left - cell_size // 2) % cell_size
+            else:
+                shift = rng.randrange(cell_size)
+
+        cell_left = left + shift + column * cell_size
+        x1 = cell_left + rng.randint(1, 4)
+        x2 = cell_left + cell_size - rng.randint(2, 5)
+        y2 = 2 + row * cell_size + rng.randint(8, cell_size - 2)
+        y1 = y2 - rng.randint(2, 6)
+
+        lines.append("x={}, y={}..{}".format(x1, y1, y2))
+        lines.append("x={}, y={}..{}".format(x2, y1, y2))
+        lines.append("y={}, x={}..{}".format(y2, x1, x2))
+
+    rng.shuffle(lines)
+    return lines
+
+
+def generate_day18(size, rng):
+    return [
+        "".join(rng.choice("...||#") for _ in range(size))
+        for _ in range(size)
+    ]
+
+
+# The divisor-sum program from the day 19 input with the constants it
+# calculates replaced by seti instructions (padded with no-ops to keep the
+# instruction pointer arithmetic intact)
+DAY19_PROGRAM = [
+    "#ip 3",
+    "addi 3 16 3",
+    "seti 1 6 1",
+    "seti 1 4 5",
+    "mulr 1 5 4",
+    "eqrr 4 2 4",
+    "addr 4 3 3",
+    "addi 3 1 3",
+    "addr 1 0 0",
+    "addi 5 1 5",
+    "gtrr 5 2 4",
+    "addr 3 4 3",
+    "seti 2 6 3",
+    "addi 1 1 1",
+    "gtrr 1 2 4",
+    "addr 4 3 3",
+    "seti 1 1 3",
+    "mulr 3 3 3",
+    "seti {part1} 0 2",
+    "addi 1 0 1",
+    "addi 1 0 1",
+    "addi 1 0 1",
+    "addi 1 0 1",
+    "addi 1 0 1",
+    "addi 1 0 1",
+    "addi 1 0 1",
+    "addr 3 0 3",
+    "seti 0 2 3",
+    "seti {extra} 9 4",
+    "addi 1 0 1",
+    "addi 1 0 1",
+    "addi 1 0 1",
+    "addi 1 0 1",
+    "addi 1 0 1",
+    "addr 2 4 2",
+    "seti 0 4 0",
+    "seti 0 3 3",
+]
+
+
+def generate_day19(size, rng):
+    # size is the number whose divisors part 1 sums; part 2 uses one around
+    # ten thousand times bigger, like the real input
+    extra = rng.randint(9_000, 11_000) * size
+    return [line.format(part1=size, extra=extra) for line in DAY19_PROGRAM]
+
+
+def generate_day20(size, rng):
+    # A random spanning tree of rooms grown outwards from the start, written
+    # out with every branch but the last as a detour in brackets. Mostly
+    # growing from the newest room gives long corridors like the real input.
+    directions = {"N": (0, -1), "E": (1, 0), "S": (0, 1), "W": (-1, 0)}
+    children = {(0, 0): []}
+    frontier = [(0, 0)]
+
+    while len(children) < size and frontier:
+        if rng.random() < 0.75:
+            i = len(frontier) - 1
+        else:
+            i = rng.randrange(len(frontier))
+        x, y = frontier[i]
+        options = [
+            (d, (x + dx, y + dy)) for d, (dx, dy) in directions.items()
+            if (x + dx, y + dy) not in children
+        ]
+
+        if not options:
+            frontier[i] = frontier[-1]
+            frontier.pop()
+            continue
+
+        d, room = rng.choice(options)
+        children[(x, y)].append((d, room))
+        children[room] = []
+        frontier.append(room)
+
+    parts = []
+    stack = [("room", (0, 0))]
+
+    while stack:
+        kind, value = stack.pop()
+
+        if kind == "text":
+            parts.append(value)
+            continue
+
+        branches = children[value]
+        if not branches:
+            continue
+
+        # Pushed in reverse, so detours are written before the last branch
+        *detours, (d, room) = branches
+        stack.append(("room", room))
+        stack.append(("text", d))
+
+        for n, (d, room) in reversed(list(enumerate(detours))):
+            stack.append(("text", "|)" if n == len(detours) - 1 else "|"))
+            stack.append(("room", room))
+            stack.append(("text", d if n else "(" + d))
+
+    return ["^" + "".join(parts) + "$"]
+
+
+DAY21_PROGRAM = [
+    "#ip 4",
+    "seti 123 0 2",
+    "bani 2 456 2",
+    "eqri 2 72 2",
+    "addr 2 4 4",
+    "seti 0 0 4",
+    "seti 0 8 2",
+    "bori 2 65536 5",
+    "seti {seed} 0 2",
+    "bani 5 255 3",
+    "addr 2 3 2",
+    "bani 2 16777215 2",
+    "muli 2 65899 2",
+    "bani 2 16777215 2",
+    "gtir 256 5 3",
+    "addr 3 4 4",
+    "addi 4 1 4",
+    "seti 27 3 4",
+    "seti 0 8 3",
+    "addi 3 1 1",
+    "muli 1 256 1",
+    "gtrr 1 5 1",
+    "addr 1 4 4",
+    "addi 4 1 4",
+    "seti 25 4 4",
+    "addi 3 1 3",
+    "seti 17 2 4",
+    "setr 3 9 5",
+    "seti 7 9 4",
+    "eqrr 2 0 3",
+    "addr 3 4 4",
+    "seti 5 0 4",
+]
+
+
+def generate_day21(size, rng):
+    # The program's size is fixed; only the 24-bit seed it hashes varies
+    seed = rng.randrange(1 << 24)
+    return [line.format(seed=seed) for line in DAY21_PROGRAM]
+
+
+def generate_day22(size, rng):
+    return [
+        "depth: {}".format(rng.randint(3000, 12000)),
+        "target: {},{}".format(rng.randint(5, 15), size),
+    ]
+
+
+def generate_day23(size, rng, spread=100_000_000):
+    return [
+        "pos=<{},{},{}>, r={}".format(
+            rng.randint(-spread, spread),
+            rng.randint(-spread, spread),
+            rng.randint(-spread, spread),
+            rng.randint(spread // 2, spread),
+        ) for _ in range(size)
+    ]
+
+
+GENERATORS = {
+    1: generate_day01,
+    2: generate_day02,
+    3: generate_day03,
+    4: generate_day04,
+    5: generate_day05,
+    6: generate_day06,
+    7: generate_day07,
+    8: generate_day08,
+    9: generate_day09,
+    10: generate_day10,
+    11: generate_day11,
+    12: generate_day12,
+    13: generate_day13,
+    14: generate_day14,
+    15: generate_day15,
+    16: generate_day16,
+    17: generate_day17,
+    18: generate_day18,
+    19: generate_day19,
+    20: generate_day20,
+    21: generate_day21,
+    22: generate_day22,
+    23: generate_day23,
+}
+
+
+# Roughly the size of each day's real input, in the units its generator uses
+# (days 11 and 21 are missing as their inputs don't vary in size)
+REAL_SIZES = {
+    1: 1000,
+    2: 250,
+    3: 1400,
+    4: 270,
+    5: 50000,
+    6: 50,
+    7: 100,
+    8: 2000,
+    9: 71000,
+    10: 370,
+    12: 100,
+    13: 17,
+    14: 540391,
+    15: 32,
+    16: 800,
+    17: 1500,
+    18: 50,
+    19: 1024,
+    20: 7000,
+    22: 740,
+    23: 1000,
+}
+
+
+def generate(day, size, seed=0):
+    if size < 1:
+        raise ValueError("size must be at least 1")
+
+    return GENERATORS[day](size, random.Random(seed))
+
+
+def write_input(path, lines):
+    with open(path, "w") as outfile:
+        for line in lines:
+            outfile.write(line + "\n")
+
+
+if __name__ == '__main__':
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(
+        prog="shared.generators",
+        description="Generate a puzzle input of a given size",
+    )
+    parser.add_argument("day", type=int, choices=sorted(GENERATORS))
+    parser.add_argument("size", type=int, nargs="?",
+                        help="size in the day's own units (default: about "
+                        "the size of the real input)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", help="file to write (default: "
+                        "stdout)")
+    args = parser.parse_args()
+
+    size = args.size or REAL_SIZES.get(args.day, 1)
+    lines = generate(args.day, size, args.seed)
+
+    if args.output:
+        write_input(args.output, lines)
+    else:
+        sys.stdout.writelines(line + "\n" for line in lines)
@@ -0,0 +1,220 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Fixed-size 2D grids stored row-major in a single flat array, indexed by
+# (x, y) with x the column, instead of lists of lists of Python objects.
+# Hot loops can work on grid.cells directly using grid.index() and the
+# offsets from grid.neighbour_offsets(). get() and set() raise IndexError for
+# an x outside the grid (a y outside it works as list indexing would).
+
+from array import array
+
+
+# Indexing a list is quicker than calling chr()
+CHARS = [chr(i) for i in range(256)]
+
+
+class Grid:
+    # Grid of integers, stored in an array.array of the given typecode
+
+    def __init__(self, width, height, fill=0, typecode="q"):
+        self.width = width
+        self.height = height
+        self.cells = self._make_cells(fill, width * height, typecode)
+
+    def _make_cells(self, fill, size, typecode):
+        return array(typecode, [fill]) * size
+
+    @classmethod
+    def from_rows(cls, rows, **kwargs):
+        rows = [list(row) for row in rows]
+        height = len(rows)
+        width = len(rows[0]) if rows else 0
+
+        grid = cls(width, height, **kwargs)
+        for y, row in enumerate(rows):
+            if len(row) != width:
+                raise ValueError("Row {} has {} cells, expected {}".format(
+                    y, len(row), width
+                ))
+            for x, value in enumerate(row):
+                grid.set(x, y, value)
+
+        return grid
+
+    def index(self, x, y):
+        return y * self.width + x
+
+    def position(self, index):
+        y, x = divmod(index, self.width)
+        return x, y
+
+    def in_bounds(self, x, y):
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def _check_x(self, x):
+        # An x off either side would otherwise land in the row before or
+        # after, rather than raising
+        if not 0 <= x < self.width:
+            raise IndexError("x {} outside the grid's width of {}".format(
+                x, self.width
+            ))
+
+    def get(self, x, y):
+        self._check_x(x)
+        return self.cells[y * self.width + x]
+
+    def set(self, x, y, value):
+        self._check_x(x)
+        self.cells[y * self.width + x] = value
+
+    def row(self, y):
+        start = y * self.width
+        return self.cells[start:start + self.width]
+
+    def column(self, x):
+        return self.cells[x::self.width]
+
+    def rows(self):
+        for y in range(self.height):
+            yield self.row(y)
+
+    def to_lists(self):
+        return [list(row) for row in self.rows()]
+
+    def count(self, value):
+        return self.cells.count(value)
+
+    def neighbours(self, x, y, diagonal=False):
+        # Positions next to (x, y) inside the grid, in reading order
+        result = []
+
+        for dy in (-1, 0, 1):
+            ny = y + dy
+            if not 0 <= ny < self.height:
+                continue
+
+            for dx in (-1, 0, 1):
+                if (dx == dy == 0) or (dx and dy and not diagonal):
+                    continue
+
+                nx = x + dx
+                if 0 <= nx < self.width:
+                    result.append((nx, ny))
+
+        return result
+
+    def neighbour_offsets(self, diagonal=False):
+        # Index offsets of the neighbours of a cell, in reading order; only
+        # valid for cells that aren't on the edge of the grid
+        width = self.width
+
+        if diagonal:
+            return (-width - 1, -width, -width + 1, -1,
+                    1, width - 1, width, width + 1)
+
+        return (-width, -1, 1, width)
+
+    def neighbour_indices(self, index, diagonal=False):
+        # As neighbours(), but with flat indices
+        x, y = self.position(index)
+
+        if 0 < x < self.width - 1 and 0 < y < self.height - 1:
+            return [index + offset
+                    for offset in self.neighbour_offsets(diagonal)]
+
+        return [self.index(nx, ny)
+                for nx, ny in self.neighbours(x, y, diagonal)]
+
+    def copy(self):
+        grid = self.__class__.__new__(self.__class__)
+        grid.width = self.width
+        grid.height = self.height
+        grid.cells = self.cells[:]
+        return grid
+
+    def resize(self, width, height, fill=0):
+        # Changes the size in place, keeping each cell's contents at the same
+        # position and filling any new cells with fill
+        old = self.copy()
+
+        self.width = width
+        self.height = height
+        self.cells = self._make_cells(fill, width * height,
+                                      getattr(old.cells, "typecode", None))
+
+        copy_width = min(width, old.width)
+        for y in range(min(height, old.height)):
+            start = y * width
+            old_start = y * old.width
+            self.cells[start:start + copy_width] = \
+                old.cells[old_start:old_start + copy_width]
+
+    def to_numpy(self):
+        # A (height, width) array sharing memory with the grid. numpy is
+        # only imported here, as it takes longer to import than most days
+        # take to run.
+        import numpy
+
+        if isinstance(self.cells, bytearray):
+            dtype = numpy.uint8
+        else:
+            dtype = numpy.dtype(self.cells.typecode)
+
+        return numpy.frombuffer(self.cells, dtype=dtype).reshape(
+            self.height, self.width
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, Grid):
+            return NotImplemented
+
+        return (self.width, self.height, self.cells) == \
+            (other.width, other.height, other.cells)
+
+
+class CharGrid(Grid):
+    # Grid of single characters, stored one byte each in a bytearray. Cells
+    # are got and set as one character strings.
+
+    def __init__(self, width, height, fill="."):
+        super().__init__(width, height, fill)
+
+    def _make_cells(self, fill, size, typecode=None):
+        return bytearray(fill.encode("latin-1")) * size
+
+    @classmethod
+    def from_lines(cls, lines, fill=" "):
+        # Lines shorter than the longest are padded with fill
+        lines = list(lines)
+        width = max((len(line) for line in lines), default=0)
+
+        grid = cls(width, len(lines), fill)
+        for y, line in enumerate(lines):
+            start = y * width
+            grid.cells[start:start + len(line)] = line.encode("latin-1")
+
+        return grid
+
+    def get(self, x, y):
+        self._check_x(x)
+        return CHARS[self.cells[y * self.width + x]]
+
+    def set(self, x, y, value):
+        self._check_x(x)
+        self.cells[y * self.width + x] = ord(value)
+
+    def row(self, y):
+        return super().row(y).decode("latin-1")
+
+    def column(self, x):
+        return super().column(x).decode("latin-1")
+
+    def count(self, value):
+        return self.cells.count(value.encode("latin-1"))
+
+    def resize(self, width, height, fill="."):
+        super().resize(width, height, fill)
+
+    def __str__(self):
+        return "\n".join(self.rows())
@@ -0,0 +1,17 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# numpy is optional: modules that can use it import it from here, getting
+# None if it isn't installed, and call require_numpy() before anything that
+# can't do without it. It isn't imported by shared.utils, as it takes longer
+# to import than most days take to run.
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def require_numpy(user):
+    if numpy is None:
+        raise ImportError("numpy is required for {}".format(user))
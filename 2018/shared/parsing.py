@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Parse whole inputs in one pass instead of matching a regex line by line,
+# for the many inputs that boil down to a fixed number of integers per line.
+
+from array import array
+import mmap
+import re
+
+from .utils import MappedInput, integer_regex as bytes_integer_regex
+
+
+integer_regex = re.compile(r"[-+]?\d+")
+
+
+def as_buffer(text):
+    # A list of lines (as from get_input) is joined into a single string;
+    # str, bytes and memory maps are used as they are
+    if isinstance(text, (str, bytes, bytearray, memoryview, mmap.mmap)):
+        return text
+    return "\n".join(text)
+
+
+def extract_integers(text):
+    if isinstance(text, MappedInput):
+        return text.integers()
+
+    buffer = as_buffer(text)
+    regex = integer_regex if isinstance(buffer, str) else bytes_integer_regex
+
+    return array("q", map(int, regex.findall(buffer)))
+
+
+def integer_rows(text, width):
+    # The integers of an input with width of them on every line, as a flat
+    # array; use rows() or to_numpy() to split it up. They're all found by
+    # one regex pass over the whole input rather than a match per line, so a
+    # parser built on this needn't handle lines itself.
+    values = extract_integers(text)
+
+    if len(values) % width != 0:
+        raise ValueError("Expected {} integers per line, found {} in "
+                         "total".format(width, len(values)))
+
+    return values
+
+
+def rows(values, width):
+    # Iterates over tuples of width consecutive values
+    return zip(*[iter(values)] * width)
+
+
+def to_numpy(values, width):
+    # A (rows, width) int64 array sharing memory with the packed values.
+    # numpy is only imported here, as it takes longer to import than most
+    # days take to run.
+    from .optional import numpy, require_numpy
+
+    require_numpy("to_numpy")
+
+    return numpy.frombuffer(values, dtype=numpy.int64).reshape(-1, width)
@@ -0,0 +1,310 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Opt-in profiling of solve() calls (via the runner's --profile) or of any
+# script's __main__ block, eg. a 2018 day's or the 2017 ones:
+#
+#     python3 -m shared.profiling --profile all day01.solution1
+#     python3 -m shared.profiling --profile all ../2017/d15/duel.py
+#
+# Which profilers run is read from AOC_PROFILE, a comma separated list of
+# PROFILERS (or "all"); their output goes to AOC_PROFILE_DIR.
+
+import argparse
+import ast
+from collections import Counter
+import cProfile
+import os
+from pathlib import Path
+import runpy
+import signal
+import sys
+import threading
+import tracemalloc
+
+
+PROFILERS = ("cprofile", "tracemalloc", "sample")
+DEFAULT_OUTPUT_DIR = Path("profiles")
+
+
+def get_enabled_profilers():
+    value = os.environ.get("AOC_PROFILE", "")
+    names = [name.strip() for name in value.split(",") if name.strip()]
+
+    if "all" in names:
+        return list(PROFILERS)
+
+    for name in names:
+        if name not in PROFILERS:
+            raise ValueError("Unknown profiler {!r}, expected one of: "
+                             "{}".format(name, ", ".join(PROFILERS)))
+
+    return names
+
+
+def get_output_dir():
+    return Path(os.environ.get("AOC_PROFILE_DIR", DEFAULT_OUTPUT_DIR))
+
+
+def get_frame_name(frame):
+    code = frame.f_code
+    return "{}:{}:{}".format(
+        Path(code.co_filename).name, code.co_name, code.co_firstlineno
+    )
+
+
+class SamplingProfiler:
+    # Records the main thread's stack every interval seconds of CPU time,
+    # from a SIGPROF handler, so there's no tracing cost between samples.
+    # Frames from root (if given) outwards are left off.
+
+    def __init__(self, interval=0.001, root=None):
+        self.interval = interval
+        self.root = root
+        self.stacks = Counter()
+        self._previous_handler = None
+
+    def _sample(self, signum, frame):
+        # Leave out the handler itself if interrupted by another sample
+        while frame is not None and frame.f_code.co_filename == __file__:
+            frame = frame.f_back
+
+        names = []
+        while frame is not None and frame is not self.root:
+            names.append(get_frame_name(frame))
+            frame = frame.f_back
+
+        # Nothing left means it landed in the profiler's own code, eg. while
+        # starting or stopping
+        if names:
+            self.stacks[";".join(reversed(names))] += 1
+
+    def start(self):
+        if not hasattr(signal, "setitimer"):
+            raise RuntimeError("Sampling needs signal.setitimer (Unix only)")
+
+        self._previous_handler = signal.signal(signal.SIGPROF, self._sample)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+
+    def stop(self):
+        signal.setitimer(signal.ITIMER_PROF, 0)
+        signal.signal(signal.SIGPROF, self._previous_handler)
+
+    def write_collapsed(self, path):
+        # One "frame;frame;frame count" line per stack, as read by
+        # flamegraph.pl and speedscope
+        with open(path, "w") as outfile:
+            for stack, count in sorted(self.stacks.items()):
+                outfile.write("{} {}\n".format(stack, count))
+
+
+class PeakSnapshotter:
+    # Traces allocations, keeping a snapshot from close to the peak: memory
+    # use is polled from a thread and a new snapshot taken whenever it has
+    # grown by growth since the last one. Snapshots taken after the call
+    # returns would only show what's left once its intermediates are freed.
+
+    def __init__(self, interval=0.05, growth=1.25):
+        self.interval = interval
+        self.growth = growth
+        self.snapshot = None
+        self.snapshot_size = 0
+        self.peak = 0
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._poll, daemon=True)
+
+    def _take_snapshot(self, size):
+        self.snapshot = tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ])
+        self.snapshot_size = size
+
+    def _poll(self):
+        while not self._stopped.wait(self.interval):
+            current = tracemalloc.get_traced_memory()[0]
+            if current > self.snapshot_size * self.growth:
+                self._take_snapshot(current)
+
+    def start(self):
+        tracemalloc.start()
+        self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+        self._thread.join()
+
+        current, self.peak = tracemalloc.get_traced_memory()
+        if self.snapshot is None or current > self.snapshot_size:
+            self._take_snapshot(current)
+        tracemalloc.stop()
+
+    def write_report(self, path, limit=20):
+        with open(path, "w") as outfile:
+            outfile.write("Peak traced memory: {:.1f} KiB\n\n".format(
+                self.peak / 1024
+            ))
+            outfile.write("Top {} allocation sites at {:.1f} KiB:\n".format(
+                limit, self.snapshot_size / 1024
+            ))
+            for stat in self.snapshot.statistics("lineno")[:limit]:
+                outfile.write("{}\n".format(stat))
+
+
+def profile_call(name, func, *args, profilers=None, output_dir=None):
+    # Calls func(*args) under the enabled profilers, writing their output to
+    # <output_dir>/<name>.{pstats,tracemalloc.txt,collapsed}. With none
+    # enabled it's just a call.
+    if profilers is None:
+        profilers = get_enabled_profilers()
+
+    if not profilers:
+        return func(*args)
+
+    if output_dir is None:
+        output_dir = get_output_dir()
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    base_path = output_dir.joinpath(name)
+
+    profile = cProfile.Profile() if "cprofile" in profilers else None
+    sampler = None
+    snapshotter = None
+
+    if "sample" in profilers:
+        sampler = SamplingProfiler(root=sys._getframe())
+    if "tracemalloc" in profilers:
+        snapshotter = PeakSnapshotter()
+
+    if snapshotter is not None:
+        snapshotter.start()
+    if sampler is not None:
+        sampler.start()
+    if profile is not None:
+        profile.enable()
+
+    try:
+        return func(*args)
+    finally:
+        # Stop everything before writing anything, so none of them records
+        # the others' output
+        if profile is not None:
+            profile.disable()
+        if sampler is not None:
+            sampler.stop()
+        if snapshotter is not None:
+            snapshotter.stop()
+
+        if profile is not None:
+            profile.dump_stats(str(base_path) + ".pstats")
+        if sampler is not None:
+            sampler.write_collapsed(str(base_path) + ".collapsed")
+        if snapshotter is not None:
+            snapshotter.write_report(str(base_path) + ".tracemalloc.txt")
+
+
+def get_module_name(path):
+    # The dotted name path is imported by and the directory it's imported
+    # from, if it has relative imports (eg. day01/solution1.py, which needs
+    # running as day01.solution1); otherwise None, for a loose script like
+    # the 2017 ones, even those in a directory with an __init__.py
+    tree = ast.parse(path.read_bytes(), str(path))
+    if not any(isinstance(node, ast.ImportFrom) and node.level
+               for node in ast.walk(tree)):
+        return None, None
+
+    names = [path.stem]
+    directory = path.parent
+
+    while directory.joinpath("__init__.py").exists():
+        names.append(directory.name)
+        directory = directory.parent
+
+    return ".".join(reversed(names)), directory
+
+
+def run_script(script, args):
+    # Runs a script's __main__ block. script is a module name (eg.
+    # day01.solution1) or a path: a module in a package is run as one,
+    # while a loose script (eg. the 2017 solutions) is run as if started
+    # from its own directory, which it needs to find its input.txt
+    path = Path(script)
+    if path.suffix == ".py" or path.exists():
+        path = path.resolve()
+        module_name, import_dir = get_module_name(path)
+    else:
+        module_name, import_dir = str(script), None
+
+    old_cwd = os.getcwd()
+    old_argv = sys.argv
+    old_path = sys.path[:]
+
+    if module_name is None:
+        os.chdir(path.parent)
+        sys.path.insert(0, str(path.parent))
+    elif import_dir is not None:
+        sys.path.insert(0, str(import_dir))
+    sys.argv = [str(script)] + list(args)
+
+    try:
+        if module_name is None:
+            runpy.run_path(str(path), run_name="__main__")
+        else:
+            runpy.run_module(module_name, run_name="__main__",
+                             alter_sys=True)
+    finally:
+        os.chdir(old_cwd)
+        sys.argv = old_argv
+        sys.path[:] = old_path
+
+
+def get_profile_name(script):
+    # eg. d15.duel or day01.solution1
+    path = Path(script)
+    if path.suffix == ".py" or path.exists():
+        module_name, _ = get_module_name(path.resolve())
+        if module_name is None:
+            return "{}.{}".format(path.resolve().parent.name, path.stem)
+        return module_name
+    return str(script)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="shared.profiling",
+        description="Profile a script's __main__ block",
+    )
+    parser.add_argument("--profile", action="append", dest="profilers",
+                        choices=PROFILERS + ("all",),
+                        help="profiler to run (repeatable, default: "
+                             "AOC_PROFILE, or all)")
+    parser.add_argument("-o", "--output-dir", type=Path,
+                        default=DEFAULT_OUTPUT_DIR,
+                        help="directory to write profiles to")
+    parser.add_argument("script",
+                        help="script to run, or module (eg. day01.solution1)")
+    parser.add_argument("args", nargs=argparse.REMAINDER,
+                        help="arguments for the script")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    profilers = args.profilers or get_enabled_profilers() or ["all"]
+    if "all" in profilers:
+        profilers = list(PROFILERS)
+
+    name = get_profile_name(args.script)
+    output_dir = args.output_dir.resolve()
+
+    profile_call(name, run_script, args.script, args.args,
+                 profilers=profilers, output_dir=output_dir)
+
+    print("Profiles written to {}".format(output_dir.joinpath(name)),
+          file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
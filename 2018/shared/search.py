@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Shortest path searches over implicit graphs. Graphs are given as a
+# neighbours(state) function, so nothing needs building up front, and states
+# can be anything hashable; plain ints (eg. flat grid indices from
+# shared.grid) are cheapest.
+#
+# Each search returns a dict of the distance to every state it reached
+# (which for Dijkstra and A* may include some not yet settled when the goal
+# was found). Where states are compared to break ties, smaller states come
+# first, so grid indices are visited in reading order.
+
+from heapq import heappop, heappush
+
+
+def bfs(sources, neighbours, until=None):
+    # Breadth-first search from every source at once, for unweighted graphs.
+    # Works a whole layer (bucket) of equally distant states at a time, and
+    # with until(state) given, stops after the first layer where it's true.
+    distances = dict.fromkeys(sources, 0)
+    layer = list(distances)
+    distance = 0
+
+    while layer:
+        if until is not None and any(until(state) for state in layer):
+            break
+
+        distance += 1
+        next_layer = []
+
+        for state in layer:
+            for neighbour in neighbours(state):
+                if neighbour not in distances:
+                    distances[neighbour] = distance
+                    next_layer.append(neighbour)
+
+        layer = next_layer
+
+    return distances
+
+
+def bucket_search(sources, neighbours, goal=None):
+    # Dijkstra's algorithm with a bucket queue (Dial's algorithm), for graphs
+    # with small non-negative integer weights. neighbours(state) gives
+    # (state, weight) pairs.
+    distances = dict.fromkeys(sources, 0)
+    buckets = [list(distances)]
+    distance = 0
+
+    while distance < len(buckets):
+        for state in buckets[distance]:
+            if distances[state] != distance:
+                continue  # already reached by a shorter route
+
+            if state == goal:
+                return distances
+
+            for neighbour, weight in neighbours(state):
+                new_distance = distance + weight
+
+                if new_distance < distances.get(neighbour, new_distance + 1):
+                    distances[neighbour] = new_distance
+
+                    while len(buckets) <= new_distance:
+                        buckets.append([])
+                    buckets[new_distance].append(neighbour)
+
+        buckets[distance] = None
+        distance += 1
+
+    return distances
+
+
+def dijkstra(sources, neighbours, goal=None):
+    # For non-negative weights of any size; neighbours(state) gives (state,
+    # weight) pairs and states must be orderable
+    distances = dict.fromkeys(sources, 0)
+    queue = [(0, state) for state in distances]
+    queue.sort()
+
+    while queue:
+        distance, state = heappop(queue)
+
+        if distances[state] < distance:
+            continue
+
+        if state == goal:
+            break
+
+        for neighbour, weight in neighbours(state):
+            new_distance = distance + weight
+
+            if new_distance < distances.get(neighbour, new_distance + 1):
+                distances[neighbour] = new_distance
+                heappush(queue, (new_distance, neighbour))
+
+    return distances
+
+
+def astar(sources, neighbours, heuristic, goal):
+    # As dijkstra(), guided towards goal by heuristic(state), which mustn't
+    # overestimate the remaining distance
+    distances = dict.fromkeys(sources, 0)
+    queue = [(heuristic(state), 0, state) for state in distances]
+    queue.sort()
+
+    while queue:
+        estimate, distance, state = heappop(queue)
+
+        if distances[state] < distance:
+            continue
+
+        if state == goal:
+            break
+
+        for neighbour, weight in neighbours(state):
+            new_distance = distance + weight
+
+            if new_distance < distances.get(neighbour, new_distance + 1):
+                distances[neighbour] = new_distance
+                heappush(queue, (
+                    new_distance + heuristic(neighbour), new_distance,
+                    neighbour
+                ))
+
+    return distances
@@ -0,0 +1,27 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Helpers for the days' tests
+
+from pathlib import Path
+import tempfile
+import unittest
+
+
+class InputFileTestCase(unittest.TestCase):
+    # For tests of code that reads an input file: each test gets its own
+    # temporary directory, with self.path an input.txt in it for write() to
+    # fill
+
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tempdir.name).joinpath("input.txt")
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def write(self, data):
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        with open(self.path, "wb") as outfile:
+            outfile.write(data)
@@ -0,0 +1,900 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from array import array
+from importlib import import_module
+from operator import itemgetter
+import os
+from pathlib import Path
+import signal
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+from day02.solution2 import find_off_by_one_pair
+from .testing import InputFileTestCase
+from . import (
+    automata, cache, checkpoint, cycles, elfcode, generators, grid, optional,
+    parsing, profiling, search, utils,
+)
+
+
+def solve(day, part, input_text, *args):
+    module = import_module("day{:02}.solution{}".format(day, part))
+    return module.solve(input_text, *args)
+
+
+class TestGenerators(unittest.TestCase):
+    def test_generators_are_deterministic(self):
+        for day in generators.GENERATORS:
+            self.assertEqual(generators.generate(day, 20, seed=3),
+                             generators.generate(day, 20, seed=3))
+
+        self.assertNotEqual(generators.generate(1, 20, seed=1),
+                            generators.generate(1, 20, seed=2))
+
+    def test_size_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            generators.generate(1, 0)
+
+    def test_size_limits(self):
+        with self.assertRaises(ValueError):
+            generators.generate(4, 1000)
+        with self.assertRaises(ValueError):
+            generators.generate(7, 1000)
+
+    def test_line_counts(self):
+        self.assertEqual(500, len(generators.generate(1, 500)))
+        self.assertEqual(500, len(generators.generate(2, 500)))
+        self.assertEqual(500, len(generators.generate(3, 500)))
+        self.assertEqual(500, len(generators.generate(23, 500)))
+        self.assertEqual(500, len(generators.generate(5, 500)[0]))
+
+    def test_generated_inputs_can_be_solved(self):
+        small_inputs = [
+            (1, 200), (2, 100), (3, 200), (4, 50), (5, 500), (6, 5),
+            (7, 30), (8, 100), (9, 500), (10, 30), (12, 50), (13, 5),
+            (15, 7), (16, 50), (17, 30), (18, 10), (19, 30), (20, 200),
+            (21, 1), (22, 20), (23, 20),
+        ]
+
+        for day, size in small_inputs:
+            for part in (1, 2):
+                if (day, part) == (23, 2):
+                    continue  # searches the whole bounding box
+
+                input_text = generators.generate(day, size)
+                if day == 5:
+                    input_text = input_text[0]
+                solve(day, part, input_text)
+
+    def test_day02_has_one_off_by_one_pair(self):
+        box_ids = generators.generate(2, 300, seed=5)
+        one, two = find_off_by_one_pair(box_ids)
+        differences = sum(a != b for a, b in zip(one, two))
+        self.assertEqual(1, differences)
+
+    def test_day03_has_intact_claim(self):
+        claims = generators.generate(3, 2000)
+        self.assertEqual(2000, solve(3, 2, claims))
+
+    def test_day10_lights_converge(self):
+        # A single light, or lights all moving together, keep the same
+        # bounding box forever, so solving would never finish
+        self.assertEqual(2, len(generators.generate(10, 1)))
+        for seed in range(20):
+            self.assertIsInstance(
+                solve(10, 2, generators.generate(10, 2, seed)), int
+            )
+
+    def test_day13_leaves_one_cart(self):
+        # Solving part 2 would loop forever if not
+        self.assertIsInstance(solve(13, 2, generators.generate(13, 21)), str)
+
+    def test_day19_sums_divisors(self):
+        program = generators.generate(19, 60)
+        self.assertEqual(168, solve(19, 1, program))
+
+
+class TestMappedInput(InputFileTestCase):
+    def test_lines(self):
+        self.write(b"+1\n-2\r\n\n+3")
+        with utils.MappedInput(self.path) as mapped:
+            self.assertEqual([b"+1", b"-2", b"", b"+3"],
+                             list(mapped.lines()))
+            self.assertEqual(["+1", "-2", "", "+3"],
+                             list(mapped.text_lines()))
+            self.assertEqual([b"+1", b"-2", b"", b"+3"],
+                             list(mapped.lines(chunk_size=1)))
+
+    def test_chunks(self):
+        self.write(b"+1\n-2\r\n\n+3")
+        with utils.MappedInput(self.path) as mapped:
+            self.assertEqual([b"+1\n-2\r\n\n+3"], list(mapped.chunks()))
+            # Never part of a line
+            self.assertEqual([b"+1\n", b"-2\r\n", b"\n", b"+3"],
+                             list(mapped.chunks(chunk_size=1)))
+
+    def test_lines_match_get_input(self):
+        generators.write_input(self.path, generators.generate(3, 100))
+        self.assertEqual(utils.get_input(self.path),
+                         list(utils.iter_lines(self.path)))
+
+    def test_integers(self):
+        self.write(b"#1 @ 1,3: 4x4\npos=<-5,+6,7>, r=8\n")
+        with utils.MappedInput(self.path) as mapped:
+            self.assertEqual([1, 1, 3, 4, 4, -5, 6, 7, 8],
+                             list(mapped.integers()))
+            # Chunks smaller than a line still only break at line endings
+            self.assertEqual([1, 1, 3, 4, 4, -5, 6, 7, 8],
+                             list(mapped.integers(chunk_size=2)))
+
+    def test_empty_file(self):
+        self.write(b"")
+        with utils.MappedInput(self.path) as mapped:
+            self.assertEqual(0, len(mapped))
+            self.assertEqual([], list(mapped.lines()))
+            self.assertEqual([], list(mapped.integers()))
+
+    def test_streaming_into_solutions(self):
+        for day, size in ((1, 1000), (3, 200), (23, 100)):
+            generators.write_input(
+                self.path, generators.generate(day, size)
+            )
+            self.assertEqual(
+                solve(day, 1, utils.get_input(self.path)),
+                solve(day, 1, utils.iter_lines(self.path)),
+            )
+
+    def test_get_integers(self):
+        generators.write_input(self.path, generators.generate(1, 1000))
+        self.assertEqual(solve(1, 1, utils.get_input(self.path)),
+                         sum(utils.get_integers(self.path)))
+
+
+class TestParsing(unittest.TestCase):
+    lines = ["#1 @ 1,3: 4x4", "#2 @ 3,1: 4x4", "#3 @ 5,5: 2x2"]
+    expected = [1, 1, 3, 4, 4, 2, 3, 1, 4, 4, 3, 5, 5, 2, 2]
+
+    def test_extract_integers(self):
+        self.assertEqual(self.expected,
+                         list(parsing.extract_integers(self.lines)))
+        self.assertEqual(self.expected,
+                         list(parsing.extract_integers("\n".join(self.lines))))
+        self.assertEqual([-1, 2, 3], list(parsing.extract_integers(
+            b"pos=<-1,+2,3>"
+        )))
+
+    def test_integer_rows(self):
+        values = parsing.integer_rows(self.lines, 5)
+        self.assertEqual([(1, 1, 3, 4, 4), (2, 3, 1, 4, 4), (3, 5, 5, 2, 2)],
+                         list(parsing.rows(values, 5)))
+
+        with self.assertRaises(ValueError):
+            parsing.integer_rows(self.lines, 4)
+
+    @unittest.skipIf(optional.numpy is None, "numpy not installed")
+    def test_to_numpy(self):
+        values = parsing.integer_rows(self.lines, 5)
+        matrix = parsing.to_numpy(values, 5)
+        self.assertEqual((3, 5), matrix.shape)
+        self.assertEqual([2, 3, 1, 4, 4], matrix[1].tolist())
+
+
+class TestParseCache(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.cache = cache.ParseCache(self.tempdir.name)
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def test_store_and_load(self):
+        key = self.cache.make_key("parser", 1, cache.hash_input(["a", "b"]))
+        with self.assertRaises(KeyError):
+            self.cache.load(key)
+
+        self.cache.store(key, [(1, 2), {3: "c"}])
+        self.assertEqual([(1, 2), {3: "c"}], self.cache.load(key))
+
+    def test_key_depends_on_everything(self):
+        input_hash = cache.hash_input(["a", "b"])
+        keys = {
+            self.cache.make_key("parser", 1, input_hash),
+            self.cache.make_key("parser", 2, input_hash),
+            self.cache.make_key("other", 1, input_hash),
+            self.cache.make_key("parser", 1, cache.hash_input(["a", "c"])),
+        }
+        self.assertEqual(4, len(keys))
+
+    def test_hash_input(self):
+        self.assertEqual(cache.hash_input(["a", "b"]),
+                         cache.hash_input("a\nb\n"))
+        self.assertIsNone(cache.hash_input(line for line in ["a"]))
+
+    def test_corrupt_entries_are_misses(self):
+        key = self.cache.make_key("parser", 1, cache.hash_input("a"))
+        self.cache.store(key, "value")
+        self.cache._path(key).write_bytes(b"not a pickle")
+
+        with self.assertRaises(KeyError):
+            self.cache.load(key)
+        self.assertFalse(self.cache._path(key).exists())
+
+    def test_least_recently_used_are_evicted(self):
+        keys = [self.cache.make_key("parser", 1, str(n)) for n in range(3)]
+        for age, key in enumerate(keys):
+            self.cache.store(key, bytes(1000))
+            os.utime(self.cache._path(key), (age, age))
+
+        self.cache.load(keys[0])  # now the most recently used
+        self.cache.max_bytes = 2500
+        self.cache.evict()
+
+        self.assertTrue(self.cache._path(keys[0]).exists())
+        self.assertFalse(self.cache._path(keys[1]).exists())
+        self.assertTrue(self.cache._path(keys[2]).exists())
+
+    def test_cached_parser(self):
+        calls = []
+
+        @cache.cached_parser()
+        def parse(input_text):
+            calls.append(input_text)
+            return [int(line) for line in input_text]
+
+        with mock.patch.dict(os.environ, {"AOC_PARSE_CACHE": ""}):
+            self.assertEqual([1, 2], parse(["1", "2"]))
+            self.assertEqual([1, 2], parse(["1", "2"]))
+            self.assertEqual(2, len(calls))
+
+        env = {"AOC_PARSE_CACHE": self.tempdir.name}
+        with mock.patch.dict(os.environ, env):
+            self.assertEqual([1, 2], parse(["1", "2"]))
+            self.assertEqual([1, 2], parse(["1", "2"]))
+            self.assertEqual(3, len(calls))
+
+            self.assertEqual([3], parse(iter(["3"])))
+            self.assertEqual([3], parse(iter(["3"])))
+            self.assertEqual(5, len(calls))
+
+    def test_cached_parser_source_hash(self):
+        calls = []
+
+        def make_parser(source_hash):
+            with mock.patch.object(cache, "hash_source",
+                                   return_value=source_hash):
+                @cache.cached_parser()
+                def parse(input_text):
+                    calls.append(input_text)
+                    return len(input_text)
+
+            return parse
+
+        env = {"AOC_PARSE_CACHE": self.tempdir.name}
+        with mock.patch.dict(os.environ, env):
+            self.assertEqual(2, make_parser("a")(["1", "2"]))
+            self.assertEqual(2, make_parser("a")(["1", "2"]))
+            self.assertEqual(1, len(calls))
+
+            self.assertEqual(2, make_parser("b")(["1", "2"]))
+            self.assertEqual(2, len(calls))
+
+    def test_hash_source(self):
+        self.assertEqual(cache.hash_source(cache.hash_input),
+                         cache.hash_source(cache.hash_source))
+        self.assertNotEqual(cache.hash_source(cache.hash_input),
+                            cache.hash_source(grid.Grid.from_rows))
+
+    def test_cached_solutions(self):
+        env = {"AOC_PARSE_CACHE": self.tempdir.name}
+        for day, size in ((3, 100), (4, 20), (10, 20), (17, 20), (23, 50)):
+            input_text = generators.generate(day, size)
+            expected = solve(day, 1, input_text)
+
+            with mock.patch.dict(os.environ, env):
+                self.assertEqual(expected, solve(day, 1, input_text))
+                self.assertEqual(expected, solve(day, 1, input_text))
+
+
+class TestGrid(unittest.TestCase):
+    rows = [[1, 2, 3], [4, 5, 6], [7, 8, 9], [10, 11, 12]]
+
+    def test_get_and_set(self):
+        g = grid.Grid.from_rows(self.rows)
+        self.assertEqual((3, 4), (g.width, g.height))
+        self.assertEqual(6, g.get(2, 1))
+        g.set(2, 1, -6)
+        self.assertEqual(-6, g.get(2, 1))
+        self.assertEqual((2, 1), g.position(g.index(2, 1)))
+        self.assertTrue(g.in_bounds(2, 3))
+        self.assertFalse(g.in_bounds(3, 0))
+        self.assertFalse(g.in_bounds(0, -1))
+
+        with self.assertRaises(ValueError):
+            grid.Grid.from_rows([[1, 2], [3]])
+
+    def test_x_out_of_bounds(self):
+        # Rather than wrapping round into the row before or after
+        g = grid.Grid.from_rows(self.rows)
+        chars = grid.CharGrid.from_lines(["ab", "cd"])
+        for x in (-1, 3):
+            with self.assertRaises(IndexError):
+                g.get(x, 1)
+            with self.assertRaises(IndexError):
+                g.set(x, 1, 0)
+        with self.assertRaises(IndexError):
+            chars.get(-1, 1)
+        with self.assertRaises(IndexError):
+            chars.set(2, 0, "x")
+        self.assertEqual(self.rows, g.to_lists())
+
+    def test_rows_and_columns(self):
+        g = grid.Grid.from_rows(self.rows)
+        self.assertEqual([4, 5, 6], list(g.row(1)))
+        self.assertEqual([2, 5, 8, 11], list(g.column(1)))
+        self.assertEqual(self.rows, g.to_lists())
+
+    def test_neighbours(self):
+        g = grid.Grid.from_rows(self.rows)
+        self.assertEqual([(1, 0), (0, 1)], g.neighbours(0, 0))
+        self.assertEqual([(1, 0), (0, 1), (2, 1), (1, 2)], g.neighbours(1, 1))
+        self.assertEqual([(0, 0), (1, 0), (2, 0), (0, 1), (2, 1),
+                          (0, 2), (1, 2), (2, 2)],
+                         g.neighbours(1, 1, diagonal=True))
+
+        for x in range(g.width):
+            for y in range(g.height):
+                for diagonal in (False, True):
+                    self.assertEqual(
+                        [g.index(*n) for n in g.neighbours(x, y, diagonal)],
+                        g.neighbour_indices(g.index(x, y), diagonal),
+                    )
+
+    def test_copy_and_resize(self):
+        g = grid.Grid.from_rows(self.rows)
+        copy = g.copy()
+        copy.set(0, 0, 0)
+        self.assertEqual(1, g.get(0, 0))
+        self.assertNotEqual(g, copy)
+
+        g.resize(4, 2, fill=-1)
+        self.assertEqual([[1, 2, 3, -1], [4, 5, 6, -1]], g.to_lists())
+
+    def test_char_grid(self):
+        g = grid.CharGrid.from_lines(["#..", "#.", "###"])
+        self.assertEqual((3, 3), (g.width, g.height))
+        self.assertEqual("#..", g.row(0))
+        self.assertEqual("#. ", g.row(1))  # short lines are padded
+        self.assertEqual("###", g.column(0))
+        self.assertEqual(".", g.get(1, 0))
+        g.set(1, 0, "~")
+        self.assertEqual("~", g.get(1, 0))
+        self.assertEqual(5, g.count("#"))
+        self.assertEqual("#~.\n#. \n###", str(g))
+
+        g.resize(4, 3, ".")
+        self.assertEqual("#~..\n#. .\n###.", str(g))
+
+    @unittest.skipIf(optional.numpy is None, "numpy not installed")
+    def test_to_numpy(self):
+        g = grid.Grid.from_rows(self.rows)
+        array = g.to_numpy()
+        self.assertEqual((4, 3), array.shape)
+        self.assertEqual(6, array[1, 2])
+
+        # Shares memory with the grid
+        array[1, 2] = 60
+        self.assertEqual(60, g.get(2, 1))
+
+        g = grid.CharGrid.from_lines(["#."])
+        self.assertEqual([[ord("#"), ord(".")]], g.to_numpy().tolist())
+
+
+def busy(n):
+    return sum(len(str(i)) for i in range(n))
+
+
+class TestProfiling(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.output_dir = Path(self.tempdir.name)
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def test_enabled_profilers(self):
+        with mock.patch.dict(os.environ, {"AOC_PROFILE": ""}):
+            self.assertEqual([], profiling.get_enabled_profilers())
+        with mock.patch.dict(os.environ, {"AOC_PROFILE": "cprofile, sample"}):
+            self.assertEqual(["cprofile", "sample"],
+                             profiling.get_enabled_profilers())
+        with mock.patch.dict(os.environ, {"AOC_PROFILE": "all"}):
+            self.assertEqual(list(profiling.PROFILERS),
+                             profiling.get_enabled_profilers())
+        with mock.patch.dict(os.environ, {"AOC_PROFILE": "perf"}):
+            with self.assertRaises(ValueError):
+                profiling.get_enabled_profilers()
+
+    def test_disabled(self):
+        with mock.patch.dict(os.environ, {"AOC_PROFILE": ""}):
+            self.assertEqual(busy(10), profiling.profile_call(
+                "busy", busy, 10, output_dir=self.output_dir
+            ))
+        self.assertEqual([], list(self.output_dir.iterdir()))
+
+    def test_profile_call(self):
+        result = profiling.profile_call(
+            "busy", busy, 200000,
+            profilers=profiling.PROFILERS, output_dir=self.output_dir,
+        )
+        self.assertEqual(busy(200000), result)
+        self.assertEqual(
+            ["busy.collapsed", "busy.pstats", "busy.tracemalloc.txt"],
+            sorted(path.name for path in self.output_dir.iterdir()),
+        )
+
+        with open(self.output_dir.joinpath("busy.collapsed")) as infile:
+            for line in infile:
+                stack, count = line.rsplit(" ", 1)
+                self.assertTrue(stack.startswith("tests.py:busy:"))
+                self.assertGreater(int(count), 0)
+
+    def test_sampling_profiler(self):
+        sampler = profiling.SamplingProfiler(interval=0.001)
+        sampler.start()
+        try:
+            busy(300000)
+        finally:
+            sampler.stop()
+
+        self.assertGreater(sum(sampler.stacks.values()), 0)
+        self.assertTrue(any("tests.py:busy:" in stack
+                            for stack in sampler.stacks))
+
+    def test_samples_at_root_ignored(self):
+        root = sys._getframe()
+        sampler = profiling.SamplingProfiler(root=root)
+        sampler._sample(signal.SIGPROF, root)
+        self.assertEqual({}, dict(sampler.stacks))
+
+    def test_module_name(self):
+        # Relative imports mean it has to run as part of its package
+        day_path = Path(__file__).parent.parent.joinpath("day01",
+                                                         "solution1.py")
+        module_name, import_dir = profiling.get_module_name(day_path)
+        self.assertEqual("day01.solution1", module_name)
+        self.assertEqual(day_path.parent.parent, import_dir)
+        self.assertEqual("day01.solution1",
+                         profiling.get_profile_name(day_path))
+
+        script = self.output_dir.joinpath("script.py")
+        script.write_text("import os\n")
+        self.assertEqual((None, None), profiling.get_module_name(script))
+        self.assertEqual("{}.script".format(self.output_dir.name),
+                         profiling.get_profile_name(script))
+        self.assertEqual("day01.solution1",
+                         profiling.get_profile_name("day01.solution1"))
+
+    def test_run_script(self):
+        script = self.output_dir.joinpath("script.py")
+        script.write_text(
+            "import os, sys\n"
+            "with open('ran.txt', 'w') as outfile:\n"
+            "    outfile.write(sys.argv[1])\n"
+        )
+        profiling.run_script(script, ["hello"])
+        # From its own directory, with its arguments
+        self.assertEqual("hello",
+                         self.output_dir.joinpath("ran.txt").read_text())
+
+
+class TestSearch(unittest.TestCase):
+    # 4x3 grid with walls (#); moving onto a number costs that much
+    rows = [
+        "1#11",
+        "1191",
+        "1121",
+    ]
+
+    def setUp(self):
+        self.grid = grid.CharGrid.from_lines(self.rows)
+
+    def open_neighbours(self, index):
+        cells = self.grid.cells
+        return [i for i in self.grid.neighbour_indices(index)
+                if cells[i] != ord("#")]
+
+    def weighted_neighbours(self, index):
+        return [(i, self.grid.cells[i] - ord("0"))
+                for i in self.open_neighbours(index)]
+
+    def test_bfs(self):
+        distances = search.bfs([0], self.open_neighbours)
+        self.assertEqual(11, len(distances))
+        self.assertEqual(5, distances[self.grid.index(3, 0)])
+        self.assertEqual(4, distances[self.grid.index(2, 2)])
+
+    def test_bfs_multiple_sources(self):
+        sources = [self.grid.index(0, 0), self.grid.index(3, 0)]
+        distances = search.bfs(sources, self.open_neighbours)
+        self.assertEqual(0, distances[self.grid.index(3, 0)])
+        self.assertEqual(2, distances[self.grid.index(2, 1)])
+        self.assertEqual(3, distances[self.grid.index(2, 2)])
+
+    def test_bfs_until(self):
+        goal = self.grid.index(2, 1)
+        distances = search.bfs([0], self.open_neighbours,
+                               until=lambda i: i == goal)
+        self.assertEqual(3, distances[goal])
+        self.assertEqual(3, max(distances.values()))
+
+    def test_weighted_searches_agree(self):
+        goal = self.grid.index(3, 0)
+        expected = 8  # around the 9, along the bottom row
+
+        def estimate(index):
+            x, y = self.grid.position(index)
+            return abs(x - 3) + y
+
+        for distances in [
+            search.bucket_search([0], self.weighted_neighbours, goal),
+            search.dijkstra([0], self.weighted_neighbours, goal),
+            search.astar([0], self.weighted_neighbours, estimate, goal),
+        ]:
+            self.assertEqual(expected, distances[goal])
+
+        everything = search.dijkstra([0], self.weighted_neighbours)
+        self.assertEqual(
+            everything, search.bucket_search([0], self.weighted_neighbours)
+        )
+
+
+class TestElfCode(unittest.TestCase):
+    # The day 19 example, and a countdown with conditional jumps
+    example = [
+        "#ip 0",
+        "seti 5 0 1",
+        "seti 6 0 2",
+        "addi 0 1 0",
+        "addr 1 2 3",
+        "setr 1 0 0",
+        "seti 8 0 4",
+        "seti 9 0 5",
+    ]
+    countdown = [
+        "#ip 2",
+        "seti 10 0 0",
+        "addi 1 3 1",
+        "addi 0 -1 0",
+        "gtri 0 0 3",
+        "addr 3 2 2",
+        "seti 7 0 2",
+        "seti 0 0 2",
+    ]
+
+    def test_operations(self):
+        # The example from day 16
+        matching = []
+        for opcode in elfcode.OPCODES:
+            reg = [3, 2, 1, 1]
+            elfcode.OPERATIONS[opcode](reg, 2, 1, 2)
+            if reg == [3, 2, 2, 1]:
+                matching.append(opcode)
+
+        self.assertEqual(["addi", "mulr", "seti"], matching)
+
+    def test_parse(self):
+        ip, instructions = elfcode.parse(self.example)
+        self.assertEqual(0, ip)
+        self.assertEqual(("addi", 0, 1, 0), instructions[2])
+
+        with self.assertRaises(ValueError):
+            elfcode.parse(["#ip 0", "jump 1 2 3"])
+
+    def test_execute(self):
+        program = elfcode.Program(self.example)
+        program.execute()
+        self.assertEqual([6, 5, 6, 0, 0, 9], program.register)
+        self.assertFalse(program.can_execute())
+
+        program = elfcode.Program(self.countdown)
+        program.execute()
+        self.assertEqual([0, 30, 7, 0, 0, 0], program.register)
+
+    def test_execute_until(self):
+        program = elfcode.Program(self.countdown)
+        program.execute(until=5)
+        self.assertEqual([0, 30, 4, 0, 0, 0], program.register)
+        self.assertEqual(5, program.next_instruction)
+
+        program.execute()
+        self.assertEqual([0, 30, 7, 0, 0, 0], program.register)
+
+    def test_execute_matches_step(self):
+        for lines in [self.example, self.countdown]:
+            compiled = elfcode.Program(lines)
+            stepped = elfcode.Program(lines)
+
+            while stepped.can_execute():
+                compiled.execute(until=stepped.next_instruction)
+                self.assertEqual(stepped.register, compiled.register)
+                stepped.step()
+
+            compiled.execute()
+            self.assertEqual(stepped.register, compiled.register)
+
+    def test_idioms(self):
+        # Integer division by 256, the slow way
+        division = [
+            "#ip 5",
+            "seti 0 0 1",
+            "addi 1 1 2",
+            "muli 2 256 2",
+            "gtrr 2 0 2",
+            "addr 2 5 5",
+            "addi 5 1 5",
+            "seti 8 0 5",
+            "addi 1 1 1",
+            "seti 0 0 5",
+        ]
+        ip, instructions = elfcode.parse(division)
+        self.assertIsNotNone(elfcode.match_idiom(instructions, 0, ip))
+        self.assertIsNone(elfcode.match_idiom(instructions, 1, ip))
+
+        for x in [-5, 0, 255, 256, 1000]:
+            compiled = elfcode.Program(division, [x, 0, 0, 0, 0, 0])
+            stepped = elfcode.Program(division, [x, 0, 0, 0, 0, 0])
+
+            compiled.execute()
+            while stepped.can_execute():
+                stepped.step()
+
+            self.assertEqual(stepped.register, compiled.register)
+            self.assertEqual(max(x // 256, 0), compiled.register[1])
+
+        # The day 19 program, for a number small enough to step through
+        program = [
+            line.format(part1=28, extra=0)
+            for line in generators.DAY19_PROGRAM
+        ]
+        compiled = elfcode.Program(program)
+        stepped = elfcode.Program(program)
+
+        compiled.execute()
+        while stepped.can_execute():
+            stepped.step()
+
+        self.assertEqual(stepped.register, compiled.register)
+        self.assertEqual(56, compiled.register[0])
+
+    def test_divisor_sum(self):
+        self.assertEqual(0, elfcode.divisor_sum(0))
+        self.assertEqual(1, elfcode.divisor_sum(1))
+        self.assertEqual(28, elfcode.divisor_sum(12))
+        self.assertEqual(1 + 7 + 49, elfcode.divisor_sum(49))
+
+    def test_trace(self):
+        program = elfcode.Program(self.countdown)
+        tracer = elfcode.Tracer(breakpoints=[3], size=2)
+        program.execute(tracer=tracer)
+
+        self.assertEqual([0, 30, 7, 0, 0, 0], program.register)
+        self.assertEqual(1 + 10 * 4 + 9 + 1, tracer.steps)
+        self.assertEqual(10, tracer.counts[1])
+        self.assertEqual(9, tracer.jumps[(6, 1)])
+        self.assertEqual(
+            [(43, 3, (1, 27, 3, 1, 0, 0)), (48, 3, (0, 30, 3, 1, 0, 0))],
+            list(tracer.snapshots)
+        )
+
+        loop, = tracer.get_loops()
+        self.assertEqual((1, 6, 9, 1), (
+            loop["start"], loop["end"], loop["iterations"], loop["entries"]
+        ))
+
+        report = tracer.report(program)
+        self.assertIn("addi 1 3 1", report)
+        self.assertIn("1-6: 9 iterations, entered 1 times", report)
+
+    def test_trace_loops(self):
+        # Two loops back to 1, and a jump back to 8 that's its only way in
+        tracer = elfcode.Tracer()
+        tracer.counts.update({1: 10, 4: 7, 6: 4, 8: 1, 9: 1})
+        tracer.jumps.update({(4, 1): 6, (6, 1): 3, (9, 8): 1})
+
+        self.assertEqual([(1, 6, 3, 1), (1, 4, 6, 1)], [
+            (loop["start"], loop["end"], loop["iterations"], loop["entries"])
+            for loop in tracer.get_loops()
+        ])
+
+    def test_trace_limit(self):
+        program = elfcode.Program(self.countdown)
+        program.execute(tracer=elfcode.Tracer(limit=11))
+        self.assertEqual(1, program.next_instruction)
+        self.assertEqual([8, 6, 0, 1, 0, 0], program.register)
+
+        program.execute()
+        self.assertEqual([0, 30, 7, 0, 0, 0], program.register)
+
+    def test_without_ip(self):
+        program = elfcode.Program.from_instructions(
+            [("seti", 3, 0, 0), ("muli", 0, 7, 1)], register=[0, 0, 0, 0]
+        )
+        program.execute()
+        self.assertEqual([3, 21, 0, 0], program.register)
+
+
+class TestCycles(unittest.TestCase):
+    @staticmethod
+    def step(n):
+        # 3, 10, 2, 5, 4, 6, 4, 6, ...
+        return (n * n + 1) % 11
+
+    def brute_force(self, state, step, generations):
+        for _ in range(generations):
+            state = step(state)
+        return state
+
+    def test_find_cycle(self):
+        cycle = cycles.find_cycle(3, self.step)
+        self.assertEqual((4, 2, 0, 4), cycle)
+
+        cycle = cycles.find_cycle(3, self.step, limit=3)
+        self.assertEqual((None, None, None, 5), cycle)
+
+    def test_fast_forward(self):
+        for generations in range(20):
+            self.assertEqual(
+                self.brute_force(3, self.step, generations),
+                cycles.fast_forward(3, self.step, generations)
+            )
+
+        self.assertEqual(4, cycles.fast_forward(3, self.step, 10 ** 12))
+
+    def test_verify(self):
+        # Every state has the same key, so without checking they'd all look
+        # like repeats
+        cycle = cycles.find_cycle(3, self.step, key=lambda n: 0)
+        self.assertEqual((0, 1), cycle[:2])
+
+        cycle = cycles.find_cycle(3, self.step, key=lambda n: 0, verify=True)
+        self.assertEqual((4, 2), cycle[:2])
+
+    def test_translation(self):
+        # A pattern of three cells stepping right by one every other
+        # generation, as (pattern, position)
+        def step(state):
+            pattern, position = state
+            if pattern == "#.#":
+                return ("##.", position + 1)
+            return ("#.#", position)
+
+        def translate(state, distance):
+            return (state[0], state[1] + distance)
+
+        for generations in [0, 1, 2, 3, 10, 11, 1001]:
+            self.assertEqual(
+                self.brute_force(("##.", 0), step, generations),
+                cycles.fast_forward(
+                    ("##.", 0), step, generations,
+                    key=itemgetter(0), offset=itemgetter(1),
+                    translate=translate
+                )
+            )
+
+
+class TestCheckpoint(unittest.TestCase):
+    def setUp(self):
+        self.tempdir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tempdir.name).joinpath("sim.checkpoint")
+
+    def tearDown(self):
+        self.tempdir.cleanup()
+
+    def test_save_and_load(self):
+        self.assertIsNone(checkpoint.load_state(self.path, "key"))
+
+        arrays = {"small": array("B", [1, 2, 3]), "big": array("q", [-2**40])}
+        checkpoint.save_state(self.path, "key", {"step": 3}, arrays)
+        self.assertEqual(
+            ({"step": 3}, arrays), checkpoint.load_state(self.path, "key")
+        )
+        self.assertIsNone(checkpoint.load_state(self.path, "other key"))
+
+    def test_truncated(self):
+        checkpoint.save_state(self.path, "key", {}, {"a": array("q", [1])})
+        with open(self.path, "r+b") as outfile:
+            outfile.truncate(self.path.stat().st_size - 1)
+        self.assertIsNone(checkpoint.load_state(self.path, "key"))
+
+    def test_update(self):
+        progress = []
+        saved = checkpoint.Checkpoint(
+            self.path, ("key", 1), 0,
+            lambda done, total: progress.append((done, total))
+        )
+        saved.update(5, 10, lambda: ({"done": 5}, {}))
+        self.assertEqual([(5, 10)], progress)
+        self.assertEqual(({"done": 5}, {}), saved.resume())
+
+        saved.clear()
+        self.assertIsNone(saved.resume())
+
+        # Not saved until the interval's up
+        unsaved = checkpoint.Checkpoint(self.path, "key", 60)
+        unsaved.update(5, 10, lambda: ({"done": 5}, {}))
+        self.assertFalse(self.path.exists())
+
+        # Nowhere to save to
+        checkpoint.Checkpoint(None, "key", 0).update(5, None, None)
+
+    def test_get_checkpoint(self):
+        with mock.patch.dict(os.environ, {}, clear=True):
+            self.assertIsNone(checkpoint.get_checkpoint("sim", 1).path)
+
+        environ = {
+            "AOC_CHECKPOINT_DIR": self.tempdir.name,
+            "AOC_CHECKPOINT_INTERVAL": "5",
+            "AOC_PROGRESS": "1",
+        }
+        with mock.patch.dict(os.environ, environ, clear=True):
+            saved = checkpoint.get_checkpoint("sim", 1)
+        self.assertEqual(self.path, saved.path)
+        self.assertEqual(5, saved.interval)
+        self.assertIsNotNone(saved.progress)
+
+
+@unittest.skipIf(automata.numpy is None, "numpy not installed")
+class TestAutomata(unittest.TestCase):
+    def test_count_moore_neighbours(self):
+        cells = automata.numpy.array([
+            [1, 0, 1],
+            [0, 1, 0],
+            [1, 1, 0],
+        ])
+        self.assertEqual(
+            [[1, 3, 1], [4, 4, 3], [2, 2, 2]],
+            automata.count_moore_neighbours(cells, 1).tolist()
+        )
+
+    def test_moore_step(self):
+        # Conway's life, where a blinker flips between a row and a column
+        def life(state, alive):
+            return int(alive == 3 or (state and alive == 2))
+
+        table = automata.make_moore_table([0, 1], [1], life)
+        row = automata.numpy.zeros((5, 5), dtype=automata.numpy.uint8)
+        row[2, 1:4] = 1
+
+        column = automata.moore_step(row, table, [1])
+        self.assertEqual(row.T.tolist(), column.tolist())
+        self.assertEqual(row.tolist(),
+                         automata.moore_step(column, table, [1]).tolist())
+
+    def test_line_step(self):
+        # Every live cell moves one place right
+        table = automata.make_line_table(lambda window: window[1])
+        cells = automata.numpy.array([1, 0, 1], dtype=automata.numpy.uint8)
+
+        cells, offset = automata.line_step(cells, -1, table)
+        self.assertEqual(([1, 0, 1], 0), (cells.tolist(), offset))
+
+        # Cells with a live neighbour two to the left
+        table = automata.make_line_table(lambda window: window[0])
+        cells, offset = automata.line_step(cells, offset, table)
+        self.assertEqual(([1, 0, 1], 2), (cells.tolist(), offset))
+
+        # Nothing survives
+        table = automata.make_line_table(lambda window: 0)
+        cells, offset = automata.line_step(cells, offset, table)
+        self.assertEqual(0, len(cells))
+
+    def test_line_must_stay_finite(self):
+        with self.assertRaises(ValueError):
+            automata.make_line_table(lambda window: 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
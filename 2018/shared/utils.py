@@ -1,7 +1,99 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
+from array import array
+import mmap
+import re
+
+
+integer_regex = re.compile(rb"[-+]?\d+")
+
 
 def get_input(path):
     with open(path) as infile:
         return [line.rstrip('\n') for line in infile]
+
+
+class MappedInput:
+    # Read-only memory map of an input file, for inputs too big to hold as a
+    # list of strings. Use as a context manager; lines are read lazily.
+
+    def __init__(self, path):
+        self._file = open(path, "rb")
+
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0,
+                                  access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files can't be mapped
+            self._map = None
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return 0 if self._map is None else len(self._map)
+
+    def lines(self, chunk_size=1 << 20):
+        # Yields each line as bytes, without its line ending. Lines are split
+        # out of one chunk (ending at a line break) at a time.
+        for chunk in self.chunks(chunk_size):
+            for line in chunk.splitlines():
+                yield line
+
+    def chunks(self, chunk_size=1 << 20):
+        # Yields the file as bytes, about chunk_size at a time, each chunk
+        # being whole lines
+        for start, end in self._chunks(chunk_size):
+            yield self._map[start:end]
+
+    def text_lines(self, encoding="utf-8"):
+        # As lines(), but decoded for the str-based parsers
+        for line in self.lines():
+            yield line.decode(encoding)
+
+    def integers(self, chunk_size=1 << 20):
+        # Every integer in the file, in order, extracted a chunk at a time
+        result = array("q")
+
+        for start, end in self._chunks(chunk_size):
+            result.extend(
+                map(int, integer_regex.findall(self._map, start, end))
+            )
+
+        return result
+
+    def _chunks(self, chunk_size):
+        # Only break at line endings so no line or number is split in two
+        if self._map is None:
+            return
+
+        pos = 0
+        size = len(self._map)
+
+        while pos < size:
+            end = self._map.find(b"\n", min(pos + chunk_size, size) - 1)
+            end = size if end == -1 else end + 1
+            yield pos, end
+            pos = end
+
+
+def iter_lines(path):
+    # Drop-in replacement for get_input that streams lines from a memory map
+    # rather than reading the whole file into a list
+    with MappedInput(path) as mapped:
+        for line in mapped.text_lines():
+            yield line
+
+
+def get_integers(path):
+    with MappedInput(path) as mapped:
+        return mapped.integers()